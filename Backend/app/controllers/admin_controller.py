@@ -0,0 +1,35 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from typing import Optional
+
+try:
+    from ..core.security import require_admin
+    from ..core import profiling
+except ImportError:
+    from core.security import require_admin
+    from core import profiling
+
+router = APIRouter(prefix="/admin", tags=["Admin"], dependencies=[Depends(require_admin)])
+
+@router.post("/profile")
+def start_profile(requests: int = Query(10, ge=1, le=1000), route: Optional[str] = None):
+    """Profile the next ``requests`` requests, optionally only those matching ``route``."""
+    return profiling.start_session(requests, route).status()
+
+@router.get("/profile")
+def get_profile(format: str = Query("collapsed", pattern="^(collapsed|summary|status)$")):
+    session = profiling.get_session()
+    if session is None:
+        raise HTTPException(status_code=404, detail="No profiling session")
+    if format == "status":
+        return session.status()
+    if format == "summary":
+        return PlainTextResponse(profiling.format_summary(session.samples))
+    return PlainTextResponse(profiling.format_collapsed(session.samples))
+
+@router.delete("/profile")
+def stop_profile():
+    session = profiling.clear_session()
+    if session is None:
+        raise HTTPException(status_code=404, detail="No profiling session")
+    return session.status()
@@ -1,26 +1,45 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from typing import List
 
 try:
     from ..core.security import get_current_user
     from ..repository import get_db
-    from ..services.category_service import list_categories, get_category_by_id
+    from ..core.responses import json_response, cached_json_response
+    from ..services.category_service import list_categories, get_category_by_id, get_category_products_page
     from ..schemas.category import CategorySchema
+    from ..schemas.category_products import CategoryProductsPage
 except ImportError:
     from core.security import get_current_user
     from repository import get_db
-    from services.category_service import list_categories, get_category_by_id
+    from core.responses import json_response, cached_json_response
+    from services.category_service import list_categories, get_category_by_id, get_category_products_page
     from schemas.category import CategorySchema
+    from schemas.category_products import CategoryProductsPage
 
 router = APIRouter(prefix="/categories", tags=["Categories"])
 
 @router.get("/", response_model=List[CategorySchema])
-def get_all_categories(db=Depends(get_db)):
-    return list_categories(db)
+def get_all_categories(request: Request, db=Depends(get_db)):
+    return cached_json_response("categories", db, lambda: list_categories(db),
+                                request.headers.get("accept-encoding"))
 
 @router.get("/{category_id}", response_model=CategorySchema)
 def get_category(category_id: int, db=Depends(get_db)):
     try:
-        return get_category_by_id(db, category_id)
+        category = get_category_by_id(db, category_id)
     except Exception as e:
-        raise HTTPException(status_code=404, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=404, detail=str(e))
+    return json_response(category)
+
+@router.get("/{category_id}/products", response_model=CategoryProductsPage)
+def get_category_products(
+    category_id: int,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
+    db=Depends(get_db),
+):
+    try:
+        products_page = get_category_products_page(db, category_id, page, page_size)
+    except Exception as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return json_response(products_page)
@@ -1,26 +1,30 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from typing import List
 
 try:
     from ..core.security import get_current_user
     from ..repository import get_db
+    from ..core.responses import json_response, cached_json_response
     from ..services.payment_method_service import list_payment_methods, get_payment_method_by_id
     from ..schemas.payment_method import PaymentMethodSchema
 except ImportError:
     from core.security import get_current_user
     from repository import get_db
+    from core.responses import json_response, cached_json_response
     from services.payment_method_service import list_payment_methods, get_payment_method_by_id
     from schemas.payment_method import PaymentMethodSchema
 
 router = APIRouter(prefix="/payment-methods", tags=["Payment Methods"])
 
 @router.get("/", response_model=List[PaymentMethodSchema])
-def get_all_payment_methods(db=Depends(get_db)):
-    return list_payment_methods(db)
+def get_all_payment_methods(request: Request, db=Depends(get_db)):
+    return cached_json_response("payment_methods", db, lambda: list_payment_methods(db),
+                                request.headers.get("accept-encoding"))
 
 @router.get("/{payment_method_id}", response_model=PaymentMethodSchema)
 def get_payment_method(payment_method_id: int, db=Depends(get_db)):
     try:
-        return get_payment_method_by_id(db, payment_method_id)
+        payment_method = get_payment_method_by_id(db, payment_method_id)
     except Exception as e:
-        raise HTTPException(status_code=404, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=404, detail=str(e))
+    return json_response(payment_method)
\ No newline at end of file
@@ -1,33 +1,113 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import FileResponse
+from typing import List, Literal, Optional, Union
+import requests
 
 try:
     from ..core.security import get_current_user
     from ..repository import get_db
-    from ..services.product_service import list_products, get_product_by_id, get_similar_products
+    from ..core.responses import json_response, cached_json_response
+    from ..services.product_service import list_products, list_products_page, get_product_by_id, get_similar_products, search_products
+    from ..services.image_service import get_product_image_variant, IMAGE_VARIANT_MAX_AGE
+    from ..services.product_detail_service import get_product_detail, PRODUCT_INCLUDES
+    from ..schemas.product_detail import ProductDetailSchema
     from ..schemas.product import ProductSchema
+    from ..schemas.page import Page
 except ImportError:
     from core.security import get_current_user
     from repository import get_db
-    from services.product_service import list_products, get_product_by_id, get_similar_products
+    from core.responses import json_response, cached_json_response
+    from services.product_service import list_products, list_products_page, get_product_by_id, get_similar_products, search_products
+    from services.image_service import get_product_image_variant, IMAGE_VARIANT_MAX_AGE
+    from services.product_detail_service import get_product_detail, PRODUCT_INCLUDES
+    from schemas.product_detail import ProductDetailSchema
     from schemas.product import ProductSchema
+    from schemas.page import Page
 
 router = APIRouter(prefix="/products", tags=["Products"])
 
-@router.get("/", response_model=List[ProductSchema])
-def get_all_products(db=Depends(get_db)):
-    return list_products(db)
+@router.get("/", response_model=Union[List[ProductSchema], Page[ProductSchema]])
+def get_all_products(
+    request: Request,
+    min_price: Optional[float] = Query(None, ge=0),
+    max_price: Optional[float] = Query(None, ge=0),
+    in_stock: Optional[bool] = None,
+    sort: Optional[Literal["price_asc", "price_desc"]] = None,
+    page: Optional[int] = Query(None, ge=1),
+    page_size: Optional[int] = Query(None, ge=1, le=100),
+    db=Depends(get_db),
+):
+    """
+    Without query parameters, the full catalog as a list (served pre-serialized).
+    With any filter, sort or pagination parameter, a page of the matching products.
+    """
+    if all(param is None for param in (min_price, max_price, in_stock, sort, page, page_size)):
+        return cached_json_response("products", db, lambda: list_products(db),
+                                    request.headers.get("accept-encoding"))
+    if min_price is not None and max_price is not None and min_price > max_price:
+        raise HTTPException(status_code=422, detail="min_price must not be greater than max_price")
+    try:
+        products_page = list_products_page(db, page or 1, page_size or 20, min_price, max_price,
+                                           bool(in_stock), sort)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    return json_response(products_page)
+
+# Declarada antes de /{product_id} para que "search" no se interprete como un id
+@router.get("/search", response_model=List[ProductSchema])
+def search(q: str = Query(..., min_length=1, max_length=200), limit: int = Query(20, ge=1, le=100), db=Depends(get_db)):
+    try:
+        products = search_products(db, q, limit)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    return json_response(products)
 
-@router.get("/{product_id}", response_model=ProductSchema)
-def get_product(product_id: int, db=Depends(get_db)):
+@router.get("/{product_id}", response_model=ProductDetailSchema)
+def get_product(
+    product_id: int,
+    include: Optional[str] = Query(None, description="Comma-separated related resources to embed: seller, reviews, similar"),
+    reviews_page_size: int = Query(5, ge=1, le=100),
+    db=Depends(get_db),
+):
+    """
+    A product. With ``include``, the seller, the first page of reviews and/or
+    the similar products are embedded, so a product page needs one request.
+    """
+    includes = tuple(part.strip() for part in (include or "").split(",") if part.strip())
+    unknown = [part for part in includes if part not in PRODUCT_INCLUDES]
+    if unknown:
+        raise HTTPException(status_code=422, detail=f"Unknown include: {', '.join(unknown)}")
     try:
-        return get_product_by_id(db, product_id)
+        if includes:
+            product = get_product_detail(db, product_id, includes, reviews_page_size)
+        else:
+            product = get_product_by_id(db, product_id)
     except Exception as e:
         raise HTTPException(status_code=404, detail=str(e))
-    
+    return json_response(product)
+
 @router.get("/{product_id}/similar/", response_model=List[ProductSchema], tags=["Products"])
 async def get_similar_products_endpoint(product_id: int, db=Depends(get_db), limit: int = 4):
     try:
-        return get_similar_products(db, product_id, limit)
+        similar = get_similar_products(db, product_id, limit)
     except Exception as e:
-        raise HTTPException(status_code=404, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=404, detail=str(e))
+    return json_response(similar)
+
+@router.get("/{product_id}/images/{index}/{variant}", response_class=FileResponse)
+def get_product_image(product_id: int, index: int, variant: Literal["carousel", "thumb"], db=Depends(get_db)):
+    """
+    A resized JPEG of the product's ``index``-th image: ``carousel`` (250x400,
+    center-cropped) or ``thumb`` (fits in 70x70). Generated once per source
+    image and served from the backend's disk cache.
+    """
+    try:
+        path = get_product_image_variant(db, product_id, index, variant)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except (requests.RequestException, OSError) as e:
+        raise HTTPException(status_code=502, detail=f"Could not fetch source image: {e}")
+    return FileResponse(path, media_type="image/jpeg",
+                        headers={"Cache-Control": f"public, max-age={IMAGE_VARIANT_MAX_AGE}"})
@@ -1,33 +1,48 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from typing import List, Literal, Optional
 
 try:
     from ..core.security import get_current_user
     from ..repository import get_db
-    from ..services.review_service import list_reviews, get_review_by_id, get_reviews_by_key
+    from ..core.responses import json_response, cached_json_response
+    from ..services.review_service import list_reviews, get_review_by_id, get_product_reviews_page
     from ..schemas.review import ReviewSchema
+    from ..schemas.page import Page
 except ImportError:
     from core.security import get_current_user
     from repository import get_db
-    from services.review_service import list_reviews, get_review_by_id, get_reviews_by_key
+    from core.responses import json_response, cached_json_response
+    from services.review_service import list_reviews, get_review_by_id, get_product_reviews_page
     from schemas.review import ReviewSchema
+    from schemas.page import Page
 
 router = APIRouter(prefix="/reviews", tags=["Reviews"])
 
 @router.get("/", response_model=List[ReviewSchema])
-def get_all_reviews(db=Depends(get_db)):
-    return list_reviews(db)
+def get_all_reviews(request: Request, db=Depends(get_db)):
+    return cached_json_response("reviews", db, lambda: list_reviews(db),
+                                request.headers.get("accept-encoding"))
 
 @router.get("/{review_id}", response_model=ReviewSchema)
 def get_review(review_id: int, db=Depends(get_db)):
     try:
-        return get_review_by_id(db, review_id)
+        review = get_review_by_id(db, review_id)
     except Exception as e:
         raise HTTPException(status_code=404, detail=str(e))
+    return json_response(review)
 
-@router.get("/product/{product_id}", response_model=List[ReviewSchema])
-def get_reviews_by_product(product_id: int, db=Depends(get_db)):
-    reviews = get_reviews_by_key(db, "product_id", product_id)
-    if not reviews:
-        raise HTTPException(status_code=404, detail="No reviews found for this product")
-    return reviews
\ No newline at end of file
+@router.get("/product/{product_id}", response_model=Page[ReviewSchema])
+def get_reviews_by_product(
+    product_id: int,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
+    sort: Literal["date", "rating"] = "date",
+    order: Literal["asc", "desc"] = "desc",
+    rating: Optional[int] = Query(None, ge=1, le=5),
+    db=Depends(get_db),
+):
+    try:
+        review_page = get_product_reviews_page(db, product_id, page, page_size, sort, order, rating)
+    except Exception as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return json_response(review_page)
\ No newline at end of file
@@ -1,23 +1,26 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from typing import List
 
 try:
     from ..core.security import get_current_user
     from ..repository import get_db
-    from ..services.seller_service import list_sellers, get_seller_by_id
-    from ..schemas.seller import SellerSchema
+    from ..core.responses import json_response, cached_json_response
+    from ..services.seller_service import list_sellers, get_seller_by_id, get_seller_products_page
+    from ..schemas.seller import SellerSchema, SellerProductsPage
 except ImportError:
     from core.security import get_current_user
     from repository import get_db
-    from services.seller_service import list_sellers, get_seller_by_id
-    from schemas.seller import SellerSchema
+    from core.responses import json_response, cached_json_response
+    from services.seller_service import list_sellers, get_seller_by_id, get_seller_products_page
+    from schemas.seller import SellerSchema, SellerProductsPage
 
 router = APIRouter(prefix="/sellers", tags=["Sellers"])
 
 @router.get("/", response_model=List[SellerSchema])
-def get_all_sellers(db=Depends(get_db)):
+def get_all_sellers(request: Request, db=Depends(get_db)):
     try:
-        return list_sellers(db)
+        return cached_json_response("sellers", db, lambda: list_sellers(db),
+                                    request.headers.get("accept-encoding"))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -30,11 +33,29 @@ def get_seller(seller_id: int, db=Depends(get_db)):
         seller = get_seller_by_id(db, seller_id)
         if not seller:
             raise HTTPException(status_code=404, detail="Seller not found")
-        return seller
+        return json_response(seller)
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error retrieving seller: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+@router.get("/{seller_id}/products", response_model=SellerProductsPage)
+def get_seller_products(
+    seller_id: int,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
+    db=Depends(get_db),
+):
+    try:
+        products_page = get_seller_products_page(db, seller_id, page, page_size)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error retrieving seller products: {str(e)}"
+        )
+    return json_response(products_page)
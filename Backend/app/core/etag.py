@@ -0,0 +1,38 @@
+import hashlib
+from typing import Optional
+
+# Cabeceras que una respuesta 304 conserva de la 200 que reemplaza (RFC 9110 §15.4.5)
+NOT_MODIFIED_HEADERS = (b"etag", b"vary", b"cache-control", b"content-location", b"date", b"expires")
+
+
+def compute_etag(body: bytes) -> str:
+    """
+    Return a weak ETag for ``body``.
+
+    Weak, because the compression middleware may re-encode the same
+    representation after the tag is computed; the validator identifies the
+    content, not the exact bytes on the wire.
+    """
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def _opaque(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith(("W/", "w/")) else tag
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of ``etag`` against an ``If-None-Match`` header value (``*`` matches any)."""
+    if not if_none_match:
+        return False
+    opaque = _opaque(etag)
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or _opaque(candidate) == opaque:
+            return True
+    return False
+
+
+def not_modified_headers(headers: list) -> list:
+    """Keep only the headers a 304 response must repeat."""
+    return [(name, value) for name, value in headers if name.lower() in NOT_MODIFIED_HEADERS]
@@ -1,15 +1,205 @@
+import atexit
+import copy
+import json
 import logging
+import logging.handlers
+import os
+import queue
 import sys
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+
+# Configuración por variables de entorno
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FILE = os.getenv("LOG_FILE", "backend.log")
+LOG_MAX_BYTES = int(os.getenv("LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+LOG_ROTATE_INTERVAL_SECONDS = int(os.getenv("LOG_ROTATE_INTERVAL_SECONDS", str(24 * 60 * 60)))
+LOG_BACKUP_COUNT = int(os.getenv("LOG_BACKUP_COUNT", "5"))
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+# Tiempo máximo que un WARNING/ERROR espera por espacio en la cola antes de descartarse
+LOG_QUEUE_BLOCK_SECONDS = float(os.getenv("LOG_QUEUE_BLOCK_SECONDS", "0.01"))
+# "text" (por defecto) o "json" para una línea JSON por registro
+LOG_STYLE = os.getenv("LOG_STYLE", "text").lower()
+
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+
+# Contexto de la petición en curso, fijado por RequestContextMiddleware
+request_id_var: ContextVar = ContextVar("request_id", default=None)
+request_started_var: ContextVar = ContextVar("request_started", default=None)
+
+
+class RequestContextFilter(logging.Filter):
+    """
+    Stamp records with the current request id and the milliseconds elapsed
+    since the request started. Runs on the request thread, so it only reads
+    two context variables; all formatting happens in the listener thread.
+    """
+
+    def filter(self, record):
+        record.request_id = request_id_var.get()
+        started = request_started_var.get()
+        record.elapsed_ms = round((time.perf_counter() - started) * 1000, 3) if started is not None else None
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as single-line JSON objects."""
+
+    def format(self, record):
+        entry = {
+            "ts": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", None),
+            "elapsed_ms": getattr(record, "elapsed_ms", None),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class SizeAndTimeRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    File handler that rotates when the file reaches ``maxBytes`` or when
+    ``interval_seconds`` have elapsed since the last rotation, whichever comes first.
+    Backups use the numbered ``.1``, ``.2``... scheme of RotatingFileHandler.
+    """
+
+    def __init__(self, filename, maxBytes=0, interval_seconds=0, backupCount=0, encoding=None):
+        super().__init__(filename, mode="a", maxBytes=maxBytes, backupCount=backupCount,
+                         encoding=encoding, delay=True)
+        self.interval_seconds = interval_seconds
+        self.rollover_at = time.time() + interval_seconds if interval_seconds > 0 else None
+
+    def shouldRollover(self, record):
+        if self.rollover_at is not None and time.time() >= self.rollover_at:
+            return True
+        return super().shouldRollover(record)
+
+    def doRollover(self):
+        super().doRollover()
+        if self.rollover_at is not None:
+            self.rollover_at = time.time() + self.interval_seconds
+
+
+_exception_formatter = logging.Formatter()
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that never blocks the request thread on a full queue.
+
+    Records below WARNING are dropped immediately when the queue is full;
+    WARNING and above wait up to ``block_seconds`` for space first. Dropped
+    records are counted per level.
+
+    Unlike the stock ``prepare``, which folds the traceback into ``msg``,
+    the traceback is kept separately in ``exc_text`` so that the listener's
+    formatter decides how to render it (the JSON formatter's ``exc`` field).
+    """
+
+    def __init__(self, log_queue, block_seconds=LOG_QUEUE_BLOCK_SECONDS):
+        super().__init__(log_queue)
+        self.block_seconds = block_seconds
+        self.dropped = Counter()
+        self._dropped_lock = threading.Lock()
+
+    def prepare(self, record):
+        # Sólo se formatea el mensaje y la traza; el formato final lo aplica el listener
+        message = record.getMessage()
+        record = copy.copy(record)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = _exception_formatter.formatException(record.exc_info)
+        record.message = message
+        record.msg = message
+        record.args = None
+        record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+        if record.levelno >= logging.WARNING and self.block_seconds > 0:
+            try:
+                self.queue.put(record, timeout=self.block_seconds)
+                return
+            except queue.Full:
+                pass
+        with self._dropped_lock:
+            self.dropped[record.levelname] += 1
+
+
+def _build_formatter() -> logging.Formatter:
+    if LOG_STYLE == "json":
+        return JsonFormatter()
+    return logging.Formatter(LOG_FORMAT)
+
+
+def _build_file_handler():
+    handler = SizeAndTimeRotatingFileHandler(
+        LOG_FILE,
+        maxBytes=LOG_MAX_BYTES,
+        interval_seconds=LOG_ROTATE_INTERVAL_SECONDS,
+        backupCount=LOG_BACKUP_COUNT,
+        encoding="utf-8",
+    )
+    handler.setFormatter(_build_formatter())
+    return handler
+
+
+def _build_stream_handler():
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(_build_formatter())
+    return handler
+
+
+def configure_logging() -> DroppingQueueHandler:
+    """
+    Install the queue handler on the root logger and start the background writer.
+
+    Idempotent: if the module is imported again under another name (relative
+    vs absolute imports), the already installed handler is reused.
+    """
+    root = logging.getLogger()
+    for handler in root.handlers:
+        if getattr(handler, "is_meli_queue_handler", False):
+            return handler
+    handler = DroppingQueueHandler(queue.Queue(maxsize=LOG_QUEUE_SIZE))
+    handler.is_meli_queue_handler = True
+    handler.addFilter(RequestContextFilter())
+    # El listener escribe en stdout y en archivo desde un hilo en segundo plano
+    handler.listener = logging.handlers.QueueListener(
+        handler.queue, _build_stream_handler(), _build_file_handler(), respect_handler_level=True
+    )
+    root.setLevel(LOG_LEVEL)
+    root.addHandler(handler)
+    handler.listener.start()
+    atexit.register(handler.listener.stop)
+    return handler
+
+
+queue_handler = configure_logging()
+
+
+def get_logging_stats() -> dict:
+    """Return queue depth and dropped-record counters for the logging pipeline."""
+    with queue_handler._dropped_lock:
+        dropped = dict(queue_handler.dropped)
+    return {
+        "queue_size": queue_handler.queue.qsize(),
+        "queue_capacity": LOG_QUEUE_SIZE,
+        "dropped": dropped,
+        "dropped_total": sum(dropped.values()),
+    }
 
-# Configuración más robusta del logger
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler("backend.log", mode="a", encoding="utf-8")
-    ]
-)
 
 logger = logging.getLogger("meli_api")
 
@@ -0,0 +1,183 @@
+import os
+import threading
+import time
+from bisect import bisect_left
+from functools import wraps
+
+try:
+    from .profiling import track_current_thread
+except ImportError:
+    from core.profiling import track_current_thread
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() not in ("0", "false", "no")
+
+# Buckets de latencia en segundos (de 0.1 ms a 10 s)
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+                   0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram in the Prometheus model."""
+
+    __slots__ = ("buckets", "counts", "total", "count")
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        # Una posición extra para el bucket +Inf
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names, values, extra=None) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class MetricsRegistry:
+    """
+    Thread-safe registry of labelled histograms and counters.
+
+    Recording takes one uncontended lock and a couple of list/dict updates, so
+    it is cheap enough to stay on for every request. Metric families are
+    declared up front and rendered in the Prometheus text format.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms: dict[str, tuple[str, tuple, dict]] = {}
+        self._counters: dict[str, tuple[str, tuple, dict]] = {}
+
+    def histogram(self, name: str, help_text: str, label_names: tuple) -> None:
+        self._histograms.setdefault(name, (help_text, label_names, {}))
+
+    def counter(self, name: str, help_text: str, label_names: tuple) -> None:
+        self._counters.setdefault(name, (help_text, label_names, {}))
+
+    def observe(self, name: str, labels: tuple, value: float) -> None:
+        series = self._histograms[name][2]
+        with self._lock:
+            histogram = series.get(labels)
+            if histogram is None:
+                histogram = series[labels] = Histogram()
+            histogram.observe(value)
+
+    def inc(self, name: str, labels: tuple, amount: float = 1) -> None:
+        series = self._counters[name][2]
+        with self._lock:
+            series[labels] = series.get(labels, 0) + amount
+
+    def get_counter(self, name: str, labels: tuple) -> float:
+        return self._counters[name][2].get(labels, 0)
+
+    def get_histogram(self, name: str, labels: tuple):
+        return self._histograms[name][2].get(labels)
+
+    def reset(self) -> None:
+        with self._lock:
+            for _, _, series in list(self._histograms.values()) + list(self._counters.values()):
+                series.clear()
+
+    def render(self) -> str:
+        """Render all metric families in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            for name, (help_text, label_names, series) in self._counters.items():
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} counter")
+                for labels, value in series.items():
+                    lines.append(f"{name}{_format_labels(label_names, labels)} {value}")
+            for name, (help_text, label_names, series) in self._histograms.items():
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} histogram")
+                for labels, histogram in series.items():
+                    cumulative = 0
+                    for bound, count in zip(histogram.buckets, histogram.counts):
+                        cumulative += count
+                        le = _format_labels(label_names, labels, f'le="{bound}"')
+                        lines.append(f"{name}_bucket{le} {cumulative}")
+                    cumulative += histogram.counts[-1]
+                    le = _format_labels(label_names, labels, 'le="+Inf"')
+                    lines.append(f"{name}_bucket{le} {cumulative}")
+                    label_str = _format_labels(label_names, labels)
+                    lines.append(f"{name}_sum{label_str} {histogram.total}")
+                    lines.append(f"{name}_count{label_str} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+registry.histogram("http_request_duration_seconds", "HTTP request latency by route.", ("method", "route", "status"))
+registry.histogram("service_call_duration_seconds", "Service function latency.", ("function",))
+registry.counter("cache_requests_total", "Cache lookups by cache and result (hit/miss).", ("cache", "result"))
+registry.counter("repository_lookups_total", "Repository lookups served by an index or by a table scan.", ("table", "kind"))
+
+
+def observe_request(method: str, route: str, status: int, seconds: float) -> None:
+    if METRICS_ENABLED:
+        registry.observe("http_request_duration_seconds", (method, route, status), seconds)
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    if METRICS_ENABLED:
+        registry.inc("cache_requests_total", (cache, "hit" if hit else "miss"))
+
+
+def record_lookup(table: str, kind: str) -> None:
+    """Count a repository lookup; ``kind`` is ``"index"`` or ``"scan"``."""
+    if METRICS_ENABLED:
+        registry.inc("repository_lookups_total", (table, kind))
+
+
+def timed(name: str):
+    """
+    Decorator recording the wall-clock latency of a service function. It
+    also joins the calling thread to the request's profile, if one is being
+    sampled.
+    """
+    def decorator(func):
+        if not METRICS_ENABLED:
+            @wraps(func)
+            def untimed(*args, **kwargs):
+                track_current_thread()
+                return func(*args, **kwargs)
+            return untimed
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            track_current_thread()
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                registry.observe("service_call_duration_seconds", (name,), time.perf_counter() - started)
+        return wrapper
+    return decorator
+
+
+def render_metrics() -> str:
+    """Render the registry plus point-in-time gauges from the logging pipeline."""
+    try:
+        from .logger import get_logging_stats
+    except ImportError:
+        from core.logger import get_logging_stats
+    stats = get_logging_stats()
+    lines = [
+        "# HELP log_queue_size Records waiting in the logging queue.",
+        "# TYPE log_queue_size gauge",
+        f"log_queue_size {stats['queue_size']}",
+        "# HELP log_records_dropped_total Log records dropped because the queue was full.",
+        "# TYPE log_records_dropped_total counter",
+    ]
+    lines.extend(f'log_records_dropped_total{{level="{level}"}} {count}' for level, count in stats["dropped"].items())
+    return registry.render() + "\n".join(lines) + "\n"
@@ -0,0 +1,311 @@
+import time
+import uuid
+
+try:
+    from .logger import request_id_var, request_started_var
+    from .metrics import observe_request
+    from .compression import COMPRESSION_MIN_SIZE, negotiate_encoding, compress, is_compressible
+    from .etag import compute_etag, etag_matches, not_modified_headers
+    from . import profiling
+except ImportError:
+    from core.logger import request_id_var, request_started_var
+    from core.metrics import observe_request
+    from core.compression import COMPRESSION_MIN_SIZE, negotiate_encoding, compress, is_compressible
+    from core.etag import compute_etag, etag_matches, not_modified_headers
+    from core import profiling
+
+REQUEST_ID_HEADER = b"x-request-id"
+PROFILE_HEADER = b"x-profile"
+ADMIN_PATH_PREFIX = "/admin"
+ACCEPT_ENCODING_HEADER = b"accept-encoding"
+IF_NONE_MATCH_HEADER = b"if-none-match"
+CONDITIONAL_METHODS = ("GET", "HEAD")
+
+
+def add_vary_accept_encoding(headers: list) -> list:
+    """Return ``headers`` with ``Accept-Encoding`` added to (or merged into) ``Vary``."""
+    result = []
+    merged = False
+    for name, value in headers:
+        if name.lower() == b"vary":
+            if b"accept-encoding" not in value.lower():
+                value = value + b", Accept-Encoding"
+            merged = True
+        result.append((name, value))
+    if not merged:
+        result.append((b"vary", b"Accept-Encoding"))
+    return result
+
+
+class RequestContextMiddleware:
+    """
+    Pure ASGI middleware that assigns each HTTP request an id (taken from the
+    ``X-Request-ID`` header when present) and a start time, exposes both to
+    the logging filter through context variables, and echoes the id back in
+    the response headers.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == REQUEST_ID_HEADER:
+                request_id = value.decode("latin-1")[:128]
+                break
+        if not request_id:
+            request_id = uuid.uuid4().hex
+
+        id_token = request_id_var.set(request_id)
+        started_token = request_started_var.set(time.perf_counter())
+
+        async def send_with_request_id(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((REQUEST_ID_HEADER, request_id.encode("latin-1")))
+                message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id_var.reset(id_token)
+            request_started_var.reset(started_token)
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware that records request latency per method, route
+    template and status code. Requests that match no route are grouped under
+    a single label to keep the series count bounded.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_holder = [500]
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                status_holder[0] = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "<unmatched>"
+            observe_request(scope["method"], route_path, status_holder[0], time.perf_counter() - started)
+
+
+class ProfilingMiddleware:
+    """
+    Pure ASGI middleware that samples requests selected for profiling.
+
+    Requests are profiled when an admin has armed a ``ProfileSession`` (the
+    next N requests, optionally limited to one route template), or, outside
+    production and when ``PROFILE_HEADER_ENABLED`` is set, when the request
+    carries an ``X-Profile`` header. The route
+    template is only known after routing, so while a session is armed every
+    request is sampled and its samples are kept only if it matched the
+    session's route. Requests to the admin surface itself are never counted.
+    In the header case the response body is replaced by the profile output:
+    collapsed stacks by default, or a summary table with ``X-Profile: summary``.
+    When nothing is armed the cost is one global read and a header scan.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        header_format = None
+        if profiling.header_profiling_enabled():
+            for name, value in scope["headers"]:
+                if name == PROFILE_HEADER:
+                    header_format = value.decode("latin-1").strip().lower() or "collapsed"
+                    break
+
+        session = profiling.get_session()
+        if session is not None and (session.done or scope["path"].startswith(ADMIN_PATH_PREFIX)):
+            session = None
+
+        if header_format is None and session is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def discard(message):
+            pass
+
+        sampler = profiling.StackSampler().start()
+        token = profiling.activate(sampler)
+        try:
+            await self.app(scope, receive, send if header_format is None else discard)
+        finally:
+            profiling.deactivate(token)
+            samples = sampler.stop()
+            if session is not None:
+                route_path = getattr(scope.get("route"), "path", None)
+                if session.claim(route_path):
+                    session.add(samples)
+        if header_format is None:
+            return
+        if header_format == "summary":
+            body = profiling.format_summary(samples).encode("utf-8")
+        else:
+            body = profiling.format_collapsed(samples).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"text/plain; charset=utf-8"),
+                        (b"content-length", str(len(body)).encode("latin-1"))],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+class CompressionMiddleware:
+    """
+    Pure ASGI middleware that compresses JSON and text responses with the
+    best coding the client accepts (brotli when the ``brotli`` package is
+    installed, otherwise gzip). Bodies under ``minimum_size``, streamed
+    bodies and responses that already carry a ``Content-Encoding`` (such as
+    the precompressed cache entries) are passed through unchanged.
+    """
+
+    def __init__(self, app, minimum_size: int = COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = None
+        for name, value in scope["headers"]:
+            if name == ACCEPT_ENCODING_HEADER:
+                accept_encoding = value.decode("latin-1")
+                break
+        encoding = negotiate_encoding(accept_encoding)
+        start_message = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                content_type = None
+                encoded = False
+                for name, value in message.get("headers", []):
+                    lowered = name.lower()
+                    if lowered == b"content-type":
+                        content_type = value.decode("latin-1")
+                    elif lowered == b"content-encoding":
+                        encoded = True
+                if encoded or not is_compressible(content_type):
+                    passthrough = True
+                    await send(message)
+                    return
+                # Se retiene el inicio hasta conocer el cuerpo
+                start_message = message
+                return
+
+            body = message.get("body", b"")
+            headers = add_vary_accept_encoding(list(start_message.get("headers", [])))
+            if encoding is None or message.get("more_body") or len(body) < self.minimum_size:
+                passthrough = True
+                await send({**start_message, "headers": headers})
+                await send(message)
+                return
+            body = compress(body, encoding)
+            headers = [(name, value) for name, value in headers if name.lower() != b"content-length"]
+            headers.append((b"content-encoding", encoding.encode("latin-1")))
+            headers.append((b"content-length", str(len(body)).encode("latin-1")))
+            await send({**start_message, "headers": headers})
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_compressed)
+
+
+class ETagMiddleware:
+    """
+    Pure ASGI middleware that tags successful GET/HEAD responses with a weak
+    ``ETag`` computed from the body (unless the endpoint already set one) and
+    answers ``304 Not Modified`` without a body when the request's
+    ``If-None-Match`` matches it. Streamed bodies are passed through untagged.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in CONDITIONAL_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = None
+        for name, value in scope["headers"]:
+            if name == IF_NONE_MATCH_HEADER:
+                if_none_match = value.decode("latin-1")
+                break
+        start_message = None
+        passthrough = False
+        discard = False
+
+        async def send_not_modified(headers):
+            await send({"type": "http.response.start", "status": 304, "headers": not_modified_headers(headers)})
+            await send({"type": "http.response.body", "body": b""})
+
+        async def send_with_etag(message):
+            nonlocal start_message, passthrough, discard
+            if passthrough:
+                await send(message)
+                return
+            if discard:
+                return
+            if message["type"] == "http.response.start":
+                headers = message.get("headers", [])
+                etag = next((value.decode("latin-1") for name, value in headers if name.lower() == b"etag"), None)
+                if message["status"] != 200 or (etag is not None and not etag_matches(if_none_match, etag)):
+                    passthrough = True
+                    await send(message)
+                elif etag is not None:
+                    # La etiqueta la puso el endpoint: 304 sin esperar el cuerpo, que se descarta
+                    discard = True
+                    await send_not_modified(headers)
+                else:
+                    # Se retiene el inicio hasta conocer el cuerpo
+                    start_message = message
+                return
+
+            passthrough = True
+            if message.get("more_body"):
+                await send(start_message)
+                await send(message)
+                return
+            etag = compute_etag(message.get("body", b""))
+            headers = list(start_message.get("headers", [])) + [(b"etag", etag.encode("latin-1"))]
+            if etag_matches(if_none_match, etag):
+                discard, passthrough = True, False
+                await send_not_modified(headers)
+                return
+            await send({**start_message, "headers": headers})
+            await send(message)
+
+        await self.app(scope, receive, send_with_etag)
@@ -0,0 +1,188 @@
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Optional
+
+APP_ENV = os.getenv("APP_ENV", "development").lower()
+# El header X-Profile es opt-in y nunca se acepta en producción
+PROFILE_HEADER_ENABLED = os.getenv("PROFILE_HEADER_ENABLED", "false").lower() in ("1", "true", "yes")
+PROFILE_SAMPLE_INTERVAL_SECONDS = float(os.getenv("PROFILE_SAMPLE_INTERVAL_SECONDS", "0.001"))
+PROFILE_MAX_STACK_DEPTH = 64
+
+
+def is_production() -> bool:
+    return APP_ENV == "production"
+
+
+def header_profiling_enabled() -> bool:
+    return PROFILE_HEADER_ENABLED and not is_production()
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _collapse(frame) -> str:
+    labels = []
+    while frame is not None and len(labels) < PROFILE_MAX_STACK_DEPTH:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.reverse()
+    return ";".join(labels)
+
+
+class StackSampler:
+    """
+    Background-thread sampling profiler.
+
+    While running, it snapshots the stacks of the threads handling one
+    request each ``interval`` seconds with ``sys._current_frames()``: the
+    thread that created it (the event loop, for the middleware) plus the
+    threadpool workers that join through ``track_current_thread`` while the
+    sampler is active in their context. Idle workers and other requests'
+    threads are not sampled. Samples are aggregated as collapsed stacks
+    (``frame;frame;frame count``), the input format of flamegraph.pl and
+    speedscope.
+    """
+
+    def __init__(self, interval: float = PROFILE_SAMPLE_INTERVAL_SECONDS):
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self.thread_ids = {threading.get_ident()}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def track(self, thread_id: int) -> None:
+        self.thread_ids.add(thread_id)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frames = sys._current_frames()
+            for thread_id in tuple(self.thread_ids):
+                frame = frames.get(thread_id)
+                if frame is not None:
+                    self.samples[_collapse(frame)] += 1
+
+    def start(self) -> "StackSampler":
+        self._thread = threading.Thread(target=self._run, name="profile-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> Counter:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        return self.samples
+
+
+_active_sampler: ContextVar[Optional[StackSampler]] = ContextVar("active_sampler", default=None)
+
+
+def activate(sampler: StackSampler):
+    """Make ``sampler`` the active one for the current context; returns a token for ``deactivate``."""
+    return _active_sampler.set(sampler)
+
+
+def deactivate(token) -> None:
+    _active_sampler.reset(token)
+
+
+def track_current_thread() -> None:
+    """
+    Add the calling thread to the sampler active in this context, if any.
+    Threadpool calls inherit the request's context, so service code running
+    in a worker joins its request's profile.
+    """
+    sampler = _active_sampler.get()
+    if sampler is not None:
+        sampler.track(threading.get_ident())
+
+
+def format_collapsed(samples: Counter) -> str:
+    """Render samples as collapsed stacks, heaviest first."""
+    return "\n".join(f"{stack} {count}" for stack, count in samples.most_common()) + "\n"
+
+
+def format_summary(samples: Counter, limit: int = 30) -> str:
+    """Render a pstats-like table of self and cumulative sample counts per function."""
+    own: Counter = Counter()
+    cumulative: Counter = Counter()
+    total = sum(samples.values())
+    for stack, count in samples.items():
+        frames = stack.split(";")
+        own[frames[-1]] += count
+        for label in set(frames):
+            cumulative[label] += count
+    lines = [f"{total} samples", f"{'self':>8} {'cumul':>8}  function"]
+    for label, count in cumulative.most_common(limit):
+        lines.append(f"{own[label]:>8} {count:>8}  {label}")
+    return "\n".join(lines) + "\n"
+
+
+class ProfileSession:
+    """
+    Admin-armed profiling window: profiles the next ``remaining`` requests,
+    optionally only those matching ``route`` (a route template such as
+    ``/products/{product_id}``), and accumulates their samples.
+    """
+
+    def __init__(self, requests: int, route: Optional[str] = None,
+                 interval: float = PROFILE_SAMPLE_INTERVAL_SECONDS):
+        self.requested = requests
+        self.remaining = requests
+        self.route = route
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+
+    def claim(self, route_path: Optional[str]) -> bool:
+        """Reserve one profiled request if the session still accepts ``route_path``."""
+        if self.route is not None and route_path != self.route:
+            return False
+        with self._lock:
+            if self.remaining <= 0:
+                return False
+            self.remaining -= 1
+            return True
+
+    def add(self, samples: Counter) -> None:
+        with self._lock:
+            self.samples.update(samples)
+
+    @property
+    def done(self) -> bool:
+        return self.remaining <= 0
+
+    def status(self) -> dict:
+        return {
+            "route": self.route,
+            "requested": self.requested,
+            "profiled": self.requested - self.remaining,
+            "remaining": self.remaining,
+            "samples": sum(self.samples.values()),
+            "started_at": self.started_at,
+        }
+
+
+_active_session: Optional[ProfileSession] = None
+
+
+def start_session(requests: int, route: Optional[str] = None) -> ProfileSession:
+    global _active_session
+    _active_session = ProfileSession(requests, route)
+    return _active_session
+
+
+def get_session() -> Optional[ProfileSession]:
+    return _active_session
+
+
+def clear_session() -> Optional[ProfileSession]:
+    global _active_session
+    session, _active_session = _active_session, None
+    return session
@@ -0,0 +1,160 @@
+import json
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Optional
+
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel, TypeAdapter
+
+try:
+    from .metrics import record_cache
+    from .compression import COMPRESSION_MIN_SIZE, negotiate_encoding, compress
+    from .etag import compute_etag
+    from ..repository import get_data_version
+except ImportError:
+    from core.metrics import record_cache
+    from core.compression import COMPRESSION_MIN_SIZE, negotiate_encoding, compress
+    from core.etag import compute_etag
+    from repository import get_data_version
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: type) -> TypeAdapter:
+    return TypeAdapter(list[model])
+
+
+def dump_json(content: Any) -> bytes:
+    """
+    Serialize ``content`` to JSON bytes.
+
+    Schema instances and homogeneous lists of them are serialized directly by
+    pydantic-core, skipping the intermediate ``dict`` tree that FastAPI's
+    response-model path builds. Anything else goes through the same encoder
+    FastAPI uses, so the output is byte-compatible with ``JSONResponse``.
+    """
+    if isinstance(content, BaseModel):
+        return content.__pydantic_serializer__.to_json(content)
+    if isinstance(content, list):
+        if not content:
+            return b"[]"
+        if isinstance(content[0], BaseModel):
+            return _list_adapter(type(content[0])).dump_json(content)
+    return json.dumps(jsonable_encoder(content), ensure_ascii=False, allow_nan=False,
+                      indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def json_response(content: Any, status_code: int = 200) -> Response:
+    """
+    Build a JSON response from already validated schema instances.
+
+    Returning a ``Response`` makes FastAPI skip ``response_model`` validation
+    and serialization; the decorator's ``response_model`` still documents the
+    endpoint in OpenAPI.
+    """
+    return Response(dump_json(content), status_code=status_code, media_type=JSON_MEDIA_TYPE)
+
+
+_upgrade_executor: Optional[ThreadPoolExecutor] = None
+_upgrade_executor_lock = threading.Lock()
+
+
+def get_upgrade_executor() -> ThreadPoolExecutor:
+    """Return the single background thread that recompresses cached variants at the highest level."""
+    global _upgrade_executor
+    if _upgrade_executor is None:
+        with _upgrade_executor_lock:
+            if _upgrade_executor is None:
+                _upgrade_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="compression-upgrade")
+    return _upgrade_executor
+
+
+class CachedBody:
+    """
+    Serialized response body tied to the db snapshot it was built from, plus
+    its ETag and compressed variants. The first request for an encoding
+    compresses the body at the fast per-request level, outside any lock, and
+    schedules one background recompression at the highest level that then
+    replaces the variant; later requests get whichever is current.
+    """
+
+    __slots__ = ("db", "version", "body", "etag", "variants", "upgrades", "_lock")
+
+    def __init__(self, db: dict, version: int, body: bytes):
+        self.db = db
+        self.version = version
+        self.body = body
+        self.etag = compute_etag(body)
+        self.variants: dict[str, bytes] = {}
+        self.upgrades: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def encoded(self, encoding: str) -> bytes:
+        variant = self.variants.get(encoding)
+        if variant is not None:
+            return variant
+        variant = compress(self.body, encoding)
+        with self._lock:
+            current = self.variants.get(encoding)
+            if current is not None:
+                return current
+            self.variants[encoding] = variant
+            self.upgrades[encoding] = get_upgrade_executor().submit(self._upgrade, encoding)
+        return variant
+
+    def _upgrade(self, encoding: str) -> None:
+        self.variants[encoding] = compress(self.body, encoding, cached=True)
+
+
+class SerializedCache:
+    """
+    Pre-serialized bodies for endpoints whose output depends only on the data
+    snapshot (full listings). One entry per name, rebuilt when the snapshot
+    object or the data version changes, so a reload invalidates every entry.
+    """
+
+    def __init__(self):
+        self._entries: dict[str, CachedBody] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str, db: dict, build: Callable[[], Any]) -> CachedBody:
+        version = get_data_version()
+        entry = self._entries.get(name)
+        if entry is not None and entry.db is db and entry.version == version:
+            record_cache(name, hit=True)
+            return entry
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None and entry.db is db and entry.version == version:
+                record_cache(name, hit=True)
+                return entry
+            record_cache(name, hit=False)
+            entry = self._entries[name] = CachedBody(db, version, dump_json(build()))
+            return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+response_cache = SerializedCache()
+
+
+def cached_json_response(name: str, db: dict, build: Callable[[], Any],
+                         accept_encoding: Optional[str] = None) -> Response:
+    """
+    Serve ``build()`` as JSON from the pre-serialized cache, using the cached
+    compressed variant for ``accept_encoding`` when the body is large enough.
+    The entry's precomputed ETag lets conditional requests be answered
+    without touching the body.
+    """
+    entry = response_cache.get(name, db, build)
+    headers = {"Vary": "Accept-Encoding", "ETag": entry.etag}
+    encoding = negotiate_encoding(accept_encoding) if len(entry.body) >= COMPRESSION_MIN_SIZE else None
+    if encoding is None:
+        return Response(entry.body, media_type=JSON_MEDIA_TYPE, headers=headers)
+    headers["Content-Encoding"] = encoding
+    return Response(entry.encoded(encoding), media_type=JSON_MEDIA_TYPE, headers=headers)
@@ -3,46 +3,168 @@ from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from datetime import datetime, timedelta, timezone
 from typing import Optional
+import heapq
+import threading
+import time
+import uuid
 import bcrypt
 
+try:
+    from ..repository.user_repository import get_user_repository
+except ImportError:
+    from app.repository.user_repository import get_user_repository
+
 # Configuration
 SECRET_KEY = "super-secret-key"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
+REFRESH_TOKEN_EXPIRE_DAYS = 7
+ACCESS_TOKEN_TYPE = "access"
+REFRESH_TOKEN_TYPE = "refresh"
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/token")
 
-# Example user (in production, query your database)
+# Built-in demo user, always available alongside the users in user.json
 fake_user = {
     "username": "testuser",
-    "password": "$2b$12$811LbvD4g.xrZk.gKuFueeO2.hYjjs32VXuxEo5eVsfgBg5SbrZ5W"  # Hash of "testpass"
+    "password": "$2b$12$811LbvD4g.xrZk.gKuFueeO2.hYjjs32VXuxEo5eVsfgBg5SbrZ5W",  # Hash of "testpass"
+    "role": "user",
+    "active": True,
 }
 
 def authenticate_user(username: str, password: str):
-    if username == fake_user["username"] and verify_password(password, fake_user["password"]):
-        return {"username": username}
-    return None
+    user = get_user_repository().get(username)
+    if not user or not user["active"]:
+        return None
+    if not verify_password(password, user["password"]):
+        return None
+    return {"username": user["username"], "role": user["role"]}
 
-def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
+class TokenRevocationList:
+    """
+    In-memory set of revoked token ids (``jti``) with expiry-ordered pruning.
+
+    Membership checks are a single dict lookup. Entries are kept in a min-heap
+    by expiry so that ids of tokens that have expired anyway are dropped
+    without scanning the whole set.
+    """
+
+    def __init__(self):
+        self._revoked: dict[str, float] = {}
+        self._expiries: list[tuple[float, str]] = []
+        self._lock = threading.Lock()
+
+    def revoke(self, jti: str, expires_at: float) -> bool:
+        """Revoke ``jti``; return False if it was already revoked."""
+        with self._lock:
+            self._prune(time.time())
+            if jti in self._revoked:
+                return False
+            self._revoked[jti] = expires_at
+            heapq.heappush(self._expiries, (expires_at, jti))
+            return True
+
+    def is_revoked(self, jti: str) -> bool:
+        return jti in self._revoked
+
+    def _prune(self, now: float) -> None:
+        while self._expiries and self._expiries[0][0] <= now:
+            _, jti = heapq.heappop(self._expiries)
+            self._revoked.pop(jti, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._revoked.clear()
+            self._expiries.clear()
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+
+revoked_tokens = TokenRevocationList()
+
+def _encode_token(data: dict, token_type: str, expires_delta: timedelta) -> str:
     to_encode = data.copy()
-    expire = datetime.now(timezone.utc) + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
-    to_encode.update({"exp": expire})
+    expire = datetime.now(timezone.utc) + expires_delta
+    to_encode.setdefault("jti", uuid.uuid4().hex)
+    to_encode.update({"exp": expire, "type": token_type})
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
-def get_current_user(token: str = Depends(oauth2_scheme)):
-    credentials_exception = HTTPException(
+def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
+    return _encode_token(data, ACCESS_TOKEN_TYPE, expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
+
+def create_refresh_token(data: dict, expires_delta: Optional[timedelta] = None):
+    return _encode_token(data, REFRESH_TOKEN_TYPE, expires_delta or timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS))
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+def decode_token(token: str, expected_type: str = ACCESS_TOKEN_TYPE) -> dict:
+    """
+    Decode and validate a token of the given type.
+
+    Tokens without a ``type`` claim are treated as access tokens.
+
+    :raises HTTPException: 401 if the token is invalid, expired, revoked or of another type.
+    """
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
-            raise credentials_exception
     except JWTError:
-        raise credentials_exception
-    return {"username": username}
+        raise _credentials_exception()
+    if payload.get("sub") is None or payload.get("type", ACCESS_TOKEN_TYPE) != expected_type:
+        raise _credentials_exception()
+    jti = payload.get("jti")
+    if jti and revoked_tokens.is_revoked(jti):
+        raise _credentials_exception()
+    return payload
+
+def revoke_token(payload: dict) -> bool:
+    """
+    Revoke a decoded token until its own expiry. Returns True only for the
+    call that actually revoked it (False if it was already revoked or has no ``jti``).
+    """
+    jti = payload.get("jti")
+    if not jti:
+        return False
+    return revoked_tokens.revoke(jti, float(payload.get("exp", time.time())))
+
+def get_current_user(token: str = Depends(oauth2_scheme)):
+    payload = decode_token(token)
+    return {"username": payload["sub"], "role": payload.get("role"), "jti": payload.get("jti")}
+
+def require_admin(current_user: dict = Depends(get_current_user)):
+    if current_user.get("role") != "admin":
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin privileges required")
+    return current_user
+
+def rotate_refresh_token(refresh_token: str) -> dict:
+    """
+    Exchange a refresh token for a new access/refresh pair.
+
+    The presented refresh token is revoked atomically so that each one can
+    be used once, even by concurrent requests. The user is looked up again:
+    missing or inactive users are rejected and the role is taken from the
+    repository, not from the old token.
+    """
+    payload = decode_token(refresh_token, REFRESH_TOKEN_TYPE)
+    if not revoke_token(payload):
+        raise _credentials_exception()
+    user = get_user_repository().get(payload["sub"])
+    if not user or not user["active"]:
+        raise _credentials_exception()
+    return issue_tokens({"username": user["username"], "role": user["role"]})
+
+def issue_tokens(user: dict) -> dict:
+    claims = {"sub": user["username"], "role": user.get("role")}
+    return {
+        "access_token": create_access_token(claims),
+        "refresh_token": create_refresh_token(claims),
+        "token_type": "bearer",
+    }
 
 def hash_password(password: str) -> str:
     salt = bcrypt.gensalt()
@@ -1,14 +1,21 @@
-from datetime import timedelta
 import os
+from typing import Optional
 from fastapi import Depends, FastAPI, HTTPException
+from fastapi.responses import PlainTextResponse
 from fastapi.security import OAuth2PasswordRequestForm
 
 try:
-    from .core.security import authenticate_user, create_access_token
-    from .controllers import seller_controller, category_controller, payment_method_controller, product_controller, review_controller
+    from .core.security import authenticate_user, issue_tokens, rotate_refresh_token, decode_token, revoke_token, oauth2_scheme, REFRESH_TOKEN_TYPE
+    from .schemas.token import TokenSchema, RefreshTokenRequest
+    from .core.middleware import RequestContextMiddleware, MetricsMiddleware, ProfilingMiddleware, CompressionMiddleware, ETagMiddleware
+    from .core.metrics import render_metrics
+    from .controllers import seller_controller, category_controller, payment_method_controller, product_controller, review_controller, admin_controller
 except ImportError:
-    from core.security import authenticate_user, create_access_token
-    from controllers import seller_controller, category_controller, payment_method_controller, product_controller, review_controller
+    from core.security import authenticate_user, issue_tokens, rotate_refresh_token, decode_token, revoke_token, oauth2_scheme, REFRESH_TOKEN_TYPE
+    from schemas.token import TokenSchema, RefreshTokenRequest
+    from core.middleware import RequestContextMiddleware, MetricsMiddleware, ProfilingMiddleware, CompressionMiddleware, ETagMiddleware
+    from core.metrics import render_metrics
+    from controllers import seller_controller, category_controller, payment_method_controller, product_controller, review_controller, admin_controller
 
 app = FastAPI(
     title="MeLi Marketplace API",
@@ -25,11 +32,18 @@ app = FastAPI(
     },
 )
 
+app.add_middleware(ETagMiddleware)
+app.add_middleware(ProfilingMiddleware)
+app.add_middleware(CompressionMiddleware)
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(RequestContextMiddleware)
+
 app.include_router(seller_controller.router)
 app.include_router(product_controller.router)
 app.include_router(category_controller.router)
 app.include_router(payment_method_controller.router)
 app.include_router(review_controller.router)
+app.include_router(admin_controller.router)
 
 @app.get("/", tags=["Info"])
 def root():
@@ -40,16 +54,31 @@ def root():
     }
 
 
-@app.post("/token")
+@app.get("/metrics", tags=["Info"], response_class=PlainTextResponse)
+def metrics():
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+@app.post("/token", response_model=TokenSchema)
 def login(form_data: OAuth2PasswordRequestForm = Depends()):
     user = authenticate_user(form_data.username, form_data.password)
     if not user:
         raise HTTPException(status_code=400, detail="Incorrect username or password")
-    access_token = create_access_token(
-        data={"sub": user["username"]},
-        expires_delta=timedelta(minutes=30)
-    )
-    return {"access_token": access_token, "token_type": "bearer"}
+    return issue_tokens(user)
+
+
+@app.post("/token/refresh", response_model=TokenSchema)
+def refresh(body: RefreshTokenRequest):
+    if not body.refresh_token:
+        raise HTTPException(status_code=400, detail="refresh_token is required")
+    return rotate_refresh_token(body.refresh_token)
+
+
+@app.post("/logout", status_code=204)
+def logout(body: Optional[RefreshTokenRequest] = None, token: str = Depends(oauth2_scheme)):
+    revoke_token(decode_token(token))
+    if body and body.refresh_token:
+        revoke_token(decode_token(body.refresh_token, REFRESH_TOKEN_TYPE))
 
 
 if __name__ == "__main__":
@@ -3,6 +3,15 @@ import os
 from pydantic import ValidationError
 from functools import lru_cache
 
+try:
+    from ..core.metrics import record_cache, record_lookup
+    from .snapshot import DataSnapshot, REVIEW_SORT_KEYS, compute_facets
+    from .search_index import SearchIndex
+except ImportError:
+    from app.core.metrics import record_cache, record_lookup
+    from app.repository.snapshot import DataSnapshot, REVIEW_SORT_KEYS, compute_facets
+    from app.repository.search_index import SearchIndex
+
 
 class InvalidJSONStructure(Exception):
     pass
@@ -38,8 +47,15 @@ def load_and_validate_json(filepath: str) -> list[dict]:
 DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "data")
 DATA_DIR = os.path.normpath(DATA_DIR)
 
+# Incremented every time the data files are (re)loaded
+_data_version = 0
+
+def get_data_version() -> int:
+    return _data_version
+
 @lru_cache(maxsize=1)
-def get_db_data() -> dict[str, list[dict]]:
+def get_db_data() -> DataSnapshot:
+    global _data_version
     products_path = os.path.join(DATA_DIR, "products.json")
     categories_path = os.path.join(DATA_DIR, "categories.json")
     sellers_path = os.path.join(DATA_DIR, "sellers.json")
@@ -52,13 +68,17 @@ def get_db_data() -> dict[str, list[dict]]:
         "payment_methods": payment_methods_path,
         "reviews": reviews_path,
     }
-    db: dict[str, list[dict]] = {}
+    tables: dict[str, list[dict]] = {}
     for key, path in data_files.items():
-        db[key] = load_and_validate_json(path)  # Validate the structure
-    return db
+        tables[key] = load_and_validate_json(path)  # Validate the structure
+    _data_version += 1
+    return DataSnapshot(tables, _data_version)
 
 def get_db() -> dict[str, list[dict]]:
-    return get_db_data()
+    version = _data_version
+    db = get_db_data()
+    record_cache("db_snapshot", hit=_data_version == version)
+    return db
 
 def get_table(db: dict, table: str) -> list[dict]:
     if table not in db:
@@ -70,7 +90,146 @@ def get_all(db: dict, table: str) -> list[dict]:
 
 def get_item_by_id(db: dict, table: str, item_id: int) -> dict:
     items = get_table(db, table)
-    item = next((item for item in items if item['id'] == item_id), None)
+    if isinstance(db, DataSnapshot):
+        record_lookup(table, "index")
+        item = db.by_id[table].get(item_id)
+    else:
+        record_lookup(table, "scan")
+        item = next((item for item in items if item['id'] == item_id), None)
     if not item:
         raise ValueError(f"Item with id {item_id} not found in table {table}.")
-    return item
\ No newline at end of file
+    return item
+
+def get_items_by_key(db: dict, table: str, key: str, value) -> list[dict]:
+    """
+    Return the rows of ``table`` whose ``key`` equals ``value``, in table order.
+    Served from the snapshot's group index when one exists; the returned list
+    may be shared and must not be mutated.
+    """
+    if isinstance(db, DataSnapshot) and (table, key) in db.groups:
+        record_lookup(table, "index")
+        return db.groups[(table, key)].get(value, [])
+    record_lookup(table, "scan")
+    return [row for row in get_table(db, table) if row.get(key) == value]
+
+def get_sorted_product_reviews(db: dict, product_id: int, sort: str = "date", rating: int | None = None) -> list[dict]:
+    """
+    Return a product's reviews in descending ``sort`` order (``"date"`` or
+    ``"rating"``), optionally only those with the given ``rating``. Snapshots
+    return pre-sorted shared lists; plain dicts are filtered and sorted.
+    """
+    if sort not in REVIEW_SORT_KEYS:
+        raise ValueError(f"Unsupported review sort: {sort}")
+    if isinstance(db, DataSnapshot):
+        record_lookup("reviews", "index")
+        orderings = db.product_reviews.get(product_id)
+        if orderings is None:
+            return []
+        if rating is not None:
+            return orderings.by_rating.get(rating, [])
+        return orderings.by_sort[sort]
+    reviews = get_items_by_key(db, "reviews", "product_id", product_id)
+    if rating is not None:
+        reviews = [r for r in reviews if r.get("rating") == rating]
+        sort = "date"
+    return sorted(reviews, key=REVIEW_SORT_KEYS[sort], reverse=True)
+
+def get_category_products(db: dict, category_id: int) -> list[dict]:
+    """Return the products listed in ``category_id``, in catalog order."""
+    if isinstance(db, DataSnapshot):
+        record_lookup("products", "index")
+        return db.category_products.get(category_id, [])
+    record_lookup("products", "scan")
+    return [p for p in get_table(db, "products") if category_id in (p.get("category_ids") or ())]
+
+def get_category_facets(db: dict, category_id: int) -> dict:
+    """Return the facet counts of ``category_id``, precomputed on snapshots."""
+    if isinstance(db, DataSnapshot):
+        facets = db.category_facets.get(category_id)
+        return facets if facets is not None else compute_facets([])
+    return compute_facets(get_category_products(db, category_id))
+
+PRODUCT_SORTS = ("price_asc", "price_desc")
+
+def _product_positions(db: "DataSnapshot", min_price, max_price, in_stock: bool, sort: str | None):
+    """
+    Return ``(positions, start, end)``: the catalog positions of the matching
+    products, in listing order, are ``positions[start:end]``. The window is
+    found by bisection and nothing is copied unless a price range has to be
+    put back in catalog order.
+    """
+    if sort is None and min_price is None and max_price is None:
+        if in_stock:
+            return db.in_stock_positions, 0, len(db.in_stock_positions)
+        return range(len(db["products"])), 0, len(db["products"])
+    name = "price_desc" if sort == "price_desc" else "price"
+    column = db.columns[f"{name}_in_stock" if in_stock else name]
+    start, end = column.bounds(min_price, max_price)
+    if sort is None:
+        positions = sorted(column.positions[start:end])
+        return positions, 0, len(positions)
+    return column.positions, start, end
+
+def query_products(db: dict, min_price: float | None = None, max_price: float | None = None,
+                   in_stock: bool = False, sort: str | None = None,
+                   page: int | None = None, page_size: int = 20) -> tuple[list[dict], int]:
+    """
+    Return ``(products, total)``: the products priced within
+    ``[min_price, max_price]`` (and with stock when ``in_stock``), in catalog
+    order or sorted by ``sort`` (``"price_asc"`` / ``"price_desc"``), and how
+    many match. Equal prices keep catalog order. With ``page`` (1-based) only
+    that page of ``page_size`` products is returned.
+
+    On snapshots the matches are a window of the sorted price columns (kept
+    separately for in-stock products) found by bisection, and only the rows
+    of the requested page are materialized: O(log n + page), or
+    O(matches log matches) for a price range listed in catalog order.
+    """
+    if sort is not None and sort not in PRODUCT_SORTS:
+        raise ValueError(f"Unsupported product sort: {sort}")
+    products = get_table(db, "products")
+
+    if not isinstance(db, DataSnapshot):
+        record_lookup("products", "scan")
+        rows = [
+            p for p in products
+            if (min_price is None or p.get("price", 0) >= min_price)
+            and (max_price is None or p.get("price", 0) <= max_price)
+            and (not in_stock or (p.get("stock") or 0) > 0)
+        ]
+        if sort is not None:
+            sign = -1 if sort == "price_desc" else 1
+            rows.sort(key=lambda p: sign * p.get("price", 0))
+        return (rows if page is None else slice_page(rows, page, page_size)), len(rows)
+
+    record_lookup("products", "index")
+    positions, start, end = _product_positions(db, min_price, max_price, in_stock, sort)
+    total = end - start
+    if page is not None:
+        start = min(end, start + (page - 1) * page_size)
+        end = min(end, start + page_size)
+    return [products[pos] for pos in positions[start:end]], total
+
+def search_products(db: dict, query: str, limit: int = 20) -> list[dict]:
+    """
+    Return up to ``limit`` products matching ``query``, best BM25 match
+    first. Snapshots use the index built at load; plain dicts build one.
+    """
+    if isinstance(db, DataSnapshot):
+        record_lookup("products", "index")
+        index = db.search_index
+    else:
+        record_lookup("products", "scan")
+        index = SearchIndex(get_table(db, "products"))
+    return [product for _, product in index.search(query, limit)]
+
+def slice_page(items: list, page: int, page_size: int, reverse: bool = False) -> list:
+    """
+    Return page ``page`` (1-based) of ``items``, reading the list back to
+    front when ``reverse`` is set, without copying more than one page.
+    """
+    start = (page - 1) * page_size
+    if not reverse:
+        return items[start:start + page_size]
+    end = len(items) - start
+    return items[max(0, end - page_size):max(0, end)][::-1]
\ No newline at end of file
@@ -0,0 +1,146 @@
+import heapq
+import math
+import re
+import unicodedata
+from array import array
+from bisect import bisect_left
+from collections import Counter, defaultdict
+
+# Parámetros de BM25
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Peso de cada campo: un término del título cuenta como tres de la descripción
+FIELD_WEIGHTS = (("title", 3), ("description", 1), ("features", 1))
+# Cada lista de postings guarda sólo los documentos de mayor impacto para el término
+MAX_POSTINGS_PER_TERM = 5000
+# Expansión del último término como prefijo (autocompletado)
+MIN_PREFIX_LENGTH = 2
+MAX_PREFIX_EXPANSIONS = 10
+MAX_PREFIX_CANDIDATES = 500
+# Las expansiones sólo recorren la cabeza (mayor impacto) de sus postings
+MAX_PREFIX_POSTINGS = 1000
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def fold(text: str) -> str:
+    """Lowercase ``text`` and strip accents (``"Cámara"`` -> ``"camara"``)."""
+    text = text.lower()
+    if text.isascii():
+        return text
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN_RE.findall(fold(text))
+
+
+def _feature_text(value) -> str:
+    if isinstance(value, dict):
+        return " ".join(_feature_text(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return " ".join(_feature_text(v) for v in value)
+    return "" if value is None else str(value)
+
+
+class SearchIndex:
+    """
+    In-memory inverted index over product titles, descriptions and feature
+    values with BM25 ranking.
+
+    BM25 is query-independent per (term, document) once the collection is
+    fixed, so each posting stores its precomputed impact. Postings are kept in
+    impact order and truncated to ``max_postings`` per term, which bounds the
+    work of a query term regardless of how common it is: the documents that
+    fall off the end are the ones that could not rank near the top on that
+    term anyway. A query sums the impacts of its terms per document. The last
+    query term is also expanded to the most frequent vocabulary terms it
+    prefixes, for autocomplete.
+    """
+
+    def __init__(self, products: list[dict], max_postings: int = MAX_POSTINGS_PER_TERM):
+        self.products = products
+        term_docs = defaultdict(lambda: array("I"))
+        term_freqs = defaultdict(lambda: array("f"))
+        doc_lengths = array("f")
+        # Los valores de features se repiten mucho entre productos
+        feature_tokens = {}
+        for doc, product in enumerate(products):
+            counts = Counter()
+            for field, weight in FIELD_WEIGHTS:
+                value = product.get(field)
+                if not value:
+                    continue
+                if field == "features":
+                    text = _feature_text(value)
+                    tokens = feature_tokens.get(text)
+                    if tokens is None:
+                        tokens = feature_tokens[text] = tokenize(text)
+                else:
+                    tokens = tokenize(value)
+                for token in tokens:
+                    counts[token] += weight
+            doc_lengths.append(sum(counts.values()))
+            for term, freq in counts.items():
+                term_docs[term].append(doc)
+                term_freqs[term].append(freq)
+
+        total_docs = len(products)
+        average_length = (sum(doc_lengths) / total_docs) if total_docs else 0.0
+        self.document_frequency: dict[str, int] = {}
+        self.postings: dict[str, tuple[array, array]] = {}
+        for term, docs in term_docs.items():
+            freqs = term_freqs[term]
+            df = len(docs)
+            idf = math.log(1 + (total_docs - df + 0.5) / (df + 0.5))
+            impacts = [
+                idf * freq * (BM25_K1 + 1)
+                / (freq + BM25_K1 * (1 - BM25_B + BM25_B * doc_lengths[doc] / average_length))
+                for doc, freq in zip(docs, freqs)
+            ]
+            order = sorted(range(df), key=impacts.__getitem__, reverse=True)[:max_postings]
+            self.document_frequency[term] = df
+            self.postings[term] = (array("I", (docs[i] for i in order)), array("f", (impacts[i] for i in order)))
+        self.vocabulary = sorted(self.postings)
+
+    def expand_prefix(self, prefix: str) -> list[str]:
+        """Return the most frequent vocabulary terms starting with ``prefix``."""
+        if len(prefix) < MIN_PREFIX_LENGTH:
+            return [prefix] if prefix in self.postings else []
+        start = bisect_left(self.vocabulary, prefix)
+        candidates = []
+        for term in self.vocabulary[start:start + MAX_PREFIX_CANDIDATES]:
+            if not term.startswith(prefix):
+                break
+            candidates.append(term)
+        candidates.sort(key=lambda term: (term != prefix, -self.document_frequency[term]))
+        return candidates[:MAX_PREFIX_EXPANSIONS]
+
+    def search(self, query: str, limit: int = 20, prefix: bool = True) -> list[tuple[float, dict]]:
+        """
+        Return up to ``limit`` ``(score, product)`` pairs for ``query``, best
+        first; ties keep catalog order.
+        """
+        terms = tokenize(query)
+        if not terms:
+            return []
+        last = terms.pop() if prefix else None
+        scores = defaultdict(float)
+        for term in set(terms):
+            postings = self.postings.get(term)
+            if postings is not None:
+                for doc, impact in zip(*postings):
+                    scores[doc] += impact
+        if last is not None:
+            # Un documento puntúa por el mejor término de la expansión, no por la suma de todos
+            best = {}
+            for term in self.expand_prefix(last):
+                docs, impacts = self.postings[term]
+                for doc, impact in zip(docs[:MAX_PREFIX_POSTINGS], impacts[:MAX_PREFIX_POSTINGS]):
+                    if impact > best.get(doc, 0.0):
+                        best[doc] = impact
+            for doc, impact in best.items():
+                scores[doc] += impact
+        top = heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], item[0]))
+        return [(score, self.products[doc]) for doc, score in top]
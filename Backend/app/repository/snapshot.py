@@ -0,0 +1,165 @@
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
+
+try:
+    from .search_index import SearchIndex
+except ImportError:
+    from app.repository.search_index import SearchIndex
+
+# Agrupaciones (tabla, campo) indexadas al cargar los datos
+GROUP_KEYS = (
+    ("products", "seller_id"),
+    ("reviews", "product_id"),
+    ("reviews", "seller_id"),
+)
+
+REVIEW_RATINGS = (5, 4, 3, 2, 1)
+
+# Límites de los rangos de precio de las facetas: [0, 250), [250, 500), ... [2500, ∞)
+PRICE_BUCKET_EDGES = (250, 500, 1000, 2500)
+
+
+def review_date_key(review: dict):
+    return (review.get("date") or "", review.get("id", 0))
+
+
+def review_rating_key(review: dict):
+    return (review.get("rating", 0), review.get("date") or "", review.get("id", 0))
+
+
+# Orden descendente de cada criterio; el ascendente se obtiene recorriendo la lista al revés
+REVIEW_SORT_KEYS = {
+    "date": review_date_key,
+    "rating": review_rating_key,
+}
+
+
+def compute_facets(products: list[dict]) -> dict:
+    """
+    Aggregate facet counts over ``products``: products per price bucket (one
+    entry per bucket, empty ones included), per payment method id and by
+    stock availability.
+    """
+    price_counts = [0] * (len(PRICE_BUCKET_EDGES) + 1)
+    payment_methods = Counter()
+    in_stock = 0
+    for product in products:
+        price_counts[bisect_right(PRICE_BUCKET_EDGES, product.get("price", 0))] += 1
+        payment_methods.update(product.get("payment_methods_ids", []))
+        if has_stock(product):
+            in_stock += 1
+    bounds = (0,) + PRICE_BUCKET_EDGES + (None,)
+    return {
+        "price_buckets": [
+            {"min": bounds[i], "max": bounds[i + 1], "count": count}
+            for i, count in enumerate(price_counts)
+        ],
+        "payment_methods": dict(sorted(payment_methods.items())),
+        "stock": {"in_stock": in_stock, "out_of_stock": len(products) - in_stock},
+    }
+
+
+class SortedColumn:
+    """
+    A numeric product column sorted once at load: ``values`` in sort order
+    and the catalog ``positions`` of the rows holding them. Ties keep catalog
+    order in both directions, so range scans return stable orderings. With
+    ``where`` only the rows satisfying it are indexed.
+    """
+
+    __slots__ = ("values", "positions", "descending")
+
+    def __init__(self, rows: list[dict], field: str, descending: bool = False, where=None):
+        sign = -1 if descending else 1
+        pairs = sorted(
+            (sign * (row.get(field) or 0), pos)
+            for pos, row in enumerate(rows)
+            if where is None or where(row)
+        )
+        self.values = [value for value, _ in pairs]
+        self.positions = [pos for _, pos in pairs]
+        self.descending = descending
+
+    def bounds(self, low=None, high=None) -> tuple[int, int]:
+        """Return the ``[start, end)`` window of ``positions`` whose value is within ``[low, high]``."""
+        if self.descending:
+            low, high = (-high if high is not None else None), (-low if low is not None else None)
+        start = bisect_left(self.values, low) if low is not None else 0
+        end = bisect_right(self.values, high) if high is not None else len(self.values)
+        # Con un rango invertido (low > high) la ventana queda vacía en lugar de negativa
+        return start, max(start, end)
+
+    def range(self, low=None, high=None) -> list[int]:
+        """Return the positions whose value is within ``[low, high]`` (open ends when None), in column order."""
+        start, end = self.bounds(low, high)
+        return self.positions[start:end]
+
+
+def has_stock(product: dict) -> bool:
+    return (product.get("stock") or 0) > 0
+
+
+class ReviewOrderings:
+    """
+    The reviews of one product pre-sorted for every supported listing:
+    descending by each sort key, and per rating value by date.
+    """
+
+    __slots__ = ("by_sort", "by_rating")
+
+    def __init__(self, reviews: list[dict]):
+        self.by_sort = {name: sorted(reviews, key=key, reverse=True) for name, key in REVIEW_SORT_KEYS.items()}
+        self.by_rating = {rating: [] for rating in REVIEW_RATINGS}
+        for review in self.by_sort["date"]:
+            bucket = self.by_rating.get(review.get("rating"))
+            if bucket is not None:
+                bucket.append(review)
+
+
+class DataSnapshot(dict):
+    """
+    The loaded tables plus lookup indexes built once per load.
+
+    Behaves exactly like the plain ``{table: rows}`` dict it wraps, so every
+    function taking ``db`` keeps working; the repository helpers use the
+    indexes when they get a snapshot and fall back to scans for plain dicts.
+    Rows are shared between tables and indexes, never copied.
+    """
+
+    def __init__(self, tables: dict[str, list[dict]], version: int = 0):
+        super().__init__(tables)
+        self.version = version
+        self.by_id = {
+            table: {row["id"]: row for row in rows if "id" in row}
+            for table, rows in tables.items()
+        }
+        self.groups = {}
+        for table, key in GROUP_KEYS:
+            groups = defaultdict(list)
+            for row in tables.get(table, []):
+                groups[row.get(key)].append(row)
+            self.groups[(table, key)] = dict(groups)
+        # Índice invertido categoría -> productos (en orden de catálogo) y sus facetas
+        category_products = defaultdict(list)
+        for product in tables.get("products", []):
+            for category_id in product.get("category_ids") or ():
+                category_products[category_id].append(product)
+        self.category_products = dict(category_products)
+        self.category_facets = {
+            category_id: compute_facets(products)
+            for category_id, products in self.category_products.items()
+        }
+        products = tables.get("products", [])
+        self.columns = {
+            "price": SortedColumn(products, "price"),
+            "price_desc": SortedColumn(products, "price", descending=True),
+            "price_in_stock": SortedColumn(products, "price", where=has_stock),
+            "price_desc_in_stock": SortedColumn(products, "price", descending=True, where=has_stock),
+        }
+        # Posiciones en orden de catálogo de los productos con stock
+        self.in_stock_positions = [pos for pos, product in enumerate(products) if has_stock(product)]
+        self.search_index = SearchIndex(tables.get("products", []))
+        self.product_reviews = {
+            product_id: ReviewOrderings(reviews)
+            for product_id, reviews in self.groups[("reviews", "product_id")].items()
+        }
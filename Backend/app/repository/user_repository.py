@@ -0,0 +1,138 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional
+
+import bcrypt
+
+try:
+    from . import DATA_DIR, load_and_validate_json
+    from ..core.logger import logger
+except ImportError:
+    from app.repository import DATA_DIR, load_and_validate_json
+    from app.core.logger import logger
+
+USERS_PATH = os.path.join(DATA_DIR, "user.json")
+USERS_RELOAD_INTERVAL_SECONDS = 2.0
+# Hashes bcrypt recordados de contraseñas legacy en texto plano (LRU acotado)
+HASH_MEMO_MAX_ENTRIES = 1024
+
+BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+
+
+def is_bcrypt_hash(value: str) -> bool:
+    return isinstance(value, str) and value.startswith(BCRYPT_PREFIXES) and len(value) == 60
+
+
+class UserRepository:
+    """
+    Username-indexed user store loaded from ``user.json``.
+
+    Records are normalized once at load time so that a login is a single dict
+    lookup plus one bcrypt check, regardless of how many users exist. Stored
+    passwords may be bcrypt hashes (``password``/``pwd``) or legacy plain text
+    (``pwd``), which is hashed when the file is loaded. The file is re-read
+    when its mtime changes, checked at most once per ``reload_interval``.
+
+    :param path: Path to the users JSON file.
+    :param seed_users: Users always present, overridden by file entries with the same username.
+    :param reload_interval: Minimum seconds between mtime checks.
+    """
+
+    def __init__(self, path: str = USERS_PATH, seed_users: Optional[list[dict]] = None,
+                 reload_interval: float = USERS_RELOAD_INTERVAL_SECONDS):
+        self.path = path
+        self.seed_users = list(seed_users or [])
+        self.reload_interval = reload_interval
+        self._users: dict[str, dict] = {}
+        self._mtime: Optional[float] = None
+        self._next_check = 0.0
+        self._hash_memo: OrderedDict[tuple[str, str], str] = OrderedDict()
+        self._lock = threading.Lock()
+        self.reload()
+
+    def _hash_plain_password(self, username: str, plain: str) -> str:
+        # Hot reloads should not pay bcrypt again for unchanged legacy passwords.
+        # The memo is keyed by a digest so plain passwords are not kept in memory.
+        memo_key = (username, hashlib.sha256(plain.encode("utf-8")).hexdigest())
+        hashed = self._hash_memo.get(memo_key)
+        if hashed is not None:
+            self._hash_memo.move_to_end(memo_key)
+            return hashed
+        hashed = bcrypt.hashpw(plain.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+        self._hash_memo[memo_key] = hashed
+        while len(self._hash_memo) > HASH_MEMO_MAX_ENTRIES:
+            self._hash_memo.popitem(last=False)
+        return hashed
+
+    def _normalize(self, raw: dict) -> Optional[dict]:
+        username = raw.get("username")
+        secret = raw.get("password") or raw.get("pwd")
+        if not username or not secret:
+            logger.warning("Skipping user entry without username or password")
+            return None
+        password_hash = secret if is_bcrypt_hash(secret) else self._hash_plain_password(username, secret)
+        return {
+            "username": username,
+            "email": raw.get("email"),
+            "role": raw.get("role", "user"),
+            "active": bool(raw.get("active", True)),
+            "password": password_hash,
+        }
+
+    def _read_mtime(self) -> Optional[float]:
+        try:
+            return os.stat(self.path).st_mtime
+        except OSError:
+            return None
+
+    def reload(self) -> None:
+        """Rebuild the username index from the seed users and the users file."""
+        with self._lock:
+            mtime = self._read_mtime()
+            raw_users = list(self.seed_users)
+            if mtime is not None:
+                try:
+                    raw_users.extend(load_and_validate_json(self.path))
+                except Exception as e:
+                    logger.error("Error loading users from %s: %s", self.path, e)
+                    return
+            else:
+                logger.warning("Users file not found: %s. Only built-in users are available.", self.path)
+            users: dict[str, dict] = {}
+            for raw in raw_users:
+                user = self._normalize(raw)
+                if user:
+                    users[user["username"]] = user
+            self._users = users
+            self._mtime = mtime
+            self._next_check = time.monotonic() + self.reload_interval
+            logger.info("Loaded %d users", len(users))
+
+    def _maybe_reload(self) -> None:
+        now = time.monotonic()
+        if now < self._next_check:
+            return
+        self._next_check = now + self.reload_interval
+        if self._read_mtime() != self._mtime:
+            self.reload()
+
+    def get(self, username: str) -> Optional[dict]:
+        """Return the user record for ``username`` or None."""
+        self._maybe_reload()
+        return self._users.get(username)
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+
+@lru_cache(maxsize=1)
+def get_user_repository() -> UserRepository:
+    try:
+        from ..core.security import fake_user
+    except ImportError:
+        from app.core.security import fake_user
+    return UserRepository(seed_users=[fake_user])
@@ -0,0 +1,27 @@
+from pydantic import BaseModel
+from typing import Dict, List, Optional
+from .category import CategorySchema
+from .page import Page
+from .product import ProductSchema
+
+class PriceBucket(BaseModel):
+    """Number of products whose price falls in [min, max); max is None for the open-ended bucket."""
+    min: float
+    max: Optional[float] = None
+    count: int
+
+class StockFacet(BaseModel):
+    """Number of products with and without stock."""
+    in_stock: int
+    out_of_stock: int
+
+class CategoryFacets(BaseModel):
+    """Facet counts over every product in a category."""
+    price_buckets: List[PriceBucket]
+    payment_methods: Dict[int, int]  # payment method id -> product count
+    stock: StockFacet
+
+class CategoryProductsPage(Page[ProductSchema]):
+    """Schema representing a page of a category's products with its facet counts."""
+    category: CategorySchema
+    facets: CategoryFacets
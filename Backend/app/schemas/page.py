@@ -0,0 +1,18 @@
+from pydantic import BaseModel
+from typing import Generic, List, TypeVar
+
+T = TypeVar("T")
+
+class Page(BaseModel, Generic[T]):
+    """Schema representing one page of a paginated listing."""
+    items: List[T]
+    total: int
+    page: int
+    page_size: int
+    pages: int
+
+    @classmethod
+    def from_slice(cls, items: list, total: int, page: int, page_size: int, **extra):
+        """Build a page from its already sliced ``items`` and the ``total`` row count."""
+        return cls(items=items, total=total, page=page, page_size=page_size,
+                   pages=(total + page_size - 1) // page_size, **extra)
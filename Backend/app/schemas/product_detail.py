@@ -0,0 +1,11 @@
+from typing import List, Optional
+from .page import Page
+from .product import ProductSchema
+from .review import ReviewSchema
+from .seller import SellerSchema
+
+class ProductDetailSchema(ProductSchema):
+    """Schema representing a product with the related resources requested through ``include``."""
+    seller: Optional[SellerSchema] = None
+    review_page: Optional[Page[ReviewSchema]] = None
+    similar: Optional[List[ProductSchema]] = None
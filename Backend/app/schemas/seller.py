@@ -1,6 +1,8 @@
 from typing import Optional
 from pydantic import BaseModel
 from .general_rating import GeneralRating
+from .page import Page
+from .product import ProductSchema
 
 class SellerSchema(BaseModel):
     """Schema representing a seller."""
@@ -9,4 +11,8 @@ class SellerSchema(BaseModel):
     location: str
     email: str
     phone: str
-    rating_info: Optional[GeneralRating] = None
\ No newline at end of file
+    rating_info: Optional[GeneralRating] = None
+
+class SellerProductsPage(Page[ProductSchema]):
+    """Schema representing a page of a seller's products, with the seller and its rating once."""
+    seller: SellerSchema
@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+from typing import Optional
+
+class TokenSchema(BaseModel):
+    """Schema representing an issued access/refresh token pair."""
+    access_token: str
+    refresh_token: str
+    token_type: str = "bearer"
+
+class RefreshTokenRequest(BaseModel):
+    """Schema for exchanging or revoking a refresh token."""
+    refresh_token: Optional[str] = None
@@ -1,28 +1,56 @@
 try:
-    from ..repository import get_all, get_item_by_id
+    from ..repository import get_all, get_item_by_id, get_category_products, get_category_facets, slice_page
     from ..schemas.category import CategorySchema
+    from ..schemas.category_products import CategoryProductsPage
+    from ..schemas.product import ProductSchema
+    from .product_service import enrich_product
     from ..core.logger import logger
+    from ..core.metrics import timed
 except ImportError:
-    from app.repository import get_all, get_item_by_id
+    from app.repository import get_all, get_item_by_id, get_category_products, get_category_facets, slice_page
     from app.schemas.category import CategorySchema
+    from app.schemas.category_products import CategoryProductsPage
+    from app.schemas.product import ProductSchema
+    from app.services.product_service import enrich_product
     from app.core.logger import logger
+    from app.core.metrics import timed
 
+@timed("category_service.list_categories")
 def list_categories(db: dict) -> list[CategorySchema]:
     logger.info("Starting to list all categories")
     try:
         categories = [CategorySchema.model_validate(obj) for obj in get_all(db, "categories")]
-        logger.info(f"Successfully retrieved {len(categories)} categories")
+        logger.info("Successfully retrieved %d categories", len(categories))
         return categories
     except Exception as e:
-        logger.error(f"Error listing categories: {e}")
+        logger.error("Error listing categories: %s", e)
         raise
 
+@timed("category_service.get_category_by_id")
 def get_category_by_id(db: dict, category_id: int) -> CategorySchema:
-    logger.info(f"Getting category by id: {category_id}")
+    logger.info("Getting category by id: %s", category_id)
     try:
         category = CategorySchema.model_validate(get_item_by_id(db, "categories", category_id))
-        logger.info(f"Successfully retrieved category with id: {category_id}")
+        logger.info("Successfully retrieved category with id: %s", category_id)
         return category
     except Exception as e:
-        logger.error(f"Error getting category by id {category_id}: {e}")
-        raise
\ No newline at end of file
+        logger.error("Error getting category by id %s: %s", category_id, e)
+        raise
+
+@timed("category_service.get_category_products_page")
+def get_category_products_page(db: dict, category_id: int, page: int = 1, page_size: int = 20) -> CategoryProductsPage:
+    """Return one page of a category's products, in catalog order, with facet counts over the whole category."""
+    logger.info("Getting products page %s for category id: %s", page, category_id)
+    try:
+        category = get_category_by_id(db, category_id)
+        products = get_category_products(db, category_id)
+        items = [
+            ProductSchema.model_validate(enrich_product(obj, db))
+            for obj in slice_page(products, page, page_size)
+        ]
+        logger.info("Retrieved %d of %d products for category id: %s", len(items), len(products), category_id)
+        return CategoryProductsPage.from_slice(items, len(products), page, page_size,
+                                               category=category, facets=get_category_facets(db, category_id))
+    except Exception as e:
+        logger.error("Error getting products for category id %s: %s", category_id, e)
+        raise
@@ -0,0 +1,170 @@
+import hashlib
+import os
+import tempfile
+import threading
+from io import BytesIO
+
+import requests
+
+try:
+    from ..repository import get_item_by_id
+    from ..core.logger import logger
+    from ..core.metrics import timed, record_cache
+except ImportError:
+    from app.repository import get_item_by_id
+    from app.core.logger import logger
+    from app.core.metrics import timed, record_cache
+
+# Variantes generadas por imagen: (ancho, alto, modo). "crop" recorta al centro
+# y escala al tamaño exacto; "fit" escala conservando la proporción dentro del tamaño
+IMAGE_VARIANTS = {
+    "carousel": (250, 400, "crop"),
+    "thumb": (70, 70, "fit"),
+}
+IMAGE_VARIANT_DIR = os.getenv("IMAGE_VARIANT_DIR", os.path.join(tempfile.gettempdir(), "meli_image_variants"))
+# Espejo local opcional de las imágenes originales, con un archivo por URL nombrado sha256(url)
+IMAGE_MIRROR_DIR = os.getenv("IMAGE_MIRROR_DIR")
+IMAGE_FETCH_TIMEOUT = float(os.getenv("IMAGE_FETCH_TIMEOUT", "5"))
+IMAGE_MAX_SOURCE_BYTES = int(os.getenv("IMAGE_MAX_SOURCE_BYTES", str(20 * 1024 * 1024)))
+JPEG_QUALITY = 85
+# Tiempo que clientes y proxies pueden reutilizar una variante sin revalidar (una semana)
+IMAGE_VARIANT_MAX_AGE = int(os.getenv("IMAGE_VARIANT_MAX_AGE", str(7 * 24 * 60 * 60)))
+
+# Un lock por imagen de origen en proceso, para descargarla y procesarla una sola vez aunque lleguen
+# peticiones simultáneas; cada entrada cuenta sus usuarios y la descarta el último en salir
+_source_locks: dict[str, list] = {}
+_source_locks_guard = threading.Lock()
+
+
+def _load_pillow():
+    """Import Pillow on first use; it is only needed to generate variants, not to serve cached ones."""
+    try:
+        from PIL import Image
+    except ImportError as e:
+        raise RuntimeError("Pillow is required to generate image variants (pip install Pillow)") from e
+    return Image
+
+
+def source_key(url: str) -> str:
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+def variant_path(url: str, variant: str) -> str:
+    return os.path.join(IMAGE_VARIANT_DIR, f"{source_key(url)}_{variant}.jpg")
+
+
+def _source_lock(key: str) -> threading.Lock:
+    """Return ``key``'s lock, registering the caller until it calls ``_release_source_lock``."""
+    with _source_locks_guard:
+        entry = _source_locks.get(key)
+        if entry is None:
+            entry = _source_locks[key] = [threading.Lock(), 0]
+        entry[1] += 1
+        return entry[0]
+
+
+def _release_source_lock(key: str) -> None:
+    """
+    Unregister the caller from ``key``'s lock and forget the lock when no
+    request holds or waits on it; later requests find the files instead.
+    Waiters keep the entry alive, so a failed generation is retried under
+    the same lock rather than alongside a fresh one.
+    """
+    with _source_locks_guard:
+        entry = _source_locks[key]
+        entry[1] -= 1
+        if entry[1] == 0:
+            del _source_locks[key]
+
+
+def read_source(url: str) -> bytes:
+    """Read the original image from the local mirror when present, otherwise download it."""
+    if IMAGE_MIRROR_DIR:
+        mirror_path = os.path.join(IMAGE_MIRROR_DIR, source_key(url))
+        if os.path.exists(mirror_path):
+            with open(mirror_path, "rb") as f:
+                return f.read()
+    with requests.get(url, timeout=IMAGE_FETCH_TIMEOUT, stream=True) as resp:
+        resp.raise_for_status()
+        content = resp.raw.read(IMAGE_MAX_SOURCE_BYTES + 1, decode_content=True)
+    if len(content) > IMAGE_MAX_SOURCE_BYTES:
+        raise OSError(f"Source image exceeds {IMAGE_MAX_SOURCE_BYTES} bytes")
+    return content
+
+
+def render_variant(image, width: int, height: int, mode: str):
+    """Return ``image`` resized to one variant: center-cropped to the exact size, or fitted inside it."""
+    Image = _load_pillow()
+    if mode == "fit":
+        image = image.copy()
+        image.thumbnail((width, height), Image.LANCZOS)
+        return image
+    target_ratio = width / height
+    if image.width / image.height > target_ratio:
+        new_width = int(image.height * target_ratio)
+        left = (image.width - new_width) // 2
+        image = image.crop((left, 0, left + new_width, image.height))
+    else:
+        new_height = int(image.width / target_ratio)
+        top = (image.height - new_height) // 2
+        image = image.crop((0, top, image.width, top + new_height))
+    return image.resize((width, height), Image.LANCZOS)
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def generate_variants(url: str) -> None:
+    """Fetch ``url`` once and store every variant of it in the variant cache."""
+    Image = _load_pillow()
+    image = Image.open(BytesIO(read_source(url))).convert("RGB")
+    os.makedirs(IMAGE_VARIANT_DIR, exist_ok=True)
+    for variant, (width, height, mode) in IMAGE_VARIANTS.items():
+        buf = BytesIO()
+        render_variant(image, width, height, mode).save(buf, format="JPEG", quality=JPEG_QUALITY, optimize=True)
+        _write_atomic(variant_path(url, variant), buf.getvalue())
+
+
+@timed("image_service.get_product_image_variant")
+def get_product_image_variant(db: dict, product_id: int, index: int, variant: str) -> str:
+    """
+    Return the path of the cached ``variant`` of the product's ``index``-th
+    image, generating all variants of that image on the first request.
+    Raises ValueError for an unknown product, image index or variant.
+    """
+    if variant not in IMAGE_VARIANTS:
+        raise ValueError(f"Unknown image variant: {variant}")
+    product = get_item_by_id(db, "products", product_id)
+    if not product:
+        raise ValueError("Product not found")
+    images = product.get("images") or []
+    if not 0 <= index < len(images):
+        raise ValueError("Image not found")
+    url = images[index]
+    path = variant_path(url, variant)
+    if os.path.exists(path):
+        record_cache("image_variants", hit=True)
+        return path
+    key = source_key(url)
+    lock = _source_lock(key)
+    try:
+        with lock:
+            # Otra petición pudo generarla mientras se esperaba el lock
+            if not os.path.exists(path):
+                record_cache("image_variants", hit=False)
+                logger.info("Generating image variants for product %s image %s", product_id, index)
+                generate_variants(url)
+    finally:
+        _release_source_lock(key)
+    return path
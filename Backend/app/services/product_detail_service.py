@@ -0,0 +1,42 @@
+try:
+    # Relative imports for when running as module
+    from ..schemas.product_detail import ProductDetailSchema
+    from .product_service import get_product_by_id, get_similar_products
+    from .review_service import get_product_reviews_page
+    from .seller_service import get_seller_by_id
+    from ..core.logger import logger
+    from ..core.metrics import timed
+except ImportError:
+    # Absolute imports for when running directly
+    from app.schemas.product_detail import ProductDetailSchema
+    from app.services.product_service import get_product_by_id, get_similar_products
+    from app.services.review_service import get_product_reviews_page
+    from app.services.seller_service import get_seller_by_id
+    from app.core.logger import logger
+    from app.core.metrics import timed
+
+# Recursos que se pueden incrustar en el detalle de un producto con ?include=
+PRODUCT_INCLUDES = ("seller", "reviews", "similar")
+
+
+@timed("product_detail_service.get_product_detail")
+def get_product_detail(db: dict, product_id: int, include: tuple[str, ...] = (),
+                       reviews_page_size: int = 5, similar_limit: int = 4) -> ProductDetailSchema:
+    """
+    Return a product with the requested related resources embedded: its
+    seller (with rating), the first page of its reviews (newest first) and
+    its similar products. A product whose seller no longer exists gets a
+    null ``seller`` rather than failing.
+    """
+    product = get_product_by_id(db, product_id)
+    detail = ProductDetailSchema.model_validate(product, from_attributes=True)
+    if "seller" in include:
+        try:
+            detail.seller = get_seller_by_id(db, product.seller_id)
+        except ValueError:
+            logger.warning("Seller %s of product %s not found", product.seller_id, product_id)
+    if "reviews" in include:
+        detail.review_page = get_product_reviews_page(db, product_id, 1, reviews_page_size)
+    if "similar" in include:
+        detail.similar = get_similar_products(db, product_id, similar_limit)
+    return detail
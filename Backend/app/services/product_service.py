@@ -1,21 +1,32 @@
+import logging
+
 try:
     from ..schemas.product import ProductSchema
     from ..schemas.category import CategorySchema
     from ..schemas.payment_method import PaymentMethodSchema
-    from ..repository import get_all, get_item_by_id
+    from ..repository import get_all, get_item_by_id, query_products, search_products as search_product_rows
+    from ..schemas.page import Page
     from .review_service import generate_general_rating
     from ..core.logger import logger
+    from ..core.metrics import timed
 except ImportError:
     from app.schemas.product import ProductSchema
     from app.schemas.category import CategorySchema
     from app.schemas.payment_method import PaymentMethodSchema
-    from app.repository import get_all, get_item_by_id
+    from app.repository import get_all, get_item_by_id, query_products, search_products as search_product_rows
+    from app.schemas.page import Page
     from app.services.review_service import generate_general_rating
     from app.core.logger import logger
+    from app.core.metrics import timed
 
+@timed("product_service.enrich_product")
 def enrich_product(obj: dict, db: dict) -> dict:
-    logger.debug(f"Enriching product with id: {obj.get('id')}")
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug("Enriching product with id: %s", obj.get('id'))
     try:
+        # Copia superficial: las filas del snapshot se comparten entre índices y peticiones
+        obj = dict(obj)
         category_ids = set(obj.get("category_ids", []))
         payment_methods_ids = set(obj.get("payment_methods_ids", []))
 
@@ -36,12 +47,14 @@ def enrich_product(obj: dict, db: dict) -> dict:
         general_rating = generate_general_rating(db, "product_id", obj["id"])
         obj["rating_info"] = general_rating
 
-        logger.debug(f"Successfully enriched product with id: {obj.get('id')}")
+        if debug:
+            logger.debug("Successfully enriched product with id: %s", obj.get('id'))
         return obj
     except Exception as e:
-        logger.error(f"Error enriching product with id {obj.get('id')}: {e}")
+        logger.error("Error enriching product with id %s: %s", obj.get('id'), e)
         raise RuntimeError(f"Error enriching product: {e}")
 
+@timed("product_service.list_products")
 def list_products(db: dict) -> list[ProductSchema]:
     logger.info("Starting to list all products")
     try:
@@ -49,30 +62,48 @@ def list_products(db: dict) -> list[ProductSchema]:
             ProductSchema.model_validate(enrich_product(obj, db))
             for obj in get_all(db, "products")
         ]
-        logger.info(f"Successfully retrieved {len(products)} products")
+        logger.info("Successfully retrieved %d products", len(products))
         return products
     except Exception as e:
-        logger.error(f"Error listing products: {e}")
+        logger.error("Error listing products: %s", e)
+        raise RuntimeError(f"Error listing products: {e}")
+
+@timed("product_service.list_products_page")
+def list_products_page(db: dict, page: int = 1, page_size: int = 20, min_price: float | None = None,
+                       max_price: float | None = None, in_stock: bool = False,
+                       sort: str | None = None) -> Page[ProductSchema]:
+    """Return one page of the products matching the price/stock filters, optionally sorted by price."""
+    logger.info("Listing products page %s (min_price=%s, max_price=%s, in_stock=%s, sort=%s)",
+                page, min_price, max_price, in_stock, sort)
+    try:
+        products, total = query_products(db, min_price, max_price, in_stock, sort, page, page_size)
+        items = [ProductSchema.model_validate(enrich_product(obj, db)) for obj in products]
+        logger.info("Retrieved %d of %d matching products", len(items), total)
+        return Page[ProductSchema].from_slice(items, total, page, page_size)
+    except Exception as e:
+        logger.error("Error listing products page: %s", e)
         raise RuntimeError(f"Error listing products: {e}")
 
+@timed("product_service.get_product_by_id")
 def get_product_by_id(db: dict, product_id: int) -> ProductSchema:
-    logger.info(f"Getting product by id: {product_id}")
+    logger.info("Getting product by id: %s", product_id)
     try:
         obj = get_item_by_id(db, "products", product_id)
         product = ProductSchema.model_validate(enrich_product(obj, db))
-        logger.info(f"Successfully retrieved product with id: {product_id}")
+        logger.info("Successfully retrieved product with id: %s", product_id)
         return product
     except Exception as e:
-        logger.error(f"Error getting product by id {product_id}: {e}")
+        logger.error("Error getting product by id %s: %s", product_id, e)
         raise RuntimeError(f"Error getting product by id {product_id}: {e}")
 
+@timed("product_service.get_similar_products")
 def get_similar_products(db: dict, product_id: int, limit: int = 5) -> list[ProductSchema]:
-    logger.info(f"Getting similar products for product id: {product_id}")
+    logger.info("Getting similar products for product id: %s", product_id)
     obj = get_item_by_id(db, "products", product_id)
     product = ProductSchema.model_validate(obj)
     target_categories = set(getattr(product, "category_ids", []))
     if not target_categories:
-        logger.info(f"No categories found for product id: {product_id}. Returning empty list.")
+        logger.info("No categories found for product id: %s. Returning empty list.", product_id)
         return []
     all_products = [ProductSchema.model_validate(obj) for obj in get_all(db, "products")]
     similarities = []
@@ -86,5 +117,19 @@ def get_similar_products(db: dict, product_id: int, limit: int = 5) -> list[Prod
             similarities.append((shared, p))
     similarities.sort(key=lambda x: (-x[0], x[1].id))
     top_products = [p for _, p in similarities[:limit]]
-    logger.info(f"Found {len(top_products)} similar products for product id: {product_id}")
-    return top_products
\ No newline at end of file
+    logger.info("Found %d similar products for product id: %s", len(top_products), product_id)
+    return top_products
+
+@timed("product_service.search_products")
+def search_products(db: dict, query: str, limit: int = 20) -> list[ProductSchema]:
+    logger.info("Searching products for query: %r", query)
+    try:
+        products = [
+            ProductSchema.model_validate(enrich_product(obj, db))
+            for obj in search_product_rows(db, query, limit)
+        ]
+        logger.info("Found %d products for query: %r", len(products), query)
+        return products
+    except Exception as e:
+        logger.error("Error searching products for query %r: %s", query, e)
+        raise RuntimeError(f"Error searching products: {e}")
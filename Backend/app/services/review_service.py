@@ -1,75 +1,103 @@
+import logging
 from collections import Counter
 
 try:
     # Relative imports for when running as module
     from ..schemas.general_rating import GeneralRating
-    from ..repository import get_all, get_item_by_id
+    from ..repository import get_all, get_item_by_id, get_items_by_key, get_sorted_product_reviews, slice_page
     from ..schemas.review import ReviewSchema
+    from ..schemas.page import Page
     from ..core.logger import logger
+    from ..core.metrics import timed
 except ImportError:
     # Absolute imports for when running directly
     from app.schemas.general_rating import GeneralRating
-    from app.repository import get_all, get_item_by_id
+    from app.repository import get_all, get_item_by_id, get_items_by_key, get_sorted_product_reviews, slice_page
     from app.schemas.review import ReviewSchema
+    from app.schemas.page import Page
     from app.core.logger import logger
+    from app.core.metrics import timed
 
+@timed("review_service.list_reviews")
 def list_reviews(db: dict) -> list[ReviewSchema]:
     logger.info("Starting to list all reviews")
     try:
         reviews = [ReviewSchema.model_validate(obj) for obj in get_all(db, "reviews")]
-        logger.info(f"Successfully retrieved {len(reviews)} reviews")
+        logger.info("Successfully retrieved %d reviews", len(reviews))
         return reviews
     except Exception as e:
-        logger.error(f"Error listing reviews: {e}")
+        logger.error("Error listing reviews: %s", e)
         raise
 
+@timed("review_service.get_review_by_id")
 def get_review_by_id(db: dict, review_id: int) -> ReviewSchema:
-    logger.info(f"Getting review by id: {review_id}")
+    logger.info("Getting review by id: %s", review_id)
     try:
         review = ReviewSchema.model_validate(get_item_by_id(db, "reviews", review_id))
-        logger.info(f"Successfully retrieved review with id: {review_id}")
+        logger.info("Successfully retrieved review with id: %s", review_id)
         return review
     except Exception as e:
-        logger.error(f"Error getting review by id {review_id}: {e}")
+        logger.error("Error getting review by id %s: %s", review_id, e)
         raise
 
+@timed("review_service.get_reviews_by_key")
 def get_reviews_by_key(db: dict, key: str, id: int) -> list[dict]:
-    logger.debug(f"Getting reviews by {key}: {id}")
+    logger.debug("Getting reviews by %s: %s", key, id)
     try:
-        filtered_reviews = [r for r in db["reviews"] if r[key] == id]
-        logger.debug(f"Found {len(filtered_reviews)} reviews for {key}: {id}")
+        filtered_reviews = get_items_by_key(db, "reviews", key, id)
+        logger.debug("Found %d reviews for %s: %s", len(filtered_reviews), key, id)
         return filtered_reviews
     except Exception as e:
-        logger.error(f"Error getting reviews by {key} {id}: {e}")
+        logger.error("Error getting reviews by %s %s: %s", key, id, e)
+        raise
+
+@timed("review_service.get_product_reviews_page")
+def get_product_reviews_page(db: dict, product_id: int, page: int = 1, page_size: int = 20,
+                             sort: str = "date", order: str = "desc", rating: int | None = None) -> Page[ReviewSchema]:
+    """Return one page of a product's reviews sorted by date or rating, optionally filtered by rating."""
+    logger.info("Getting reviews page %s for product id: %s", page, product_id)
+    try:
+        get_item_by_id(db, "products", product_id)
+        reviews = get_sorted_product_reviews(db, product_id, sort, rating)
+        total = len(reviews)
+        items = slice_page(reviews, page, page_size, reverse=order == "asc")
+        review_page = Page[ReviewSchema].from_slice(
+            [ReviewSchema.model_validate(r) for r in items], total, page, page_size)
+        logger.info("Retrieved %d of %d reviews for product id: %s", len(items), total, product_id)
+        return review_page
+    except Exception as e:
+        logger.error("Error getting reviews for product id %s: %s", product_id, e)
         raise
 
 def calculate_ratings_count(reviews: list[dict]) -> dict:
     """Return a dict with the count of each rating (1-5)."""
-    logger.debug(f"Calculating ratings count for {len(reviews)} reviews")
+    logger.debug("Calculating ratings count for %d reviews", len(reviews))
     try:
         ratings_counter = Counter(r["rating"] for r in reviews)
         ratings_count = {i: ratings_counter.get(i, 0) for i in range(5, 0, -1)}
-        logger.debug(f"Ratings count calculated: {ratings_count}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Ratings count calculated: %s", ratings_count)
         return ratings_count
     except Exception as e:
-        logger.error(f"Error calculating ratings count: {e}")
+        logger.error("Error calculating ratings count: %s", e)
         raise
 
 def calculate_average_rating(reviews: list[dict]) -> float:
     """Return the average rating for the given reviews."""
-    logger.debug(f"Calculating average rating for {len(reviews)} reviews")
+    logger.debug("Calculating average rating for %d reviews", len(reviews))
     try:
         total_reviews = len(reviews)
         total_score = sum(r["rating"] for r in reviews)
         avg_rating = round(total_score / total_reviews, 2) if total_reviews > 0 else 0
-        logger.debug(f"Average rating calculated: {avg_rating}")
+        logger.debug("Average rating calculated: %s", avg_rating)
         return avg_rating
     except Exception as e:
-        logger.error(f"Error calculating average rating: {e}")
+        logger.error("Error calculating average rating: %s", e)
         raise
 
+@timed("review_service.generate_general_rating")
 def generate_general_rating(db: dict, key: str, id: int) -> GeneralRating:
-    logger.info(f"Generating general rating for {key}: {id}")
+    logger.debug("Generating general rating for %s: %s", key, id)
     try:
         filtered_reviews = get_reviews_by_key(db, key, id)
         ratings_count = calculate_ratings_count(filtered_reviews)
@@ -81,8 +109,8 @@ def generate_general_rating(db: dict, key: str, id: int) -> GeneralRating:
             ratings_count=ratings_count,
             average_rating=avg_rating
         )
-        logger.info(f"Successfully generated general rating for {key}: {id} - {total_reviews} reviews, avg: {avg_rating}")
+        logger.debug("Successfully generated general rating for %s: %s - %s reviews, avg: %s", key, id, total_reviews, avg_rating)
         return general_rating
     except Exception as e:
-        logger.error(f"Error generating general rating for {key} {id}: {e}")
+        logger.error("Error generating general rating for %s %s: %s", key, id, e)
         raise
\ No newline at end of file
@@ -1,39 +1,64 @@
 try:
     # Relative imports for when running as module
-    from ..schemas.seller import SellerSchema
-    from ..repository import get_all, get_item_by_id
+    from ..schemas.seller import SellerSchema, SellerProductsPage
+    from ..schemas.product import ProductSchema
+    from ..repository import get_all, get_item_by_id, get_items_by_key, slice_page
     from .review_service import generate_general_rating
+    from .product_service import enrich_product
     from ..core.logger import logger
+    from ..core.metrics import timed
 except ImportError:
     # Absolute imports for when running directly
-    from app.schemas.seller import SellerSchema
-    from app.repository import get_all, get_item_by_id
+    from app.schemas.seller import SellerSchema, SellerProductsPage
+    from app.schemas.product import ProductSchema
+    from app.repository import get_all, get_item_by_id, get_items_by_key, slice_page
     from app.services.review_service import generate_general_rating
+    from app.services.product_service import enrich_product
     from app.core.logger import logger
+    from app.core.metrics import timed
 
 
+@timed("seller_service.list_sellers")
 def list_sellers(db: dict) -> list[SellerSchema]:
     logger.info("Starting to list all sellers")
     try:
         seller_schemas = [SellerSchema.model_validate(obj) for obj in get_all(db, "sellers")]
-        logger.info(f"Successfully retrieved {len(seller_schemas)} sellers")
+        logger.info("Successfully retrieved %d sellers", len(seller_schemas))
         return seller_schemas
     except Exception as e:
-        logger.error(f"Error listing sellers: {e}")
+        logger.error("Error listing sellers: %s", e)
         raise
 
+@timed("seller_service.get_seller_by_id")
 def get_seller_by_id(db: dict, seller_id: int) -> SellerSchema | None:
-    logger.info(f"Getting seller by id: {seller_id}")
+    logger.info("Getting seller by id: %s", seller_id)
     try:
         seller = get_item_by_id(db, "sellers", seller_id)
         if not seller:
-            logger.warning(f"Seller with id {seller_id} not found")
+            logger.warning("Seller with id %s not found", seller_id)
             raise ValueError("Seller not found")
         seller_response = SellerSchema.model_validate(seller)
         rating_info = generate_general_rating(db, "seller_id", seller_id)
         seller_response.rating_info = rating_info
-        logger.info(f"Successfully retrieved seller with id: {seller_id}")
+        logger.info("Successfully retrieved seller with id: %s", seller_id)
         return seller_response
     except Exception as e:
-        logger.error(f"Error getting seller by id {seller_id}: {e}")
-        raise
\ No newline at end of file
+        logger.error("Error getting seller by id %s: %s", seller_id, e)
+        raise
+
+@timed("seller_service.get_seller_products_page")
+def get_seller_products_page(db: dict, seller_id: int, page: int = 1, page_size: int = 20) -> SellerProductsPage:
+    """Return one page of a seller's products, in catalog order, with the seller's rating computed once."""
+    logger.info("Getting products page %s for seller id: %s", page, seller_id)
+    try:
+        seller = get_seller_by_id(db, seller_id)
+        products = get_items_by_key(db, "products", "seller_id", seller_id)
+        items = [
+            ProductSchema.model_validate(enrich_product(obj, db))
+            for obj in slice_page(products, page, page_size)
+        ]
+        logger.info("Retrieved %d of %d products for seller id: %s", len(items), len(products), seller_id)
+        return SellerProductsPage.from_slice(items, len(products), page, page_size, seller=seller)
+    except Exception as e:
+        logger.error("Error getting products for seller id %s: %s", seller_id, e)
+        raise
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Backend micro-benchmarks over synthetic catalogs.
+
+Times the repository and service hot paths at several catalog sizes, writes
+the results as JSON and compares them against a stored baseline so that
+regressions fail the run.
+
+Timings are only comparable on the machine that produced them, so the
+baseline is not committed: record one locally with ``--save-baseline``
+before making changes, then rerun without it to check for regressions.
+
+Usage (from the Backend directory)::
+
+    python -m benchmarks.bench_backend --scales 1k 100k --save-baseline
+    python -m benchmarks.bench_backend --scales 1k 100k
+    python -m benchmarks.bench_backend --scales 1m --no-limits --output results.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import sys
+import shutil
+import tempfile
+import time
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import app.repository as repository
+from app.repository import get_item_by_id, search_products, query_products
+from app.repository.snapshot import DataSnapshot
+from app.services.product_service import enrich_product, list_products, get_similar_products
+from app.services.review_service import generate_general_rating, get_product_reviews_page
+from app.core.responses import dump_json
+from fastapi.encoders import jsonable_encoder
+from benchmarks.synthetic_data import generate_catalog, parse_scale, write_catalog
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(BENCHMARKS_DIR, "baseline.json")
+DEFAULT_SCALES = ["1k", "100k"]
+DEFAULT_THRESHOLD = 1.5
+# Tamaño máximo de catálogo para el que se construye el listado completo de productos
+LISTING_MAX_PRODUCTS = 10_000
+# Diferencias por debajo de este valor se consideran ruido aunque superen el umbral relativo
+MIN_REGRESSION_MS = 0.05
+
+
+class Operation:
+    """
+    A benchmarked call.
+
+    :param name: Name used in the results file.
+    :param make_call: ``make_call(db, rng)`` returns a zero-argument callable to time. If the
+        callable has a ``close`` attribute it is called once timing is over, to release what
+        ``make_call`` set up.
+    :param max_products: Largest catalog the operation runs on unless limits are disabled.
+    """
+
+    def __init__(self, name, make_call, max_products=None):
+        self.name = name
+        self.make_call = make_call
+        self.max_products = max_products
+
+
+def _random_product_id(db, rng):
+    return rng.randint(1, len(db["products"]))
+
+
+def _time_get_db_data(db, rng):
+    directory = tempfile.mkdtemp(prefix="meli_bench_")
+    write_catalog(db, directory)
+
+    def call():
+        original = repository.DATA_DIR
+        repository.DATA_DIR = directory
+        repository.get_db_data.cache_clear()
+        try:
+            repository.get_db_data()
+        finally:
+            repository.DATA_DIR = original
+            repository.get_db_data.cache_clear()
+    call.close = lambda: shutil.rmtree(directory, ignore_errors=True)
+    return call
+
+
+def _stdlib_json(content):
+    """Encode ``content`` the way FastAPI's response_model + JSONResponse path does."""
+    return json.dumps(jsonable_encoder(content), ensure_ascii=False, allow_nan=False,
+                      indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def _time_encoding(encoder):
+    def make_call(db, rng):
+        products = list_products(db)
+        return lambda: encoder(products)
+    return make_call
+
+
+def check_json_compatibility(db):
+    """Return True when the fast encoder output matches the stdlib path byte for byte."""
+    products = list_products(db)
+    payloads = [products, products[0], get_similar_products(db, products[0].id, 4), []]
+    return all(dump_json(payload) == _stdlib_json(payload) for payload in payloads)
+
+
+def _time_search(db, rng):
+    # Consultas armadas con palabras de títulos reales; la última queda como prefijo
+    titles = [db["products"][_random_product_id(db, rng) - 1]["title"].split() for _ in range(50)]
+    queries = [f"{words[0]} {words[1][:4]}" for words in titles if len(words) > 1]
+    return lambda: search_products(db, rng.choice(queries))
+
+
+OPERATIONS = [
+    Operation("get_db_data", _time_get_db_data),
+    Operation("get_item_by_id",
+              lambda db, rng: lambda: get_item_by_id(db, "products", _random_product_id(db, rng))),
+    Operation("enrich_product",
+              lambda db, rng: lambda: enrich_product(dict(db["products"][_random_product_id(db, rng) - 1]), db)),
+    Operation("list_products", lambda db, rng: lambda: list_products(db), max_products=LISTING_MAX_PRODUCTS),
+    Operation("encode_products_stdlib", _time_encoding(_stdlib_json), max_products=LISTING_MAX_PRODUCTS),
+    Operation("encode_products_fast", _time_encoding(dump_json), max_products=LISTING_MAX_PRODUCTS),
+    Operation("get_similar_products",
+              lambda db, rng: lambda: get_similar_products(db, _random_product_id(db, rng), 4),
+              max_products=100_000),
+    Operation("generate_general_rating",
+              lambda db, rng: lambda: generate_general_rating(db, "product_id", _random_product_id(db, rng))),
+    Operation("search_products", _time_search),
+    Operation("query_products_page",
+              lambda db, rng: lambda: query_products(db, min_price=500, max_price=600, in_stock=True,
+                                                     sort="price_desc", page=1, page_size=20)),
+    Operation("query_products_in_stock_page",
+              lambda db, rng: lambda: query_products(db, in_stock=True, page=rng.randint(1, 100), page_size=20)),
+    Operation("get_product_reviews_page",
+              lambda db, rng: lambda: get_product_reviews_page(db, _random_product_id(db, rng), sort="rating")),
+]
+
+
+def time_operation(call, min_time, max_iterations):
+    """Run ``call`` until ``min_time`` seconds or ``max_iterations`` calls; return per-call stats in ms."""
+    samples = []
+    started = time.perf_counter()
+    while len(samples) < max_iterations:
+        t0 = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - t0) * 1000)
+        if time.perf_counter() - started >= min_time:
+            break
+    samples.sort()
+    return {
+        "iterations": len(samples),
+        "mean_ms": statistics.fmean(samples),
+        "median_ms": statistics.median(samples),
+        "min_ms": samples[0],
+        "p95_ms": samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+    }
+
+
+def run_scale(scale_name, num_products, operations, args):
+    print(f"Generating catalog '{scale_name}' ({num_products} products)...", flush=True)
+    db = DataSnapshot(generate_catalog(num_products, seed=args.seed))
+    results = {"_catalog": {table: len(rows) for table, rows in db.items()}}
+    if num_products <= LISTING_MAX_PRODUCTS or args.no_limits:
+        results["_json_byte_compatible"] = check_json_compatibility(db)
+        print(f"  {'json byte compatibility':<26} {'ok' if results['_json_byte_compatible'] else 'MISMATCH'}")
+    for op in operations:
+        if op.max_products is not None and num_products > op.max_products and not args.no_limits:
+            results[op.name] = {"skipped": f"catalog larger than {op.max_products} products"}
+            print(f"  {op.name:<26} skipped")
+            continue
+        rng = random.Random(args.seed)
+        call = op.make_call(db, rng)
+        try:
+            stats = time_operation(call, args.min_time, args.max_iterations)
+        finally:
+            if hasattr(call, "close"):
+                call.close()
+        results[op.name] = stats
+        print(f"  {op.name:<26} median {stats['median_ms']:>10.3f} ms  ({stats['iterations']} runs)", flush=True)
+    return results
+
+
+def compare_with_baseline(results, baseline, threshold):
+    """Return a list of human readable regressions of ``results`` against ``baseline``."""
+    regressions = []
+    for scale, ops in results.items():
+        for name, stats in ops.items():
+            base = baseline.get(scale, {}).get(name)
+            if name.startswith("_") or not base or "median_ms" not in stats or "median_ms" not in base:
+                continue
+            current, previous = stats["median_ms"], base["median_ms"]
+            if current > previous * threshold and current - previous > MIN_REGRESSION_MS:
+                regressions.append(f"{scale}/{name}: {previous:.3f} ms -> {current:.3f} ms "
+                                   f"(x{current / previous:.2f}, threshold x{threshold})")
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Backend benchmarks over synthetic catalogs")
+    parser.add_argument("--scales", nargs="+", default=DEFAULT_SCALES,
+                        help="Catalog sizes: 1k, 10k, 100k, 1m or a product count")
+    parser.add_argument("--operations", nargs="+", default=[op.name for op in OPERATIONS],
+                        choices=[op.name for op in OPERATIONS])
+    parser.add_argument("--min-time", type=float, default=0.5, help="Seconds spent per operation")
+    parser.add_argument("--max-iterations", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--no-limits", action="store_true", help="Run slow operations at every scale")
+    parser.add_argument("--output", help="Write results JSON to this path")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Fail when median time exceeds baseline by this factor")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    logging.getLogger("meli_api").setLevel(logging.WARNING)
+    operations = [op for op in OPERATIONS if op.name in args.operations]
+
+    results = {}
+    for scale in args.scales:
+        results[scale] = run_scale(scale, parse_scale(scale), operations, args)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    mismatches = [scale for scale, ops in results.items() if ops.get("_json_byte_compatible") is False]
+    if mismatches:
+        print(f"Fast JSON output differs from the stdlib encoder at: {', '.join(mismatches)}")
+        return 1
+
+    if args.save_baseline:
+        baseline = {"meta": report["meta"], "results": {}}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, "r", encoding="utf-8") as f:
+                baseline = json.load(f)
+        baseline["meta"] = report["meta"]
+        for scale, ops in results.items():
+            baseline["results"].setdefault(scale, {}).update(ops)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("No baseline found; skipping regression check. Run with --save-baseline to record one.")
+        return 0
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare_with_baseline(results, baseline.get("results", {}), args.threshold)
+    if regressions:
+        print("Performance regressions detected:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print("No regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+HTTP load generator for the FastAPI app.
+
+Drives ``app.main.app`` either in-process through httpx's ASGI transport or a
+running server (``--url``) with a weighted traffic mix, then reports
+throughput, latency percentiles and memory, and fails when configured
+thresholds are not met.
+
+Usage (from the Backend directory)::
+
+    python -m benchmarks.load_generator --mix detail --duration 10 --concurrency 32
+    python -m benchmarks.load_generator --mix listing --synthetic 10k --max-p99-ms 250
+    python -m benchmarks.load_generator --url http://localhost:8000 --mix login --requests 200
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+LOGIN_FORM = {"grant_type": "password", "username": "testuser", "password": "testpass"}
+
+# Cada mezcla es una lista de (peso, nombre, constructor de petición); el constructor
+# recibe un id de producto y uno de vendedor sorteados dentro del catálogo
+MIXES = {
+    "detail": [
+        (70, "product_detail", lambda pid, sid: ("GET", f"/products/{pid}", None)),
+        (10, "similar", lambda pid, sid: ("GET", f"/products/{pid}/similar/", None)),
+        (10, "product_reviews", lambda pid, sid: ("GET", f"/reviews/product/{pid}", None)),
+        (10, "seller", lambda pid, sid: ("GET", f"/sellers/{sid}", None)),
+    ],
+    "listing": [
+        (60, "products", lambda pid, sid: ("GET", "/products/", None)),
+        (20, "categories", lambda pid, sid: ("GET", "/categories/", None)),
+        (20, "payment_methods", lambda pid, sid: ("GET", "/payment-methods/", None)),
+    ],
+    "similar": [
+        (80, "similar", lambda pid, sid: ("GET", f"/products/{pid}/similar/", None)),
+        (20, "product_detail", lambda pid, sid: ("GET", f"/products/{pid}", None)),
+    ],
+    "login": [
+        (100, "login", lambda pid, sid: ("POST", "/token", LOGIN_FORM)),
+    ],
+}
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB, or None where unsupported."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss está en KB en Linux y en bytes en macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def build_client(args):
+    if args.url:
+        return httpx.AsyncClient(base_url=args.url, timeout=args.timeout,
+                                 limits=httpx.Limits(max_connections=args.concurrency))
+    from app.main import app
+    from app.repository import get_db
+    if args.synthetic != "none":
+        from app.repository.snapshot import DataSnapshot
+        from benchmarks.synthetic_data import generate_catalog, parse_scale
+        db = DataSnapshot(generate_catalog(parse_scale(args.synthetic), seed=args.seed))
+        app.dependency_overrides[get_db] = lambda: db
+        args.max_product_id = args.max_product_id or len(db["products"])
+        args.max_seller_id = args.max_seller_id or len(db["sellers"])
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://testserver",
+                             timeout=args.timeout)
+
+
+async def run_load(args):
+    mix = MIXES[args.mix]
+    weights = [weight for weight, _, _ in mix]
+    latencies = {name: [] for _, name, _ in mix}
+    statuses = {}
+    errors = 0
+    issued = 0
+    deadline = time.perf_counter() + args.duration if args.requests is None else None
+
+    async with build_client(args) as client:
+        max_product_id = args.max_product_id or 20
+        max_seller_id = args.max_seller_id or 10
+
+        async def worker(worker_id):
+            nonlocal errors, issued
+            rng = random.Random(args.seed + worker_id)
+            while True:
+                if deadline is not None and time.perf_counter() >= deadline:
+                    return
+                if args.requests is not None:
+                    if issued >= args.requests:
+                        return
+                    issued += 1
+                _, name, factory = rng.choices(mix, weights=weights)[0]
+                method, path, form = factory(rng.randint(1, max_product_id), rng.randint(1, max_seller_id))
+                started = time.perf_counter()
+                try:
+                    response = await client.request(method, path, data=form)
+                    status = response.status_code
+                except httpx.HTTPError:
+                    status = "error"
+                latencies[name].append((time.perf_counter() - started) * 1000)
+                statuses[status] = statuses.get(status, 0) + 1
+                if status == "error" or status >= 500:
+                    errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(i) for i in range(args.concurrency)))
+        elapsed = time.perf_counter() - started
+
+    all_latencies = sorted(value for values in latencies.values() for value in values)
+    total = len(all_latencies)
+
+    def summarize(values):
+        values = sorted(values)
+        return {
+            "requests": len(values),
+            "p50_ms": percentile(values, 50),
+            "p95_ms": percentile(values, 95),
+            "p99_ms": percentile(values, 99),
+            "mean_ms": statistics.fmean(values) if values else 0.0,
+        }
+
+    return {
+        "mix": args.mix,
+        "target": args.url or "in-process",
+        "concurrency": args.concurrency,
+        "elapsed_s": elapsed,
+        "rps": total / elapsed if elapsed > 0 else 0.0,
+        "error_rate": errors / total if total else 0.0,
+        "statuses": {str(status): count for status, count in statuses.items()},
+        "peak_rss_mb": peak_rss_mb() if not args.url else None,
+        **summarize(all_latencies),
+        "endpoints": {name: summarize(values) for name, values in latencies.items() if values},
+    }
+
+
+def check_thresholds(report, args):
+    failures = []
+    if args.min_rps is not None and report["rps"] < args.min_rps:
+        failures.append(f"rps {report['rps']:.1f} < {args.min_rps}")
+    for pct in ("p50", "p95", "p99"):
+        limit = getattr(args, f"max_{pct}_ms")
+        if limit is not None and report[f"{pct}_ms"] > limit:
+            failures.append(f"{pct} {report[f'{pct}_ms']:.2f} ms > {limit} ms")
+    if report["error_rate"] > args.max_error_rate:
+        failures.append(f"error rate {report['error_rate']:.2%} > {args.max_error_rate:.2%}")
+    if args.max_rss_mb is not None and report["peak_rss_mb"] is not None and report["peak_rss_mb"] > args.max_rss_mb:
+        failures.append(f"peak RSS {report['peak_rss_mb']:.1f} MB > {args.max_rss_mb} MB")
+    return failures
+
+
+def print_report(report):
+    print(f"Mix: {report['mix']}  target: {report['target']}  concurrency: {report['concurrency']}")
+    print(f"Requests: {report['requests']} in {report['elapsed_s']:.2f}s -> {report['rps']:.1f} req/s")
+    print(f"Latency ms  p50 {report['p50_ms']:.2f}  p95 {report['p95_ms']:.2f}  p99 {report['p99_ms']:.2f}")
+    print(f"Errors: {report['error_rate']:.2%}  statuses: {report['statuses']}")
+    if report["peak_rss_mb"] is not None:
+        print(f"Peak RSS: {report['peak_rss_mb']:.1f} MB")
+    for name, stats in report["endpoints"].items():
+        print(f"  {name:<18} n={stats['requests']:<7} p50 {stats['p50_ms']:8.2f}  "
+              f"p95 {stats['p95_ms']:8.2f}  p99 {stats['p99_ms']:8.2f}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the MeLi API")
+    parser.add_argument("--mix", choices=sorted(MIXES), default="detail")
+    parser.add_argument("--url", help="Base URL of a running server; in-process ASGI when omitted")
+    parser.add_argument("--synthetic", default="1k",
+                        help="In-process only: synthetic catalog size, or 'none' to use the data files")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to run")
+    parser.add_argument("--requests", type=int, help="Total requests to send instead of --duration")
+    parser.add_argument("--max-product-id", type=int)
+    parser.add_argument("--max-seller-id", type=int)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--min-rps", type=float)
+    parser.add_argument("--max-p50-ms", type=float)
+    parser.add_argument("--max-p95-ms", type=float)
+    parser.add_argument("--max-p99-ms", type=float)
+    parser.add_argument("--max-rss-mb", type=float)
+    parser.add_argument("--max-error-rate", type=float, default=0.0)
+    parser.add_argument("--output", help="Write the report as JSON to this path")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    logging.getLogger("meli_api").setLevel(logging.WARNING)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    report = asyncio.run(run_load(args))
+    print_report(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    failures = check_thresholds(report, args)
+    if failures:
+        print("Thresholds failed:")
+        for failure in failures:
+            print(f"  {failure}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
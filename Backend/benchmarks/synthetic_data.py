@@ -0,0 +1,119 @@
+"""
+Synthetic catalog generator for benchmarks.
+
+Builds an in-memory database with the same shape as ``Backend/Data`` at an
+arbitrary number of products. Sellers, categories and reviews scale with the
+product count using roughly the proportions of the sample data set. Generation
+is deterministic for a given seed.
+"""
+
+import json
+import os
+import random
+from datetime import date, timedelta
+
+SCALES = {"1k": 1_000, "10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+PRODUCTS_PER_SELLER = 50
+PRODUCTS_PER_CATEGORY = 500
+MIN_CATEGORIES = 10
+AVG_REVIEWS_PER_PRODUCT = 5
+CATEGORIES_PER_PRODUCT = (2, 5)
+
+BRANDS = ["Apple", "Samsung", "Motorola", "Xiaomi", "Huawei", "Nokia", "Sony", "LG", "Oppo", "Realme"]
+NOUNS = ["Teléfono", "Smartphone", "Celular", "Cámara", "Batería", "Pantalla", "Auriculares", "Cargador",
+         "Tablet", "Reloj"]
+ADJECTIVES = ["rápido", "económico", "premium", "resistente", "compacto", "potente", "ligero",
+              "elegante", "durable", "avanzado", "fast", "cheap", "wireless", "portable"]
+COLORS = ["Black", "Silver", "Gold", "Blue", "Green", "Red", "White", "Purple"]
+STORAGE = ["64GB", "128GB", "256GB", "512GB", "1TB"]
+CITIES = ["Ciudad de México", "Bogotá", "São Paulo", "Buenos Aires", "Santiago", "Lima", "Montevideo"]
+BUYERS = ["Carlos Méndez", "Lucía Gómez", "José Pérez", "María Fernández", "Ana López", "Sofía Díaz",
+          "Martín Ruiz", "Valentina Ríos", "Julián Torres", "Camila Herrera"]
+REVIEW_TEXTS = ["Excelente producto, muy satisfecho.", "Buena relación precio-calidad.",
+                "La batería dura todo el día.", "Llegó rápido y en perfecto estado.",
+                "No cumplió mis expectativas.", "Great phone, would buy again.",
+                "Camera quality is outstanding.", "Regular, esperaba más.", None]
+PAYMENT_METHODS = [
+    {"id": 1, "name": "Credit Card", "description": "Payment with credit card from different banks."},
+    {"id": 2, "name": "Debit Card", "description": "Payment with debit card."},
+    {"id": 3, "name": "Mercado Pago", "description": "Payment through Mercado Pago account."},
+    {"id": 4, "name": "Cash", "description": "Cash payment at partner stores."},
+    {"id": 5, "name": "Bank Transfer", "description": "Direct bank transfer."},
+    {"id": 6, "name": "Installments", "description": "Interest-free installments."},
+]
+REVIEW_START_DATE = date(2023, 1, 1)
+
+
+def parse_scale(value: str) -> int:
+    """Translate a scale name (``1k``, ``100k``, ``1m``) or a plain integer into a product count."""
+    key = value.lower()
+    if key in SCALES:
+        return SCALES[key]
+    return int(key)
+
+
+def generate_catalog(num_products: int, seed: int = 42) -> dict[str, list[dict]]:
+    """Return a database dict with ``num_products`` products and proportional related tables."""
+    rng = random.Random(seed)
+    num_sellers = max(1, num_products // PRODUCTS_PER_SELLER)
+    num_categories = max(MIN_CATEGORIES, num_products // PRODUCTS_PER_CATEGORY)
+
+    categories = [
+        {"id": i, "name": f"Categoría {i}", "description": f"Productos de la categoría {i}."}
+        for i in range(1, num_categories + 1)
+    ]
+    sellers = [
+        {"id": i, "name": f"{rng.choice(BRANDS)} Store {i}", "location": rng.choice(CITIES),
+         "email": f"seller{i}@example.com", "phone": f"555-{i:07d}"}
+        for i in range(1, num_sellers + 1)
+    ]
+
+    products = []
+    reviews = []
+    review_id = 1
+    for product_id in range(1, num_products + 1):
+        brand = rng.choice(BRANDS)
+        noun = rng.choice(NOUNS)
+        adjectives = rng.sample(ADJECTIVES, 2)
+        seller_id = rng.randint(1, num_sellers)
+        products.append({
+            "id": product_id,
+            "title": f"{brand} {noun} {adjectives[0]} {product_id}",
+            "description": f"{noun} {brand} {adjectives[0]} y {adjectives[1]}, ideal para uso diario.",
+            "price": round(rng.uniform(50, 2500), 2),
+            "images": [f"https://cdn.example.com/products/{product_id}/{n}.jpg" for n in range(rng.randint(1, 4))],
+            "seller_id": seller_id,
+            "payment_methods_ids": sorted(rng.sample(range(1, len(PAYMENT_METHODS) + 1), rng.randint(1, 4))),
+            "stock": rng.choice([0, rng.randint(1, 9), rng.randint(10, 19), rng.randint(20, 200)]),
+            "category_ids": sorted(rng.sample(range(1, num_categories + 1), rng.randint(*CATEGORIES_PER_PRODUCT))),
+            "features": {"color": rng.sample(COLORS, rng.randint(1, 4)), "storage": rng.sample(STORAGE, rng.randint(1, 3))},
+        })
+        # Popularidad sesgada: pocos productos concentran muchas reviews
+        for _ in range(int(rng.expovariate(1 / AVG_REVIEWS_PER_PRODUCT))):
+            reviews.append({
+                "id": review_id,
+                "product_id": product_id,
+                "seller_id": seller_id,
+                "buyer": rng.choice(BUYERS),
+                "review": rng.choice(REVIEW_TEXTS),
+                "rating": rng.choices([1, 2, 3, 4, 5], weights=[1, 1, 2, 4, 6])[0],
+                "date": (REVIEW_START_DATE + timedelta(days=rng.randint(0, 730))).isoformat(),
+            })
+            review_id += 1
+
+    return {
+        "products": products,
+        "categories": categories,
+        "sellers": sellers,
+        "payment_methods": [dict(pm) for pm in PAYMENT_METHODS],
+        "reviews": reviews,
+    }
+
+
+def write_catalog(db: dict[str, list[dict]], directory: str) -> None:
+    """Write each table as ``<table>.json`` in ``directory``, the layout read by ``get_db_data``."""
+    os.makedirs(directory, exist_ok=True)
+    for table, rows in db.items():
+        with open(os.path.join(directory, f"{table}.json"), "w", encoding="utf-8") as f:
+            json.dump(rows, f, ensure_ascii=False)
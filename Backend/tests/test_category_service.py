@@ -5,7 +5,8 @@ from unittest.mock import patch, MagicMock
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from app.services.category_service import list_categories, get_category_by_id
+from app.services.category_service import list_categories, get_category_by_id, get_category_products_page
+from app.repository.snapshot import DataSnapshot
 from app.schemas.category import CategorySchema
 
 
@@ -165,5 +166,62 @@ class TestCategoryService(unittest.TestCase):
             CategorySchema.model_validate(invalid_data)
 
 
+class TestCategoryProductsPage(unittest.TestCase):
+    """Test cases for the category browse listing."""
+
+    def setUp(self):
+        """Set up a db where category 1 lists three products and category 2 one."""
+        def product(product_id, category_ids, price, stock, payment_methods_ids):
+            return {"id": product_id, "title": f"Producto {product_id}", "description": "", "price": price,
+                    "images": [], "seller_id": 1, "payment_methods_ids": payment_methods_ids,
+                    "stock": stock, "category_ids": category_ids}
+        self.db = {
+            "categories": [
+                {"id": 1, "name": "Smartphones"},
+                {"id": 2, "name": "Tablets"},
+                {"id": 3, "name": "Relojes"},
+            ],
+            "products": [
+                product(1, [1], 199.0, 5, [1, 2]),
+                product(2, [2], 899.0, 1, [1]),
+                product(3, [1, 2], 2600.0, 0, [2]),
+                product(4, [1], 480.0, 3, [1]),
+            ],
+            "payment_methods": [],
+            "reviews": [],
+        }
+
+    def test_page_and_facets(self):
+        """Test the page slice and the facet counts over the whole category."""
+        for db in (self.db, DataSnapshot(self.db)):
+            page = get_category_products_page(db, 1, page=1, page_size=2)
+            self.assertEqual([p.id for p in page.items], [1, 3])
+            self.assertEqual((page.total, page.pages), (3, 2))
+            self.assertEqual(page.category.name, "Smartphones")
+            self.assertEqual([b.count for b in page.facets.price_buckets], [1, 1, 0, 0, 1])
+            self.assertEqual(page.facets.price_buckets[-1].max, None)
+            self.assertEqual(page.facets.payment_methods, {1: 2, 2: 2})
+            self.assertEqual((page.facets.stock.in_stock, page.facets.stock.out_of_stock), (2, 1))
+
+    def test_second_page(self):
+        """Test that facets do not depend on the page requested."""
+        first = get_category_products_page(DataSnapshot(self.db), 1, page=1, page_size=2)
+        second = get_category_products_page(DataSnapshot(self.db), 1, page=2, page_size=2)
+        self.assertEqual([p.id for p in second.items], [4])
+        self.assertEqual(first.facets, second.facets)
+
+    def test_empty_category(self):
+        """Test that a category without products has an empty page and zero facets."""
+        page = get_category_products_page(DataSnapshot(self.db), 3)
+        self.assertEqual(page.items, [])
+        self.assertEqual(sum(b.count for b in page.facets.price_buckets), 0)
+        self.assertEqual(page.facets.payment_methods, {})
+
+    def test_unknown_category(self):
+        """Test that an unknown category raises ValueError."""
+        with self.assertRaises(ValueError):
+            get_category_products_page(self.db, 99)
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -0,0 +1,169 @@
+import unittest
+import gzip
+import os
+import sys
+from unittest.mock import call, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+
+import app.core.compression as compression
+from app.core.compression import negotiate_encoding, compress, is_compressible
+from app.core.middleware import CompressionMiddleware, add_vary_accept_encoding
+from app.core.responses import CachedBody, cached_json_response, response_cache
+
+LARGE_BODY = b'{"items":[' + b",".join(b'{"title":"Samsung Galaxy"}' for _ in range(200)) + b']}'
+
+
+class TestNegotiateEncoding(unittest.TestCase):
+    """Test cases for Accept-Encoding negotiation"""
+
+    def test_no_header_means_identity(self):
+        """Test that a missing header selects no compression"""
+        self.assertIsNone(negotiate_encoding(None))
+        self.assertIsNone(negotiate_encoding(""))
+
+    def test_gzip_accepted(self):
+        """Test that gzip is selected when offered"""
+        self.assertEqual(negotiate_encoding("gzip, deflate"), "gzip")
+
+    def test_zero_quality_is_refused(self):
+        """Test that q=0 excludes a coding"""
+        self.assertIsNone(negotiate_encoding("gzip;q=0, deflate"))
+
+    def test_wildcard(self):
+        """Test that * accepts any supported coding"""
+        self.assertIn(negotiate_encoding("*"), compression.SUPPORTED_ENCODINGS)
+
+    def test_unsupported_only(self):
+        """Test that unsupported codings fall back to identity"""
+        self.assertIsNone(negotiate_encoding("deflate, compress"))
+
+    def test_brotli_preferred_when_available(self):
+        """Test that br wins over gzip when the brotli package is installed"""
+        with patch.object(compression, "SUPPORTED_ENCODINGS", ("br", "gzip")):
+            self.assertEqual(negotiate_encoding("gzip, br"), "br")
+            self.assertEqual(negotiate_encoding("gzip, br;q=0.5"), "gzip")
+
+    def test_compress_gzip_roundtrip(self):
+        """Test that gzip output decompresses to the original body"""
+        self.assertEqual(gzip.decompress(compress(LARGE_BODY, "gzip")), LARGE_BODY)
+        self.assertEqual(gzip.decompress(compress(LARGE_BODY, "gzip", cached=True)), LARGE_BODY)
+
+    def test_compress_unknown_encoding(self):
+        """Test that an unknown coding raises ValueError"""
+        with self.assertRaises(ValueError):
+            compress(LARGE_BODY, "zstd")
+
+    def test_is_compressible(self):
+        """Test the content types eligible for compression"""
+        self.assertTrue(is_compressible("application/json"))
+        self.assertTrue(is_compressible("text/plain; charset=utf-8"))
+        self.assertFalse(is_compressible("image/png"))
+        self.assertFalse(is_compressible(None))
+
+
+class TestCompressionMiddleware(unittest.TestCase):
+    """Test cases for the compression middleware"""
+
+    def setUp(self):
+        app = FastAPI()
+
+        @app.get("/large")
+        def large():
+            return Response(LARGE_BODY, media_type="application/json")
+
+        @app.get("/small")
+        def small():
+            return Response(b'{"ok":true}', media_type="application/json")
+
+        @app.get("/image")
+        def image():
+            return Response(LARGE_BODY, media_type="image/png")
+
+        @app.get("/encoded")
+        def encoded():
+            return Response(compress(LARGE_BODY, "gzip"), media_type="application/json",
+                            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"})
+
+        app.add_middleware(CompressionMiddleware, minimum_size=100)
+        self.client = TestClient(app)
+
+    def test_large_json_is_compressed(self):
+        """Test that large JSON bodies are gzipped with consistent headers"""
+        response = self.client.get("/large", headers={"Accept-Encoding": "gzip"})
+        self.assertEqual(response.headers["content-encoding"], "gzip")
+        self.assertEqual(response.headers["vary"], "Accept-Encoding")
+        self.assertLess(int(response.headers["content-length"]), len(LARGE_BODY))
+        self.assertEqual(response.content, LARGE_BODY)
+
+    def test_identity_when_not_accepted(self):
+        """Test that clients without Accept-Encoding get the raw body"""
+        response = self.client.get("/large", headers={"Accept-Encoding": "identity"})
+        self.assertNotIn("content-encoding", response.headers)
+        self.assertEqual(response.headers["vary"], "Accept-Encoding")
+
+    def test_small_body_not_compressed(self):
+        """Test that bodies under the threshold are sent as is"""
+        response = self.client.get("/small", headers={"Accept-Encoding": "gzip"})
+        self.assertNotIn("content-encoding", response.headers)
+
+    def test_non_text_not_compressed(self):
+        """Test that non-compressible content types are passed through"""
+        response = self.client.get("/image", headers={"Accept-Encoding": "gzip"})
+        self.assertNotIn("content-encoding", response.headers)
+        self.assertNotIn("vary", response.headers)
+
+    def test_already_encoded_is_not_recompressed(self):
+        """Test that responses with Content-Encoding are passed through untouched"""
+        response = self.client.get("/encoded", headers={"Accept-Encoding": "gzip"})
+        self.assertEqual(response.headers["content-encoding"], "gzip")
+        self.assertEqual(response.content, LARGE_BODY)
+
+    def test_add_vary_merges_existing_header(self):
+        """Test that Accept-Encoding is merged into an existing Vary header once"""
+        self.assertEqual(add_vary_accept_encoding([(b"vary", b"Origin")]), [(b"vary", b"Origin, Accept-Encoding")])
+        self.assertEqual(add_vary_accept_encoding([(b"vary", b"accept-encoding")]), [(b"vary", b"accept-encoding")])
+
+
+class TestPrecompressedCache(unittest.TestCase):
+    """Test cases for compressed variants of cached response bodies"""
+
+    def setUp(self):
+        response_cache.clear()
+
+    def tearDown(self):
+        response_cache.clear()
+
+    def test_variant_compressed_fast_then_upgraded(self):
+        """Test that the first request gets a fast variant and one background upgrade replaces it"""
+        entry = CachedBody({}, 1, LARGE_BODY)
+        with patch("app.core.responses.compress", wraps=compress) as mock_compress:
+            first = entry.encoded("gzip")
+            entry.upgrades["gzip"].result()
+            second = entry.encoded("gzip")
+            third = entry.encoded("gzip")
+        self.assertEqual(mock_compress.call_args_list,
+                         [call(LARGE_BODY, "gzip"), call(LARGE_BODY, "gzip", cached=True)])
+        self.assertIs(second, third)
+        self.assertEqual(second, compress(LARGE_BODY, "gzip", cached=True))
+        self.assertEqual(gzip.decompress(first), LARGE_BODY)
+
+    def test_cached_response_uses_variant(self):
+        """Test that cached_json_response serves the precompressed variant"""
+        db = {}
+        response = cached_json_response("large", db, lambda: {"items": ["x" * 2000]}, "gzip")
+        self.assertEqual(response.headers["content-encoding"], "gzip")
+        self.assertEqual(response.headers["vary"], "Accept-Encoding")
+        self.assertEqual(gzip.decompress(response.body), b'{"items":["' + b"x" * 2000 + b'"]}')
+
+    def test_cached_response_identity(self):
+        """Test that cached_json_response serves raw bytes without Accept-Encoding"""
+        response = cached_json_response("large", {}, lambda: {"items": ["x" * 2000]})
+        self.assertNotIn("content-encoding", response.headers)
+
+
+if __name__ == '__main__':
+    unittest.main()
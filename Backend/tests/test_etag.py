@@ -0,0 +1,115 @@
+import unittest
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from fastapi import FastAPI, Response
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.etag import compute_etag, etag_matches, not_modified_headers
+from app.core.middleware import ETagMiddleware, CompressionMiddleware
+from app.core.responses import cached_json_response, response_cache
+
+BODY = b'{"id":1,"title":"Samsung Galaxy"}'
+
+
+class TestETagHelpers(unittest.TestCase):
+    """Test cases for ETag computation and comparison"""
+
+    def test_compute_etag_is_weak_and_stable(self):
+        """Test that the same body always yields the same weak tag"""
+        etag = compute_etag(BODY)
+        self.assertTrue(etag.startswith('W/"'))
+        self.assertEqual(etag, compute_etag(BODY))
+        self.assertNotEqual(etag, compute_etag(BODY + b" "))
+
+    def test_etag_matches(self):
+        """Test weak comparison against If-None-Match lists and wildcards"""
+        etag = compute_etag(BODY)
+        self.assertTrue(etag_matches(etag, etag))
+        self.assertTrue(etag_matches(etag[2:], etag))
+        self.assertTrue(etag_matches(f'"other", {etag}', etag))
+        self.assertTrue(etag_matches("*", etag))
+        self.assertFalse(etag_matches('"other"', etag))
+        self.assertFalse(etag_matches(None, etag))
+
+    def test_not_modified_headers(self):
+        """Test that a 304 drops the entity headers"""
+        headers = [(b"content-type", b"application/json"), (b"content-length", b"10"),
+                   (b"etag", b'W/"x"'), (b"vary", b"Accept-Encoding")]
+        self.assertEqual(not_modified_headers(headers), [(b"etag", b'W/"x"'), (b"vary", b"Accept-Encoding")])
+
+
+class TestETagMiddleware(unittest.TestCase):
+    """Test cases for conditional GET handling"""
+
+    def setUp(self):
+        response_cache.clear()
+        self.db = db = {}
+        app = FastAPI()
+
+        @app.get("/item")
+        def item():
+            return Response(BODY, media_type="application/json")
+
+        @app.get("/missing")
+        def missing():
+            return Response(b'{"detail":"Not found"}', status_code=404, media_type="application/json")
+
+        @app.get("/stream")
+        def stream():
+            return StreamingResponse(iter([b"a", b"b"]), media_type="text/plain")
+
+        @app.get("/cached")
+        def cached():
+            return cached_json_response("cached", db, lambda: {"items": ["x" * 2000]}, "gzip")
+
+        app.add_middleware(ETagMiddleware)
+        app.add_middleware(CompressionMiddleware, minimum_size=100)
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        response_cache.clear()
+
+    def test_response_is_tagged(self):
+        """Test that successful responses carry the body's ETag"""
+        response = self.client.get("/item")
+        self.assertEqual(response.headers["etag"], compute_etag(BODY))
+        self.assertEqual(response.content, BODY)
+
+    def test_matching_if_none_match_returns_304(self):
+        """Test that a matching validator is answered with an empty 304"""
+        etag = self.client.get("/item").headers["etag"]
+        response = self.client.get("/item", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response.headers["etag"], etag)
+        self.assertNotIn("content-type", response.headers)
+
+    def test_stale_if_none_match_returns_body(self):
+        """Test that a non-matching validator gets the full response"""
+        response = self.client.get("/item", headers={"If-None-Match": '"stale"'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, BODY)
+
+    def test_errors_and_streams_are_not_tagged(self):
+        """Test that non-200 and streamed responses pass through untagged"""
+        self.assertNotIn("etag", self.client.get("/missing").headers)
+        response = self.client.get("/stream")
+        self.assertNotIn("etag", response.headers)
+        self.assertEqual(response.content, b"ab")
+
+    def test_cached_body_etag_is_reused(self):
+        """Test that precompressed cache entries revalidate with their stored ETag"""
+        response = self.client.get("/cached", headers={"Accept-Encoding": "gzip"})
+        etag = response_cache.get("cached", self.db, lambda: None).etag
+        self.assertEqual(response.headers["etag"], etag)
+        response = self.client.get("/cached", headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+
+if __name__ == '__main__':
+    unittest.main()
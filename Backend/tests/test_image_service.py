@@ -0,0 +1,154 @@
+import unittest
+import sys
+import os
+import tempfile
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from fastapi.testclient import TestClient
+
+import app.services.image_service as image_service
+from app.services.image_service import get_product_image_variant, variant_path, read_source, source_key
+from app.main import app
+from app.repository import get_db
+
+try:
+    import PIL
+except ImportError:
+    PIL = None
+
+IMAGE_URL = "https://images.example.com/phone.jpg"
+
+
+class TestImageService(unittest.TestCase):
+    """Test cases for product image variants."""
+
+    def setUp(self):
+        """Set up a private variant cache directory and a one-product db."""
+        self.tmp = tempfile.TemporaryDirectory()
+        patcher = patch.object(image_service, "IMAGE_VARIANT_DIR", self.tmp.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp.cleanup)
+        self.db = {"products": [{"id": 1, "title": "Phone", "images": [IMAGE_URL]}]}
+
+    def _store_variant(self, variant, data=b"jpeg"):
+        with open(variant_path(IMAGE_URL, variant), "wb") as f:
+            f.write(data)
+
+    def test_unknown_product_image_or_variant(self):
+        """Test that unknown products, indexes and variants raise ValueError."""
+        with self.assertRaises(ValueError):
+            get_product_image_variant(self.db, 99, 0, "thumb")
+        with self.assertRaises(ValueError):
+            get_product_image_variant(self.db, 1, 1, "thumb")
+        with self.assertRaises(ValueError):
+            get_product_image_variant(self.db, 1, 0, "poster")
+
+    def test_cached_variant_served_without_fetching(self):
+        """Test that a stored variant is returned without touching the source."""
+        self._store_variant("thumb")
+        with patch.object(image_service, "generate_variants") as mock_generate:
+            path = get_product_image_variant(self.db, 1, 0, "thumb")
+        self.assertEqual(path, variant_path(IMAGE_URL, "thumb"))
+        mock_generate.assert_not_called()
+
+    def test_missing_variant_generated_once(self):
+        """Test that a miss generates the variants of the source image once."""
+        def fake_generate(url):
+            self._store_variant("carousel")
+            self._store_variant("thumb")
+
+        with patch.object(image_service, "generate_variants", side_effect=fake_generate) as mock_generate:
+            get_product_image_variant(self.db, 1, 0, "carousel")
+            get_product_image_variant(self.db, 1, 0, "thumb")
+        mock_generate.assert_called_once_with(IMAGE_URL)
+        self.assertNotIn(source_key(IMAGE_URL), image_service._source_locks)
+
+    def test_source_lock_released_after_failure(self):
+        """Test that a failed generation does not leave its lock behind."""
+        with patch.object(image_service, "generate_variants", side_effect=OSError("unreachable")):
+            with self.assertRaises(OSError):
+                get_product_image_variant(self.db, 1, 0, "thumb")
+        self.assertNotIn(source_key(IMAGE_URL), image_service._source_locks)
+
+    def test_source_lock_kept_while_others_wait(self):
+        """Test that a lock outlives the first release while another request still uses it."""
+        key = source_key(IMAGE_URL)
+        first = image_service._source_lock(key)
+        waiter = image_service._source_lock(key)
+        self.assertIs(first, waiter)
+        image_service._release_source_lock(key)
+        self.assertIs(image_service._source_locks[key][0], first)
+        image_service._release_source_lock(key)
+        self.assertNotIn(key, image_service._source_locks)
+
+    def test_mirror_is_read_before_network(self):
+        """Test that a mirrored source image is read from disk."""
+        with open(os.path.join(self.tmp.name, source_key(IMAGE_URL)), "wb") as f:
+            f.write(b"original")
+        with patch.object(image_service, "IMAGE_MIRROR_DIR", self.tmp.name), \
+                patch("app.services.image_service.requests.get") as mock_get:
+            self.assertEqual(read_source(IMAGE_URL), b"original")
+        mock_get.assert_not_called()
+
+    @unittest.skipIf(PIL is not None, "Pillow is installed")
+    def test_generation_without_pillow(self):
+        """Test that generating a variant without Pillow raises RuntimeError."""
+        with patch.object(image_service, "read_source", return_value=b"original"):
+            with self.assertRaises(RuntimeError):
+                get_product_image_variant(self.db, 1, 0, "thumb")
+
+    @unittest.skipIf(PIL is None, "Pillow is not installed")
+    def test_generated_variant_sizes(self):
+        """Test that the carousel is cropped to size and the thumbnail fits in its box."""
+        from io import BytesIO
+        from PIL import Image
+        buf = BytesIO()
+        Image.new("RGB", (1280, 853), color=(10, 20, 30)).save(buf, format="JPEG")
+        with patch.object(image_service, "read_source", return_value=buf.getvalue()):
+            carousel = get_product_image_variant(self.db, 1, 0, "carousel")
+        with Image.open(carousel) as img:
+            self.assertEqual(img.size, (250, 400))
+        with Image.open(variant_path(IMAGE_URL, "thumb")) as img:
+            self.assertEqual(img.size, (70, 47))
+
+
+class TestImageEndpoint(unittest.TestCase):
+    """Test cases for GET /products/{id}/images/{index}/{variant}."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        patcher = patch.object(image_service, "IMAGE_VARIANT_DIR", self.tmp.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp.cleanup)
+        db = {"products": [{"id": 1, "title": "Phone", "images": [IMAGE_URL]}]}
+        app.dependency_overrides[get_db] = lambda: db
+        self.addCleanup(app.dependency_overrides.clear)
+        self.client = TestClient(app)
+
+    def test_variant_served_with_cache_headers(self):
+        """Test that variants are served as long-lived JPEGs."""
+        with open(variant_path(IMAGE_URL, "carousel"), "wb") as f:
+            f.write(b"jpeg")
+        response = self.client.get("/products/1/images/0/carousel")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["content-type"], "image/jpeg")
+        self.assertIn(f"max-age={image_service.IMAGE_VARIANT_MAX_AGE}", response.headers["cache-control"])
+        self.assertEqual(response.content, b"jpeg")
+
+    def test_unknown_image_returns_404(self):
+        """Test that an out-of-range image index returns 404."""
+        self.assertEqual(self.client.get("/products/1/images/5/thumb").status_code, 404)
+        self.assertEqual(self.client.get("/products/1/images/0/poster").status_code, 422)
+
+    def test_source_failure_returns_502(self):
+        """Test that an unreachable source image returns 502."""
+        with patch.object(image_service, "generate_variants", side_effect=OSError("timeout")):
+            self.assertEqual(self.client.get("/products/1/images/0/thumb").status_code, 502)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+import unittest
+import json
+import logging
+import os
+import io
+import logging.handlers
+import queue
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.core.logger import (
+    DroppingQueueHandler,
+    JsonFormatter,
+    RequestContextFilter,
+    request_id_var,
+    request_started_var,
+    SizeAndTimeRotatingFileHandler,
+    configure_logging,
+    get_logging_stats,
+    queue_handler,
+)
+
+
+def _record(level=logging.INFO, msg="message"):
+    return logging.LogRecord("test", level, __file__, 1, msg, None, None)
+
+
+class TestDroppingQueueHandler(unittest.TestCase):
+    """Test cases for the non-blocking queue handler"""
+
+    def test_enqueue_when_space_available(self):
+        """Test that records are queued while there is space"""
+        handler = DroppingQueueHandler(queue.Queue(maxsize=2))
+        handler.handle(_record())
+        self.assertEqual(handler.queue.qsize(), 1)
+        self.assertEqual(sum(handler.dropped.values()), 0)
+
+    def test_drops_and_counts_when_full(self):
+        """Test that records are dropped and counted per level when the queue is full"""
+        handler = DroppingQueueHandler(queue.Queue(maxsize=1), block_seconds=0)
+        handler.handle(_record())
+        handler.handle(_record(logging.INFO))
+        handler.handle(_record(logging.ERROR))
+        self.assertEqual(handler.queue.qsize(), 1)
+        self.assertEqual(handler.dropped["INFO"], 1)
+        self.assertEqual(handler.dropped["ERROR"], 1)
+
+    def test_configure_logging_is_idempotent(self):
+        """Test that configuring twice reuses the installed handler"""
+        self.assertIs(configure_logging(), queue_handler)
+        stats = get_logging_stats()
+        self.assertIn("dropped_total", stats)
+        self.assertIn("queue_capacity", stats)
+
+
+class TestStructuredLogging(unittest.TestCase):
+    """Test cases for request context stamping and JSON formatting"""
+
+    def test_filter_stamps_request_context(self):
+        """Test that records carry the current request id and elapsed time"""
+        id_token = request_id_var.set("req-1")
+        started_token = request_started_var.set(0.0)
+        try:
+            record = _record()
+            RequestContextFilter().filter(record)
+        finally:
+            request_id_var.reset(id_token)
+            request_started_var.reset(started_token)
+        self.assertEqual(record.request_id, "req-1")
+        self.assertIsNotNone(record.elapsed_ms)
+
+    def test_filter_outside_request(self):
+        """Test that records outside a request have empty context fields"""
+        record = _record()
+        RequestContextFilter().filter(record)
+        self.assertIsNone(record.request_id)
+        self.assertIsNone(record.elapsed_ms)
+
+    def test_json_formatter(self):
+        """Test that the JSON formatter emits one parseable object per record"""
+        record = logging.LogRecord("test", logging.INFO, __file__, 1, "value %s", ("á",), None)
+        record.request_id = "req-2"
+        record.elapsed_ms = 1.5
+        entry = json.loads(JsonFormatter().format(record))
+        self.assertEqual(entry["message"], "value á")
+        self.assertEqual(entry["request_id"], "req-2")
+        self.assertEqual(entry["elapsed_ms"], 1.5)
+        self.assertEqual(entry["level"], "INFO")
+
+    def test_exception_survives_the_queue(self):
+        """Test that logger.exception through the queue yields a JSON exc field"""
+        stream = io.StringIO()
+        output = logging.StreamHandler(stream)
+        output.setFormatter(JsonFormatter())
+        handler = DroppingQueueHandler(queue.Queue())
+        listener = logging.handlers.QueueListener(handler.queue, output)
+        test_logger = logging.getLogger("test_logger.queue_exception")
+        test_logger.propagate = False
+        test_logger.addHandler(handler)
+        listener.start()
+        try:
+            try:
+                1 / 0
+            except ZeroDivisionError:
+                test_logger.exception("failed %s", "op")
+        finally:
+            listener.stop()
+            test_logger.removeHandler(handler)
+        entry = json.loads(stream.getvalue())
+        self.assertEqual(entry["message"], "failed op")
+        self.assertIn("ZeroDivisionError", entry["exc"])
+
+
+class TestSizeAndTimeRotatingFileHandler(unittest.TestCase):
+    """Test cases for size and time based rotation"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.log_file = os.path.join(self.temp_dir.name, 'test.log')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_rotates_on_size(self):
+        """Test that the file rotates once it exceeds maxBytes"""
+        handler = SizeAndTimeRotatingFileHandler(self.log_file, maxBytes=50, backupCount=2)
+        for _ in range(5):
+            handler.emit(_record(msg="x" * 30))
+        handler.close()
+        self.assertTrue(os.path.exists(self.log_file + ".1"))
+
+    def test_rotates_on_interval(self):
+        """Test that the file rotates once the interval has elapsed"""
+        handler = SizeAndTimeRotatingFileHandler(self.log_file, interval_seconds=3600, backupCount=2)
+        handler.emit(_record())
+        handler.rollover_at = 0
+        handler.emit(_record())
+        handler.close()
+        self.assertTrue(os.path.exists(self.log_file + ".1"))
+        self.assertGreater(handler.rollover_at, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.core.metrics import Histogram, MetricsRegistry, registry, timed, record_lookup, record_cache, render_metrics
+
+
+class TestHistogram(unittest.TestCase):
+    """Test cases for the latency histogram"""
+
+    def test_observe_places_values_in_buckets(self):
+        """Test that observations land in the first bucket whose bound is >= value"""
+        histogram = Histogram(buckets=(0.1, 1.0))
+        histogram.observe(0.05)
+        histogram.observe(0.1)
+        histogram.observe(0.5)
+        histogram.observe(5.0)
+        self.assertEqual(histogram.counts, [2, 1, 1])
+        self.assertEqual(histogram.count, 4)
+        self.assertAlmostEqual(histogram.total, 5.65)
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    """Test cases for the metrics registry and Prometheus rendering"""
+
+    def setUp(self):
+        self.registry = MetricsRegistry()
+        self.registry.histogram("latency_seconds", "Latency.", ("route",))
+        self.registry.counter("hits_total", "Hits.", ("cache",))
+
+    def test_render_counter(self):
+        """Test that counters render with labels and HELP/TYPE lines"""
+        self.registry.inc("hits_total", ("products",))
+        self.registry.inc("hits_total", ("products",), 2)
+        text = self.registry.render()
+        self.assertIn("# TYPE hits_total counter", text)
+        self.assertIn('hits_total{cache="products"} 3', text)
+
+    def test_render_histogram_is_cumulative(self):
+        """Test that histogram buckets are rendered cumulatively with +Inf, sum and count"""
+        self.registry.observe("latency_seconds", ("/a",), 0.0002)
+        self.registry.observe("latency_seconds", ("/a",), 20.0)
+        text = self.registry.render()
+        self.assertIn('latency_seconds_bucket{route="/a",le="0.00025"} 1', text)
+        self.assertIn('latency_seconds_bucket{route="/a",le="10.0"} 1', text)
+        self.assertIn('latency_seconds_bucket{route="/a",le="+Inf"} 2', text)
+        self.assertIn('latency_seconds_count{route="/a"} 2', text)
+
+    def test_label_values_are_escaped(self):
+        """Test that quotes in label values are escaped"""
+        self.registry.inc("hits_total", ('a"b',))
+        self.assertIn('hits_total{cache="a\\"b"} 1', self.registry.render())
+
+
+class TestInstrumentationHooks(unittest.TestCase):
+    """Test cases for the module-level recording helpers"""
+
+    def test_timed_records_service_latency(self):
+        """Test that the timed decorator records one observation per call"""
+        @timed("tests.sample")
+        def sample(value):
+            return value * 2
+
+        self.assertEqual(sample(2), 4)
+        histogram = registry.get_histogram("service_call_duration_seconds", ("tests.sample",))
+        self.assertEqual(histogram.count, 1)
+
+    def test_lookup_and_cache_counters(self):
+        """Test that lookups and cache results are counted"""
+        before = registry.get_counter("repository_lookups_total", ("tests", "index"))
+        record_lookup("tests", "index")
+        record_cache("tests", hit=False)
+        self.assertEqual(registry.get_counter("repository_lookups_total", ("tests", "index")), before + 1)
+        self.assertGreaterEqual(registry.get_counter("cache_requests_total", ("tests", "miss")), 1)
+
+    def test_render_metrics_includes_logging_gauges(self):
+        """Test that the exposition includes the logging pipeline gauges"""
+        text = render_metrics()
+        self.assertIn("log_queue_size", text)
+        self.assertIn("# TYPE http_request_duration_seconds histogram", text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from fastapi.testclient import TestClient
+
+from app.schemas.product_detail import ProductDetailSchema
+from app.services.product_detail_service import get_product_detail
+from app.repository.snapshot import DataSnapshot
+from app.repository import get_db
+from app.main import app
+
+
+def _product(product_id, seller_id, category_ids):
+    return {
+        "id": product_id, "title": f"Phone {product_id}", "description": "Smartphone", "price": 999.0,
+        "images": [], "seller_id": seller_id, "payment_methods_ids": [], "stock": 5,
+        "category_ids": category_ids,
+    }
+
+
+class TestProductDetailService(unittest.TestCase):
+    """Test cases for product detail with embedded resources."""
+
+    def setUp(self):
+        """Set up a small snapshot with a seller, reviews and related products."""
+        self.db = DataSnapshot({
+            "products": [_product(1, 1, [1]), _product(2, 1, [1]), _product(3, 9, [2])],
+            "sellers": [{"id": 1, "name": "Apple Store", "location": "CDMX", "email": "a@a.com", "phone": "1"}],
+            "categories": [],
+            "payment_methods": [],
+            "reviews": [
+                {"id": i, "product_id": 1, "seller_id": 1, "buyer": f"b{i}", "rating": 4 + i % 2,
+                 "review": "ok", "date": f"2024-01-0{i}"}
+                for i in range(1, 8)
+            ],
+        })
+
+    def test_without_includes(self):
+        """Test that no related resource is embedded by default."""
+        detail = get_product_detail(self.db, 1)
+        self.assertIsInstance(detail, ProductDetailSchema)
+        self.assertIsNone(detail.seller)
+        self.assertIsNone(detail.review_page)
+        self.assertIsNone(detail.similar)
+
+    def test_all_includes(self):
+        """Test that seller, first review page and similar products are embedded."""
+        detail = get_product_detail(self.db, 1, ("seller", "reviews", "similar"), reviews_page_size=5)
+        self.assertEqual(detail.seller.name, "Apple Store")
+        self.assertEqual(detail.seller.rating_info.reviews_count, 7)
+        self.assertEqual(detail.review_page.total, 7)
+        self.assertEqual([r.id for r in detail.review_page.items], [7, 6, 5, 4, 3])
+        self.assertEqual([p.id for p in detail.similar], [2])
+        self.assertEqual(detail.rating_info.reviews_count, 7)
+
+    def test_missing_seller_is_null(self):
+        """Test that a product whose seller is gone still resolves."""
+        detail = get_product_detail(self.db, 3, ("seller",))
+        self.assertEqual(detail.id, 3)
+        self.assertIsNone(detail.seller)
+
+    def test_unknown_product(self):
+        """Test that an unknown product raises."""
+        with self.assertRaises(RuntimeError):
+            get_product_detail(self.db, 99, ("seller",))
+
+    def test_endpoint_include_parameter(self):
+        """Test include parsing on GET /products/{id}."""
+        app.dependency_overrides[get_db] = lambda: self.db
+        self.addCleanup(app.dependency_overrides.clear)
+        client = TestClient(app)
+
+        plain = client.get("/products/1").json()
+        self.assertNotIn("seller", plain)
+
+        embedded = client.get("/products/1", params={"include": "seller, reviews", "reviews_page_size": 2}).json()
+        self.assertEqual(embedded["seller"]["id"], 1)
+        self.assertEqual(len(embedded["review_page"]["items"]), 2)
+        self.assertIsNone(embedded["similar"])
+
+        self.assertEqual(client.get("/products/1", params={"include": "owner"}).status_code, 422)
+
+
+if __name__ == '__main__':
+    unittest.main()
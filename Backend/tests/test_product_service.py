@@ -9,7 +9,8 @@ from app.schemas.product import ProductSchema
 from app.schemas.category import CategorySchema
 from app.schemas.payment_method import PaymentMethodSchema
 from app.schemas.general_rating import GeneralRating
-from app.services.product_service import list_products, get_product_by_id, enrich_product, get_similar_products
+from app.services.product_service import list_products, get_product_by_id, enrich_product, get_similar_products, list_products_page
+from app.repository.snapshot import DataSnapshot
 
 
 
@@ -595,5 +596,40 @@ class TestProductService(unittest.TestCase):
         mock_get_all.assert_called_once_with(self.mock_db, "products")
 
 
+class TestListProductsPage(unittest.TestCase):
+    """Test cases for filtered, paginated product listings."""
+
+    def setUp(self):
+        """Set up a small catalog with mixed prices and stock."""
+        def product(product_id, price, stock):
+            return {"id": product_id, "title": f"Producto {product_id}", "description": "", "price": price,
+                    "images": [], "seller_id": 1, "payment_methods_ids": [], "stock": stock, "category_ids": []}
+        self.db = DataSnapshot({
+            "products": [product(1, 500.0, 3), product(2, 150.0, 0), product(3, 900.0, 1), product(4, 150.0, 5)],
+            "categories": [],
+            "payment_methods": [],
+            "reviews": [],
+        })
+
+    def test_filters_sort_and_pagination_compose(self):
+        """Test that filters, sort and pagination compose."""
+        page = list_products_page(self.db, page=1, page_size=2, max_price=600, sort="price_asc")
+        self.assertEqual([p.id for p in page.items], [2, 4])
+        self.assertEqual((page.total, page.pages), (3, 2))
+        page = list_products_page(self.db, page=2, page_size=2, max_price=600, sort="price_asc")
+        self.assertEqual([p.id for p in page.items], [1])
+
+    def test_in_stock_catalog_order(self):
+        """Test the in-stock filter without sort keeps catalog order."""
+        page = list_products_page(self.db, in_stock=True)
+        self.assertEqual([p.id for p in page.items], [1, 3, 4])
+        self.assertIsNotNone(page.items[0].rating_info)
+
+    def test_invalid_sort_raises(self):
+        """Test that an unsupported sort raises RuntimeError."""
+        with self.assertRaises(RuntimeError):
+            list_products_page(self.db, sort="name")
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
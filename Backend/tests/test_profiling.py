@@ -0,0 +1,120 @@
+import unittest
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.core.profiling import (
+    StackSampler,
+    activate,
+    deactivate,
+    track_current_thread,
+    ProfileSession,
+    format_collapsed,
+    format_summary,
+    start_session,
+    get_session,
+    clear_session,
+)
+
+
+class TestStackSampler(unittest.TestCase):
+    """Test cases for the sampling profiler"""
+
+    def test_collects_collapsed_stacks(self):
+        """Test that the sampler records the stacks of the thread that created it"""
+        sampler = StackSampler(interval=0.001).start()
+        deadline = time.perf_counter() + 0.05
+        while time.perf_counter() < deadline:
+            sum(range(1000))
+        samples = sampler.stop()
+        self.assertGreater(sum(samples.values()), 0)
+        self.assertTrue(any("test_collects_collapsed_stacks" in stack for stack in samples))
+
+    def test_samples_only_tracked_threads(self):
+        """Test that unrelated threads are ignored and tracked workers are sampled"""
+        stop = threading.Event()
+
+        def unrelated_busy_loop():
+            while not stop.is_set():
+                sum(range(1000))
+
+        def tracked_work():
+            track_current_thread()
+            deadline = time.perf_counter() + 0.05
+            while time.perf_counter() < deadline:
+                sum(range(1000))
+
+        other = threading.Thread(target=unrelated_busy_loop)
+        other.start()
+        sampler = StackSampler(interval=0.001).start()
+        token = activate(sampler)
+        try:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                executor.submit(copy_context().run, tracked_work).result()
+        finally:
+            deactivate(token)
+            samples = sampler.stop()
+            stop.set()
+            other.join()
+        self.assertTrue(any("tracked_work" in stack for stack in samples))
+        self.assertFalse(any("unrelated_busy_loop" in stack for stack in samples))
+
+
+class TestFormatting(unittest.TestCase):
+    """Test cases for profile output formats"""
+
+    def setUp(self):
+        self.samples = Counter({"main;handler;query": 3, "main;handler": 1})
+
+    def test_format_collapsed(self):
+        """Test that collapsed output lists the heaviest stacks first"""
+        lines = format_collapsed(self.samples).splitlines()
+        self.assertEqual(lines[0], "main;handler;query 3")
+        self.assertEqual(lines[1], "main;handler 1")
+
+    def test_format_summary(self):
+        """Test that the summary counts self and cumulative samples per function"""
+        text = format_summary(self.samples)
+        self.assertIn("4 samples", text)
+        handler_line = next(line for line in text.splitlines() if line.endswith("handler"))
+        self.assertEqual(handler_line.split()[:2], ["1", "4"])
+
+
+class TestProfileSession(unittest.TestCase):
+    """Test cases for admin-armed profiling sessions"""
+
+    def tearDown(self):
+        clear_session()
+
+    def test_claims_up_to_requested_count(self):
+        """Test that a session accepts exactly the requested number of requests"""
+        session = ProfileSession(2)
+        self.assertTrue(session.claim("/a"))
+        self.assertTrue(session.claim("/b"))
+        self.assertFalse(session.claim("/c"))
+        self.assertTrue(session.done)
+
+    def test_route_filter(self):
+        """Test that a route-limited session ignores other routes"""
+        session = ProfileSession(1, route="/products/{product_id}")
+        self.assertFalse(session.claim("/products/"))
+        self.assertTrue(session.claim("/products/{product_id}"))
+
+    def test_session_lifecycle(self):
+        """Test starting, reading and clearing the active session"""
+        session = start_session(3)
+        self.assertIs(get_session(), session)
+        session.add(Counter({"a;b": 2}))
+        self.assertEqual(session.status()["samples"], 2)
+        self.assertIs(clear_session(), session)
+        self.assertIsNone(get_session())
+
+
+if __name__ == '__main__':
+    unittest.main()
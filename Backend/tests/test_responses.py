@@ -0,0 +1,101 @@
+import unittest
+import json
+import os
+import sys
+from datetime import date
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from fastapi.encoders import jsonable_encoder
+
+import app.core.responses as responses
+from app.core.metrics import registry
+from app.core.responses import dump_json, json_response, SerializedCache
+from app.schemas.category import CategorySchema
+from app.schemas.review import ReviewSchema
+
+
+def stdlib_json(content):
+    return json.dumps(jsonable_encoder(content), ensure_ascii=False, allow_nan=False,
+                      indent=None, separators=(",", ":")).encode("utf-8")
+
+
+class TestDumpJson(unittest.TestCase):
+    """Test cases for the fast JSON encoder"""
+
+    def setUp(self):
+        self.review = ReviewSchema(id=1, product_id=2, seller_id=3, buyer="José",
+                                   review="Excelente cámara", rating=5, date=date(2024, 5, 1))
+
+    def test_model_matches_stdlib_encoding(self):
+        """Test that a single schema encodes byte for byte like the stdlib path"""
+        self.assertEqual(dump_json(self.review), stdlib_json(self.review))
+
+    def test_list_matches_stdlib_encoding(self):
+        """Test that a list of schemas encodes byte for byte like the stdlib path"""
+        reviews = [self.review, self.review.model_copy(update={"id": 2, "review": None, "date": None})]
+        self.assertEqual(dump_json(reviews), stdlib_json(reviews))
+
+    def test_empty_list(self):
+        """Test that an empty list encodes as []"""
+        self.assertEqual(dump_json([]), b"[]")
+
+    def test_plain_values_fall_back_to_stdlib(self):
+        """Test that dicts and other values use the stdlib encoder"""
+        content = {"name": "Cámara", "values": [1, 2.5, None]}
+        self.assertEqual(dump_json(content), stdlib_json(content))
+
+    def test_json_response(self):
+        """Test that json_response sets the body, status and media type"""
+        response = json_response(self.review, status_code=201)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.media_type, "application/json")
+        self.assertEqual(response.body, stdlib_json(self.review))
+
+
+class TestSerializedCache(unittest.TestCase):
+    """Test cases for the pre-serialized response cache"""
+
+    def setUp(self):
+        registry.reset()
+        self.cache = SerializedCache()
+        self.db = {"categories": [{"id": 1, "name": "Electrónica"}]}
+        self.builds = 0
+
+    def build(self):
+        self.builds += 1
+        return [CategorySchema.model_validate(c) for c in self.db["categories"]]
+
+    def test_body_is_built_once_per_snapshot(self):
+        """Test that repeated requests on the same snapshot reuse the serialized body"""
+        first = self.cache.get("categories", self.db, self.build)
+        second = self.cache.get("categories", self.db, self.build)
+        self.assertIs(first, second)
+        self.assertEqual(self.builds, 1)
+        self.assertEqual(first.body, stdlib_json(self.build()))
+        self.assertEqual(registry.get_counter("cache_requests_total", ("categories", "hit")), 1)
+        self.assertEqual(registry.get_counter("cache_requests_total", ("categories", "miss")), 1)
+
+    def test_new_snapshot_invalidates(self):
+        """Test that a different db object rebuilds the entry"""
+        self.cache.get("categories", self.db, self.build)
+        self.db = {"categories": []}
+        entry = self.cache.get("categories", self.db, self.build)
+        self.assertEqual(self.builds, 2)
+        self.assertEqual(entry.body, b"[]")
+
+    def test_data_version_change_invalidates(self):
+        """Test that a data reload rebuilds the entry even for the same db object"""
+        original = responses.get_data_version
+        try:
+            responses.get_data_version = lambda: 1
+            self.cache.get("categories", self.db, self.build)
+            responses.get_data_version = lambda: 2
+            self.cache.get("categories", self.db, self.build)
+        finally:
+            responses.get_data_version = original
+        self.assertEqual(self.builds, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,8 +7,10 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from app.services.review_service import (
     list_reviews, get_review_by_id, get_reviews_by_key,
-    calculate_ratings_count, calculate_average_rating, generate_general_rating
+    calculate_ratings_count, calculate_average_rating, generate_general_rating,
+    get_product_reviews_page
 )
+from app.repository.snapshot import DataSnapshot
 from app.schemas.review import ReviewSchema
 from app.schemas.general_rating import GeneralRating
 
@@ -215,5 +217,71 @@ class TestReviewService(unittest.TestCase):
         self.assertEqual(review.rating, 5)
 
 
+class TestProductReviewsPage(unittest.TestCase):
+    """Test cases for paginated product reviews."""
+
+    def setUp(self):
+        """Set up a db with one product and reviews in file order."""
+        self.db = {
+            "products": [{"id": 1}, {"id": 2}],
+            "reviews": [
+                {"id": 1, "product_id": 1, "seller_id": 1, "buyer": "Carlos", "rating": 5, "date": "2024-05-01"},
+                {"id": 2, "product_id": 1, "seller_id": 1, "buyer": "Ana", "rating": 3, "date": "2024-05-03"},
+                {"id": 3, "product_id": 1, "seller_id": 1, "buyer": "Luis", "rating": 4, "date": "2024-05-02"},
+                {"id": 4, "product_id": 1, "seller_id": 1, "buyer": "María", "rating": 5, "date": "2024-05-04"},
+                {"id": 5, "product_id": 1, "seller_id": 1, "buyer": "Sergio", "rating": 1, "date": None},
+            ],
+        }
+
+    def ids(self, db, **kwargs):
+        return [r.id for r in get_product_reviews_page(db, 1, **kwargs).items]
+
+    def test_default_is_newest_first(self):
+        """Test that reviews are sorted by date, newest first, undated last."""
+        page = get_product_reviews_page(self.db, 1)
+        self.assertEqual([r.id for r in page.items], [4, 2, 3, 1, 5])
+        self.assertEqual((page.total, page.page, page.page_size, page.pages), (5, 1, 20, 1))
+
+    def test_pagination(self):
+        """Test that pages slice the sorted list."""
+        self.assertEqual(self.ids(self.db, page=1, page_size=2), [4, 2])
+        self.assertEqual(self.ids(self.db, page=3, page_size=2), [5])
+        self.assertEqual(self.ids(self.db, page=4, page_size=2), [])
+        self.assertEqual(get_product_reviews_page(self.db, 1, page_size=2).pages, 3)
+
+    def test_ascending_order(self):
+        """Test that order=asc reverses the listing."""
+        self.assertEqual(self.ids(self.db, order="asc"), [5, 1, 3, 2, 4])
+        self.assertEqual(self.ids(self.db, order="asc", page=2, page_size=2), [3, 2])
+
+    def test_sort_by_rating(self):
+        """Test sorting by rating with newest first among equal ratings."""
+        self.assertEqual(self.ids(self.db, sort="rating"), [4, 1, 3, 2, 5])
+
+    def test_rating_filter(self):
+        """Test that the rating filter keeps only matching reviews."""
+        page = get_product_reviews_page(self.db, 1, rating=5)
+        self.assertEqual([r.id for r in page.items], [4, 1])
+        self.assertEqual(page.total, 2)
+
+    def test_product_without_reviews(self):
+        """Test that a product without reviews returns an empty page."""
+        page = get_product_reviews_page(self.db, 2)
+        self.assertEqual(page.items, [])
+        self.assertEqual((page.total, page.pages), (0, 0))
+
+    def test_unknown_product_raises(self):
+        """Test that an unknown product raises ValueError."""
+        with self.assertRaises(ValueError):
+            get_product_reviews_page(self.db, 999)
+
+    def test_snapshot_matches_plain_dict(self):
+        """Test that the indexed snapshot path returns the same pages as the scan path."""
+        snapshot = DataSnapshot(self.db)
+        for kwargs in ({}, {"order": "asc", "page_size": 2, "page": 2}, {"sort": "rating"},
+                       {"sort": "rating", "order": "asc"}, {"rating": 5}, {"rating": 2}):
+            self.assertEqual(self.ids(snapshot, **kwargs), self.ids(self.db, **kwargs), kwargs)
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
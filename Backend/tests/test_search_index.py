@@ -0,0 +1,98 @@
+import unittest
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.repository import search_products
+from app.repository.search_index import SearchIndex, fold, tokenize
+from app.repository.snapshot import DataSnapshot
+
+
+class TestTokenize(unittest.TestCase):
+    """Test cases for accent folding and tokenization"""
+
+    def test_fold_strips_accents(self):
+        """Test that accents and case are folded"""
+        self.assertEqual(fold("Cámara CORAZÓN Pingüino"), "camara corazon pinguino")
+
+    def test_tokenize(self):
+        """Test that text is split on non-alphanumerics after folding"""
+        self.assertEqual(tokenize("Teléfono 5G, 128GB (rápido)"), ["telefono", "5g", "128gb", "rapido"])
+
+
+class TestSearchIndex(unittest.TestCase):
+    """Test cases for the BM25 product index"""
+
+    def setUp(self):
+        self.products = [
+            {"id": 1, "title": "Samsung Galaxy S23", "description": "Teléfono con cámara de 200MP",
+             "features": {"color": ["Negro", "Verde"]}},
+            {"id": 2, "title": "Cámara Sony Alpha", "description": "Cámara mirrorless compacta",
+             "features": {"sensor": "Full frame"}},
+            {"id": 3, "title": "Apple iPhone 14", "description": "Smartphone con cámara triple",
+             "features": {"color": ["Negro"]}},
+            {"id": 4, "title": "Samsung Galaxy Tab", "description": "Tablet para estudiar", "features": None},
+        ]
+        self.index = SearchIndex(self.products)
+
+    def ids(self, query, **kwargs):
+        return [product["id"] for _, product in self.index.search(query, **kwargs)]
+
+    def test_accent_insensitive(self):
+        """Test that queries match regardless of accents"""
+        self.assertEqual(set(self.ids("camara")), {1, 2, 3})
+        self.assertEqual(self.ids("camara"), self.ids("CÁMARA"))
+
+    def test_title_matches_rank_first(self):
+        """Test that a title match outranks description-only matches"""
+        self.assertEqual(self.ids("cámara")[0], 2)
+
+    def test_multiple_terms_rank_documents_with_all_terms_first(self):
+        """Test that documents matching more query terms score higher"""
+        self.assertEqual(self.ids("samsung tab", prefix=False)[0], 4)
+
+    def test_feature_values_are_indexed(self):
+        """Test that feature values are searchable"""
+        self.assertEqual(set(self.ids("negro")), {1, 3})
+        self.assertEqual(self.ids("full frame"), [2])
+
+    def test_prefix_on_last_term(self):
+        """Test that the last term matches as a prefix for autocomplete"""
+        self.assertEqual(set(self.ids("gala")), {1, 4})
+        self.assertEqual(set(self.ids("samsung tab")), {1, 4})
+        self.assertEqual(self.ids("gala", prefix=False), [])
+
+    def test_short_prefix_requires_exact_term(self):
+        """Test that one-character prefixes are not expanded"""
+        self.assertEqual(self.ids("s"), [])
+
+    def test_limit_and_ties_keep_catalog_order(self):
+        """Test that limit truncates and equal scores keep catalog order"""
+        self.assertEqual(len(self.index.search("galaxy", limit=1)), 1)
+        twins = [{"id": i, "title": "Moto G", "description": "", "features": None} for i in (7, 5, 9)]
+        index = SearchIndex(twins)
+        self.assertEqual([p["id"] for _, p in index.search("moto")], [7, 5, 9])
+
+    def test_no_match(self):
+        """Test that unknown and empty queries return nothing"""
+        self.assertEqual(self.ids("inexistente"), [])
+        self.assertEqual(self.ids("¿?"), [])
+
+    def test_truncated_postings_keep_highest_impact(self):
+        """Test that truncation keeps the best scoring documents for a term"""
+        index = SearchIndex(self.products, max_postings=1)
+        self.assertEqual([p["id"] for _, p in index.search("cámara", prefix=False)], [2])
+        self.assertEqual(index.document_frequency["camara"], 3)
+
+    def test_repository_search_on_snapshot_and_dict(self):
+        """Test that the repository search gives the same results with and without a snapshot"""
+        db = {"products": self.products}
+        snapshot = DataSnapshot(db)
+        for query in ("cámara", "samsung gal", "negro"):
+            self.assertEqual([p["id"] for p in search_products(snapshot, query)],
+                             [p["id"] for p in search_products(db, query)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -18,7 +18,14 @@ from app.core.security import (
     SECRET_KEY,
     ALGORITHM,
     ACCESS_TOKEN_EXPIRE_MINUTES,
-    fake_user
+    fake_user,
+    create_refresh_token,
+    rotate_refresh_token,
+    decode_token,
+    revoke_token,
+    revoked_tokens,
+    TokenRevocationList,
+    REFRESH_TOKEN_TYPE
 )
 
 
@@ -46,6 +53,19 @@ class TestAuthentication(unittest.TestCase):
         result = authenticate_user("", "")
         self.assertIsNone(result)
 
+    @patch('app.core.security.get_user_repository')
+    def test_authenticate_user_inactive(self, mock_get_repo):
+        """Test that inactive users cannot authenticate."""
+        mock_get_repo.return_value.get.return_value = {
+            "username": "janedoe", "role": "user", "active": False, "password": fake_user["password"]
+        }
+        self.assertIsNone(authenticate_user("janedoe", "testpass"))
+
+    def test_authenticate_user_returns_role(self):
+        """Test that the user's role is returned on success."""
+        result = authenticate_user("testuser", "testpass")
+        self.assertEqual(result["role"], "user")
+
 
 class TestPasswordHashing(unittest.TestCase):
     """Test cases for password hashing and verification functions."""
@@ -211,6 +231,68 @@ class TestGetCurrentUser(unittest.TestCase):
         self.assertEqual(context.exception.detail, "Could not validate credentials")
 
 
+class TestRefreshTokens(unittest.TestCase):
+    """Test cases for refresh tokens and token revocation."""
+
+    def setUp(self):
+        revoked_tokens.clear()
+
+    def test_refresh_token_rejected_as_access_token(self):
+        """Test that a refresh token cannot authenticate requests."""
+        token = create_refresh_token({"sub": "testuser"})
+        with self.assertRaises(HTTPException) as context:
+            get_current_user(token)
+        self.assertEqual(context.exception.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_rotate_refresh_token(self):
+        """Test that rotation issues a new pair and revokes the old refresh token."""
+        refresh_token = create_refresh_token({"sub": "testuser", "role": "user"})
+        tokens = rotate_refresh_token(refresh_token)
+        self.assertEqual(get_current_user(tokens["access_token"])["username"], "testuser")
+        self.assertEqual(decode_token(tokens["refresh_token"], REFRESH_TOKEN_TYPE)["role"], "user")
+        with self.assertRaises(HTTPException):
+            rotate_refresh_token(refresh_token)
+
+    @patch('app.core.security.get_user_repository')
+    def test_rotate_refresh_token_uses_current_user(self, mock_get_repo):
+        """Test that rotation takes the role from the repository and rejects inactive users."""
+        mock_get_repo.return_value.get.return_value = {
+            "username": "janedoe", "role": "admin", "active": True, "password": fake_user["password"]
+        }
+        tokens = rotate_refresh_token(create_refresh_token({"sub": "janedoe", "role": "user"}))
+        self.assertEqual(get_current_user(tokens["access_token"])["role"], "admin")
+
+        mock_get_repo.return_value.get.return_value["active"] = False
+        with self.assertRaises(HTTPException):
+            rotate_refresh_token(tokens["refresh_token"])
+        mock_get_repo.return_value.get.return_value = None
+        with self.assertRaises(HTTPException):
+            rotate_refresh_token(create_refresh_token({"sub": "janedoe"}))
+
+    def test_revoke_reports_first_revocation_only(self):
+        """Test that only the first revocation of an id succeeds."""
+        revocations = TokenRevocationList()
+        self.assertTrue(revocations.revoke("jti", time.time() + 60))
+        self.assertFalse(revocations.revoke("jti", time.time() + 60))
+
+    def test_revoked_access_token_rejected(self):
+        """Test that get_current_user rejects revoked access tokens."""
+        token = create_access_token({"sub": "testuser"})
+        revoke_token(decode_token(token))
+        with self.assertRaises(HTTPException) as context:
+            get_current_user(token)
+        self.assertEqual(context.exception.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_revocation_list_prunes_expired_entries(self):
+        """Test that expired ids are pruned when new ids are revoked."""
+        revocations = TokenRevocationList()
+        revocations.revoke("old", time.time() - 1)
+        revocations.revoke("new", time.time() + 60)
+        self.assertFalse(revocations.is_revoked("old"))
+        self.assertTrue(revocations.is_revoked("new"))
+        self.assertEqual(len(revocations), 1)
+
+
 class TestSecurityConstants(unittest.TestCase):
     """Test cases for security configuration constants."""
     
@@ -6,7 +6,8 @@ from unittest.mock import patch, MagicMock
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from app.schemas.seller import SellerSchema
-from app.services.seller_service import list_sellers, get_seller_by_id
+from app.services.seller_service import list_sellers, get_seller_by_id, get_seller_products_page
+from app.repository.snapshot import DataSnapshot
 from app.schemas.general_rating import GeneralRating
 
 
@@ -168,5 +169,65 @@ class TestSellerService(unittest.TestCase):
             SellerSchema.model_validate(invalid_data)
 
 
+class TestSellerProductsPage(unittest.TestCase):
+    """Test cases for the paginated seller catalog."""
+
+    def setUp(self):
+        """Set up a db where seller 1 owns three products and seller 2 one."""
+        def product(product_id, seller_id):
+            return {"id": product_id, "title": f"Producto {product_id}", "description": "", "price": 10.0,
+                    "images": [], "seller_id": seller_id, "payment_methods_ids": [], "stock": 1,
+                    "category_ids": []}
+        self.db = {
+            "sellers": [
+                {"id": 1, "name": "Apple Store", "location": "CDMX", "email": "a@a.com", "phone": "1"},
+                {"id": 2, "name": "Samsung Shop", "location": "GDL", "email": "s@s.com", "phone": "2"},
+                {"id": 3, "name": "Xiaomi Center", "location": "MTY", "email": "x@x.com", "phone": "3"},
+            ],
+            "products": [product(1, 1), product(2, 2), product(3, 1), product(4, 1)],
+            "categories": [],
+            "payment_methods": [],
+            "reviews": [
+                {"id": 1, "product_id": 1, "seller_id": 1, "buyer": "Ana", "rating": 5, "date": "2024-01-01"},
+                {"id": 2, "product_id": 3, "seller_id": 1, "buyer": "Luis", "rating": 3, "date": "2024-01-02"},
+            ],
+        }
+
+    def test_first_page(self):
+        """Test that the page holds the seller's products in catalog order plus the seller rating."""
+        for db in (self.db, DataSnapshot(self.db)):
+            page = get_seller_products_page(db, 1, page=1, page_size=2)
+            self.assertEqual([p.id for p in page.items], [1, 3])
+            self.assertEqual((page.total, page.pages), (3, 2))
+            self.assertEqual(page.seller.name, "Apple Store")
+            self.assertEqual(page.seller.rating_info.reviews_count, 2)
+            self.assertEqual(page.seller.rating_info.average_rating, 4.0)
+            self.assertEqual(page.items[0].rating_info.reviews_count, 1)
+
+    def test_last_page(self):
+        """Test the last partial page."""
+        page = get_seller_products_page(DataSnapshot(self.db), 1, page=2, page_size=2)
+        self.assertEqual([p.id for p in page.items], [4])
+
+    @patch('app.services.seller_service.generate_general_rating')
+    def test_seller_rating_computed_once(self, mock_rating):
+        """Test that the seller rating is generated once per response."""
+        mock_rating.return_value = GeneralRating(
+            reviews_count=0, ratings_count={5: 0, 4: 0, 3: 0, 2: 0, 1: 0}, average_rating=0)
+        get_seller_products_page(self.db, 1)
+        mock_rating.assert_called_once_with(self.db, "seller_id", 1)
+
+    def test_seller_without_products(self):
+        """Test that a seller with no products gets an empty page."""
+        page = get_seller_products_page(DataSnapshot(self.db), 3)
+        self.assertEqual(page.items, [])
+        self.assertEqual(page.total, 0)
+
+    def test_unknown_seller(self):
+        """Test that an unknown seller raises ValueError."""
+        with self.assertRaises(ValueError):
+            get_seller_products_page(self.db, 99)
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -0,0 +1,176 @@
+import unittest
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.core.metrics import registry
+from app.repository import get_item_by_id, get_items_by_key, get_sorted_product_reviews, slice_page, query_products
+from app.repository.snapshot import DataSnapshot, SortedColumn
+
+
+class TestDataSnapshot(unittest.TestCase):
+    """Test cases for the indexed data snapshot"""
+
+    def setUp(self):
+        registry.reset()
+        self.tables = {
+            "products": [{"id": 1, "title": "A"}, {"id": 2, "title": "B"}],
+            "reviews": [
+                {"id": 1, "product_id": 1, "seller_id": 7, "rating": 4, "date": "2024-01-02"},
+                {"id": 2, "product_id": 2, "seller_id": 7, "rating": 5, "date": "2024-01-01"},
+                {"id": 3, "product_id": 1, "seller_id": 8, "rating": 5, "date": "2024-01-03"},
+            ],
+        }
+        self.db = DataSnapshot(self.tables, version=3)
+
+    def test_behaves_like_tables_dict(self):
+        """Test that the snapshot compares equal to the plain tables dict"""
+        self.assertEqual(self.db, self.tables)
+        self.assertEqual(self.db.version, 3)
+
+    def test_get_item_by_id_uses_index(self):
+        """Test that id lookups on a snapshot are index hits returning the shared row"""
+        self.assertIs(get_item_by_id(self.db, "products", 2), self.tables["products"][1])
+        self.assertEqual(registry.get_counter("repository_lookups_total", ("products", "index")), 1)
+        with self.assertRaises(ValueError):
+            get_item_by_id(self.db, "products", 99)
+
+    def test_get_items_by_key(self):
+        """Test grouped lookups keep table order on both the index and scan paths"""
+        for db in (self.db, self.tables):
+            self.assertEqual([r["id"] for r in get_items_by_key(db, "reviews", "product_id", 1)], [1, 3])
+            self.assertEqual([r["id"] for r in get_items_by_key(db, "reviews", "seller_id", 7)], [1, 2])
+            self.assertEqual(get_items_by_key(db, "reviews", "product_id", 99), [])
+        self.assertEqual(registry.get_counter("repository_lookups_total", ("reviews", "index")), 3)
+        self.assertEqual(registry.get_counter("repository_lookups_total", ("reviews", "scan")), 3)
+
+    def test_sorted_product_reviews(self):
+        """Test the pre-sorted review orderings"""
+        self.assertEqual([r["id"] for r in get_sorted_product_reviews(self.db, 1)], [3, 1])
+        self.assertEqual([r["id"] for r in get_sorted_product_reviews(self.db, 1, "rating")], [3, 1])
+        self.assertEqual([r["id"] for r in get_sorted_product_reviews(self.db, 1, rating=4)], [1])
+        self.assertEqual(get_sorted_product_reviews(self.db, 99), [])
+
+    def test_unsupported_sort(self):
+        """Test that an unknown sort raises ValueError"""
+        with self.assertRaises(ValueError):
+            get_sorted_product_reviews(self.db, 1, "buyer")
+
+    def test_null_stock_counts_as_out_of_stock(self):
+        """Test that facets and in-stock positions agree on products with null stock"""
+        db = DataSnapshot({"products": [
+            {"id": 1, "price": 10, "stock": None, "category_ids": [5]},
+            {"id": 2, "price": 20, "stock": 3, "category_ids": [5]},
+        ]})
+        self.assertEqual(db.category_facets[5]["stock"], {"in_stock": 1, "out_of_stock": 1})
+        self.assertEqual(db.in_stock_positions, [1])
+
+
+class TestSlicePage(unittest.TestCase):
+    """Test cases for page slicing"""
+
+    def test_forward(self):
+        """Test forward pages"""
+        items = list(range(10))
+        self.assertEqual(slice_page(items, 1, 4), [0, 1, 2, 3])
+        self.assertEqual(slice_page(items, 3, 4), [8, 9])
+        self.assertEqual(slice_page(items, 4, 4), [])
+
+    def test_reverse(self):
+        """Test pages read from the end of the list"""
+        items = list(range(10))
+        self.assertEqual(slice_page(items, 1, 4, reverse=True), [9, 8, 7, 6])
+        self.assertEqual(slice_page(items, 3, 4, reverse=True), [1, 0])
+        self.assertEqual(slice_page(items, 4, 4, reverse=True), [])
+
+
+class TestSortedColumn(unittest.TestCase):
+    """Test cases for the sorted numeric columns"""
+
+    def setUp(self):
+        self.rows = [{"price": 30}, {"price": 10}, {"price": 20}, {"price": 10}, {"price": None}]
+
+    def test_ascending_range(self):
+        """Test inclusive and open-ended ranges in ascending order"""
+        column = SortedColumn(self.rows, "price")
+        self.assertEqual(column.range(10, 20), [1, 3, 2])
+        self.assertEqual(column.range(high=10), [4, 1, 3])
+        self.assertEqual(column.range(25), [0])
+        self.assertEqual(column.range(40), [])
+
+    def test_descending_range_keeps_catalog_order_on_ties(self):
+        """Test descending ranges list equal values in catalog order"""
+        column = SortedColumn(self.rows, "price", descending=True)
+        self.assertEqual(column.range(10, 30), [0, 2, 1, 3])
+        self.assertEqual(column.range(15), [0, 2])
+
+
+class TestQueryProducts(unittest.TestCase):
+    """Test cases for filtered and sorted product listings"""
+
+    def setUp(self):
+        rng = random.Random(7)
+        self.db = {"products": [
+            {"id": i, "price": rng.choice([99.0, 250.0, 250.0, 480.5, 1200.0]), "stock": rng.choice([0, 0, 1, 8])}
+            for i in range(1, 201)
+        ]}
+        self.snapshot = DataSnapshot(self.db)
+
+    def ids(self, db, **kwargs):
+        return [p["id"] for p in query_products(db, **kwargs)[0]]
+
+    def test_no_filters_is_catalog_order(self):
+        """Test that no filters return every product in catalog order"""
+        self.assertEqual(self.ids(self.snapshot), list(range(1, 201)))
+
+    def test_price_sort_is_stable(self):
+        """Test that equal prices keep catalog order in both directions"""
+        for sort, sign in (("price_asc", 1), ("price_desc", -1)):
+            expected = [p["id"] for p in sorted(self.db["products"], key=lambda p: (sign * p["price"], p["id"]))]
+            self.assertEqual(self.ids(self.snapshot, sort=sort), expected)
+
+    def test_snapshot_matches_scan(self):
+        """Test that every filter combination agrees between the index and scan paths"""
+        for min_price in (None, 100, 250.0):
+            for max_price in (None, 250.0, 480.5):
+                for in_stock in (False, True):
+                    for sort in (None, "price_asc", "price_desc"):
+                        kwargs = dict(min_price=min_price, max_price=max_price, in_stock=in_stock, sort=sort)
+                        self.assertEqual(self.ids(self.snapshot, **kwargs), self.ids(self.db, **kwargs), kwargs)
+
+    def test_pages_match_full_listing(self):
+        """Test that each page is the matching slice of the full listing and totals agree"""
+        for kwargs in ({}, {"in_stock": True}, {"min_price": 250.0, "sort": "price_desc"},
+                       {"max_price": 480.5, "in_stock": True}, {"in_stock": True, "sort": "price_asc"}):
+            full = self.ids(self.snapshot, **kwargs)
+            for page in (1, 3, 50):
+                rows, total = query_products(self.snapshot, page=page, page_size=7, **kwargs)
+                self.assertEqual([p["id"] for p in rows], full[(page - 1) * 7:page * 7], kwargs)
+                self.assertEqual(total, len(full))
+                rows, total = query_products(self.db, page=page, page_size=7, **kwargs)
+                self.assertEqual([p["id"] for p in rows], full[(page - 1) * 7:page * 7], kwargs)
+                self.assertEqual(total, len(full))
+
+    def test_inverted_range_matches_scan(self):
+        """Test that min_price > max_price returns no products and a zero total on both paths"""
+        for in_stock in (False, True):
+            for sort in (None, "price_asc", "price_desc"):
+                for page in (None, 1, 2):
+                    kwargs = dict(min_price=1200.0, max_price=99.0, in_stock=in_stock, sort=sort, page=page)
+                    self.assertEqual(query_products(self.snapshot, **kwargs), ([], 0), kwargs)
+                    self.assertEqual(query_products(self.db, **kwargs), ([], 0), kwargs)
+
+    def test_in_stock(self):
+        """Test that in_stock excludes products without stock"""
+        self.assertTrue(all(p["stock"] > 0 for p in query_products(self.snapshot, in_stock=True)[0]))
+
+    def test_unsupported_sort(self):
+        """Test that an unknown sort raises ValueError"""
+        with self.assertRaises(ValueError):
+            query_products(self.snapshot, sort="rating")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.synthetic_data import generate_catalog, parse_scale
+from benchmarks.bench_backend import compare_with_baseline
+from app.schemas.product import ProductSchema
+from app.schemas.review import ReviewSchema
+
+
+class TestSyntheticCatalog(unittest.TestCase):
+    """Test cases for the benchmark catalog generator"""
+
+    def setUp(self):
+        self.db = generate_catalog(200, seed=7)
+
+    def test_tables_and_proportions(self):
+        """Test that all tables are generated with proportional sizes"""
+        self.assertEqual(len(self.db["products"]), 200)
+        self.assertGreaterEqual(len(self.db["categories"]), 10)
+        self.assertGreaterEqual(len(self.db["sellers"]), 1)
+        self.assertGreater(len(self.db["reviews"]), 0)
+
+    def test_referential_integrity(self):
+        """Test that products and reviews only reference existing rows"""
+        seller_ids = {s["id"] for s in self.db["sellers"]}
+        category_ids = {c["id"] for c in self.db["categories"]}
+        payment_ids = {pm["id"] for pm in self.db["payment_methods"]}
+        products = {p["id"]: p for p in self.db["products"]}
+        for product in products.values():
+            self.assertIn(product["seller_id"], seller_ids)
+            self.assertTrue(set(product["category_ids"]) <= category_ids)
+            self.assertTrue(set(product["payment_methods_ids"]) <= payment_ids)
+        for review in self.db["reviews"]:
+            self.assertEqual(review["seller_id"], products[review["product_id"]]["seller_id"])
+
+    def test_rows_validate_against_schemas(self):
+        """Test that generated rows are valid API schemas"""
+        ProductSchema.model_validate(self.db["products"][0])
+        ReviewSchema.model_validate(self.db["reviews"][0])
+
+    def test_deterministic_for_seed(self):
+        """Test that the same seed produces the same catalog"""
+        self.assertEqual(generate_catalog(50, seed=1), generate_catalog(50, seed=1))
+
+    def test_parse_scale(self):
+        """Test scale names and plain counts"""
+        self.assertEqual(parse_scale("1k"), 1_000)
+        self.assertEqual(parse_scale("1M"), 1_000_000)
+        self.assertEqual(parse_scale("2500"), 2500)
+
+
+class TestBaselineComparison(unittest.TestCase):
+    """Test cases for benchmark regression detection"""
+
+    def test_detects_regression_over_threshold(self):
+        """Test that only operations slower than the threshold are reported"""
+        baseline = {"1k": {"fast": {"median_ms": 1.0}, "slow": {"median_ms": 1.0}}}
+        results = {"1k": {"fast": {"median_ms": 1.2}, "slow": {"median_ms": 3.0},
+                          "new": {"median_ms": 5.0}, "_catalog": {"products": 1000}}}
+        regressions = compare_with_baseline(results, baseline, 1.5)
+        self.assertEqual(len(regressions), 1)
+        self.assertTrue(regressions[0].startswith("1k/slow"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+import json
+import os
+import tempfile
+import time
+import sys
+
+import bcrypt
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.repository.user_repository import UserRepository, is_bcrypt_hash
+
+
+def _fast_hash(password):
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=4)).decode('utf-8')
+
+
+class TestUserRepository(unittest.TestCase):
+    """Test cases for the username-indexed user store."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.users_file = os.path.join(self.temp_dir, 'user.json')
+        self.users = [
+            {"username": "admin", "email": "admin@example.com", "password": _fast_hash("adminpass"),
+             "role": "admin", "active": True},
+            {"username": "inactive", "email": "off@example.com", "password": _fast_hash("offpass"),
+             "role": "user", "active": False},
+        ]
+        self._write_users(self.users)
+
+    def tearDown(self):
+        if os.path.exists(self.users_file):
+            os.remove(self.users_file)
+        os.rmdir(self.temp_dir)
+
+    def _write_users(self, users):
+        with open(self.users_file, 'w', encoding='utf-8') as f:
+            json.dump(users, f)
+
+    def test_lookup_by_username(self):
+        """Test that users are indexed by username with their flags"""
+        repo = UserRepository(self.users_file)
+        user = repo.get("admin")
+        self.assertEqual(user["role"], "admin")
+        self.assertTrue(user["active"])
+        self.assertFalse(repo.get("inactive")["active"])
+        self.assertIsNone(repo.get("unknown"))
+
+    def test_plain_password_is_hashed_on_load(self):
+        """Test that legacy plain-text passwords are stored as bcrypt hashes"""
+        self._write_users([{"username": "legacy", "pwd": "plain123"}])
+        repo = UserRepository(self.users_file)
+        stored = repo.get("legacy")["password"]
+        self.assertTrue(is_bcrypt_hash(stored))
+        self.assertTrue(bcrypt.checkpw(b"plain123", stored.encode('utf-8')))
+        self.assertEqual(repo.get("legacy")["role"], "user")
+
+    def test_plain_password_memo_is_digest_keyed_and_bounded(self):
+        """Test that reloads reuse legacy hashes without keeping plain passwords, up to the memo limit"""
+        self._write_users([{"username": "legacy", "pwd": "plain123"}, {"username": "other", "pwd": "plain456"}])
+        with patch("app.repository.user_repository.HASH_MEMO_MAX_ENTRIES", 1):
+            repo = UserRepository(self.users_file)
+            stored = repo.get("other")["password"]
+            self.assertEqual(len(repo._hash_memo), 1)
+            self.assertFalse(any("plain" in part for key in repo._hash_memo for part in key))
+            self._write_users([{"username": "other", "pwd": "plain456"}])
+            repo.reload()
+        self.assertEqual(repo.get("other")["password"], stored)
+
+    def test_seed_users_are_overridden_by_file(self):
+        """Test that file entries take precedence over seed users"""
+        seed = [{"username": "admin", "password": _fast_hash("seed"), "role": "user"},
+                {"username": "seeded", "password": _fast_hash("seed")}]
+        repo = UserRepository(self.users_file, seed_users=seed)
+        self.assertEqual(repo.get("admin")["role"], "admin")
+        self.assertIsNotNone(repo.get("seeded"))
+        self.assertEqual(len(repo), 3)
+
+    def test_missing_file_keeps_seed_users(self):
+        """Test that a missing users file leaves only the seed users"""
+        repo = UserRepository(os.path.join(self.temp_dir, 'missing.json'),
+                              seed_users=[{"username": "seeded", "password": _fast_hash("seed")}])
+        self.assertEqual(len(repo), 1)
+
+    def test_hot_reload_on_file_change(self):
+        """Test that the index is rebuilt after the users file changes"""
+        repo = UserRepository(self.users_file, reload_interval=0)
+        self.assertIsNone(repo.get("newuser"))
+        self._write_users(self.users + [{"username": "newuser", "password": _fast_hash("x")}])
+        os.utime(self.users_file, (time.time() + 5, time.time() + 5))
+        self.assertIsNotNone(repo.get("newuser"))
+
+    def test_invalid_file_keeps_previous_users(self):
+        """Test that a broken users file does not drop the loaded users"""
+        repo = UserRepository(self.users_file)
+        with open(self.users_file, 'w', encoding='utf-8') as f:
+            f.write('{"broken": ')
+        repo.reload()
+        self.assertIsNotNone(repo.get("admin"))
+
+
+if __name__ == '__main__':
+    unittest.main()
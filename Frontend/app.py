@@ -1,16 +1,16 @@
 import streamlit as st
 
 from services.login_service import get_token
+from services.asset_registry import get_asset_registry
 
 
 def load_css():
-    """Cargar estilos CSS desde archivo externo"""
-    try:
-        with open("assets/styles.css", "r", encoding="utf-8") as f:
-            css_content = f.read()
-        st.markdown(f"<style>{css_content}</style>", unsafe_allow_html=True)
-    except FileNotFoundError:
+    """Cargar estilos CSS (leídos y minificados una vez por proceso)"""
+    css_content = get_asset_registry().css("styles.css")
+    if css_content is None:
         st.warning("No se pudo cargar el archivo de estilos CSS.")
+        return
+    st.markdown(f"<style>{css_content}</style>", unsafe_allow_html=True)
 
 
 def handle_login(username, password):
@@ -32,18 +32,16 @@ def main():
     # Make the page wider using "wide" layout
     st.set_page_config(
         page_title="Product Detail MeLi", 
-        page_icon="assets/icon.png",
+        page_icon=get_asset_registry().path("icon.png"),
         initial_sidebar_state="collapsed"
     )
     
     # Header estilo MercadoLibre
-    # Convertir la imagen a base64 para incluirla en el HTML
-    import base64
-    try:
-        with open("assets/logo_meli.webp", "rb") as img_file:
-            img_data = base64.b64encode(img_file.read()).decode()
-            logo_html = f'<img src="data:image/webp;base64,{img_data}" alt="MercadoLibre" style="height: 40px; max-width: 200px; object-fit: contain;">'
-    except FileNotFoundError:
+    # El logo se codifica en base64 una sola vez por proceso
+    logo_uri = get_asset_registry().data_uri("logo_meli.webp")
+    if logo_uri:
+        logo_html = f'<img src="{logo_uri}" alt="MercadoLibre" style="height: 40px; max-width: 200px; object-fit: contain;">'
+    else:
         logo_html = '<span style="font-family: Arial, sans-serif; font-size: 24px; font-weight: bold; color: #333;">MercadoLibre</span>'
     
     st.markdown(f"""
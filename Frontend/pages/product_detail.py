@@ -1,85 +1,74 @@
 
-import base64
-import os
-import tempfile
-from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
-import requests
 import streamlit as st
-from PIL import Image
 from streamlit_carousel import carousel
 
 from models.product import Product
-from services.product_service import get_product_detail, get_similar_products
-from services.review_service import get_product_reviews
+from services.product_service import get_product_image, get_product_page, get_similar_products
+from services.review_service import get_product_reviews_page, REVIEWS_PAGE_SIZE
 from services.seller_service import get_seller_detail
+from services.image_cache import get_image_cache
+from services.image_pipeline import run_with_deadline
+from services.data_uri import DataUriCache, to_data_uri
+from services.asset_registry import get_asset_registry
 
-NO_IMAGE_PATH = "assets/no_image.png"
+try:
+    from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+except ImportError:
+    add_script_run_ctx = get_script_run_ctx = None
 
+# Tamaños de las variantes que genera el backend (carousel: recorte exacto, thumb: cabe dentro)
+CAROUSEL_SIZE = (250, 400)
+THUMBNAIL_SIZE = (70, 70)
 
-def load_product_detail_css():
-    """Load product detail specific CSS styles from external file"""
-    try:
-        with open("assets/product_detail_styles.css", "r", encoding="utf-8") as f:
-            css_content = f.read()
-        st.markdown(f"<style>{css_content}</style>", unsafe_allow_html=True)
-    except FileNotFoundError:
-        st.warning("Could not load product detail CSS styles file.")
+# Miniaturas de productos relacionados ya codificadas, por URL de origen
+thumbnail_data_uris = DataUriCache()
 
+# Cantidad de llamadas simultáneas al backend al cargar la página
+PAGE_DATA_WORKERS = 4
 
-# Ensure the assets directory and no_image.png exist to avoid file-not-found errors
-if not os.path.exists("assets"):
-    os.makedirs("assets")
-if not os.path.exists(NO_IMAGE_PATH):
-    img = Image.new("RGB", (100, 100), color=(200, 200, 200))
-    img.save(NO_IMAGE_PATH)
 
+def load_product_detail_css():
+    """Load product detail specific CSS styles (read and minified once per process)"""
+    css_content = get_asset_registry().css("product_detail_styles.css")
+    if css_content is None:
+        st.warning("Could not load product detail CSS styles file.")
+        return
+    st.markdown(f"<style>{css_content}</style>", unsafe_allow_html=True)
 
-def open_image_from_url(img_url, timeout=3):
-    try:
-        resp = requests.get(img_url, timeout=timeout)
-        img = Image.open(BytesIO(resp.content))
-        img = img.convert("RGB")
-        return img
-    except Exception:
+
+def load_variant_path(product_id, index, img_url, variant, size):
+    """
+    Return a local file with the backend's precomputed ``variant`` of the
+    product's ``index``-th image, fetched once and kept in the image cache
+    under its source URL, or None if the backend cannot serve it.
+    """
+    image_cache = get_image_cache()
+    cached_path = image_cache.get(img_url, size)
+    if cached_path:
+        return cached_path
+    data = get_product_image(product_id, index, variant)
+    if not data:
         return None
+    return image_cache.put_bytes(img_url, size, data)
 
 
-def save_temp_image(img, prefix="carousel_img_"):
-    temp_dir = tempfile.gettempdir()
-    temp_path = os.path.join(temp_dir, f"{prefix}{next(tempfile._get_candidate_names())}.jpg")
-    img.save(temp_path, format="JPEG")
-    return temp_path
+def load_carousel_image(product_id, index, img_url):
+    """Return the carousel-sized file of one product image, or the no-image placeholder"""
+    path = load_variant_path(product_id, index, img_url, "carousel", CAROUSEL_SIZE)
+    return path or get_asset_registry().no_image_path()
 
+def get_carousel_images(image_paths):
+    return [
+        {"img": img_path, "title": f"{idx + 1}", "text": "..."}
+        for idx, img_path in enumerate(image_paths)
+    ]
 
-def process_and_save_image(img_url, target_width=250, target_height=400):
-    img = open_image_from_url(img_url)
-    if not img:
-        return NO_IMAGE_PATH
-    img_ratio = img.width / img.height
-    target_ratio = target_width / target_height
-    if img_ratio > target_ratio:
-        new_width = int(img.height * target_ratio)
-        left = (img.width - new_width) // 2
-        img = img.crop((left, 0, left + new_width, img.height))
-    else:
-        new_height = int(img.width / target_ratio)
-        top = (img.height - new_height) // 2
-        img = img.crop((0, top, img.width, top + new_height))
-    img = img.resize((target_width, target_height), Image.LANCZOS)
-    return save_temp_image(img)
-
-def get_carousel_images(product):
-    images = []
-    if product.images:
-        for idx, img_url in enumerate(product.images):
-            img_path = process_and_save_image(img_url)
-            images.append({"img": img_path, "title": f"{idx + 1}", "text": "..."})
-    return images
-
-def render_product_images(product):
+def render_product_images(product, image_paths):
     inner_col1, inner_col2 = st.columns([5, 4])
-    images = get_carousel_images(product)
+    images = get_carousel_images(image_paths)
     with inner_col1:
         if images:
             carousel(items=images, width=250, container_height=400)
@@ -269,25 +258,36 @@ def render_product_info(product, inner_col2):
         render_product_payment_methods(product)
 
 
+# Placeholder dibujado con CSS: no_image.png pesa ~1 MB y se repetiría en cada delta de la página
+NO_IMAGE_HTML = (
+    "<div style='width:70px; height:70px; margin:auto; background:#e9ecef; border-radius:4px; "
+    "display:flex; align-items:center; justify-content:center; color:#6c757d; font-size:0.7em;'>"
+    "No image</div>"
+)
+
+def get_no_image_html():
+    return NO_IMAGE_HTML
+
+def load_thumbnail_data_uri(product_id, img_url):
+    """Build the thumbnail data URI of a product's first image from the backend's thumb variant"""
+    path = load_variant_path(product_id, 0, img_url, "thumb", THUMBNAIL_SIZE)
+    if not path:
+        return None
+    try:
+        with open(path, "rb") as f:
+            return to_data_uri(f.read(), "image/jpeg")
+    except OSError:
+        return None
+
 def get_related_product_image_html(related):
     if related.images:
-        img = open_image_from_url(related.images[0])
-        if img:
-            buf = BytesIO()
-            img.thumbnail((70, 70))
-            img.save(buf, format="PNG")
-            img_b64 = base64.b64encode(buf.getvalue()).decode()
-            return f"<img src='data:image/png;base64,{img_b64}' width='70'/>"
-    try:
-        with open(NO_IMAGE_PATH, "rb") as f:
-            img_bytes = f.read()
-        img_b64 = base64.b64encode(img_bytes).decode()
-        return f"<img src='data:image/png;base64,{img_b64}' width='70'/>"
-    except Exception:
-        return "<span style='color:red'>No image</span>"
-
-def get_related_product_table_html(related, item_width=120, item_height=280):
-    img_html = get_related_product_image_html(related)
+        img_url = related.images[0]
+        thumbnail_uri = thumbnail_data_uris.get(img_url, partial(load_thumbnail_data_uri, related.id, img_url))
+        if thumbnail_uri:
+            return f"<img src='{thumbnail_uri}' width='70'/>"
+    return get_no_image_html()
+
+def get_related_product_table_html(related, img_html, item_width=120, item_height=280):
     title = related.title
     if len(title) > 25:
         title = title[:22] + "..."
@@ -340,14 +340,14 @@ def get_related_product_table_html(related, item_width=120, item_height=280):
         </div>
     """
 
-def render_single_related_product(related, col):
+def render_single_related_product(related, col, img_html):
     with col:
-        table_html = get_related_product_table_html(related)
+        table_html = get_related_product_table_html(related, img_html)
         st.markdown(table_html, unsafe_allow_html=True)
         
 
-def render_related_products(similar_products, vertical=False):
-    """Render related products using pre-fetched similar products data"""
+def render_related_products(similar_products, thumbnails, vertical=False):
+    """Render related products using pre-fetched similar products data and thumbnails"""
     st.markdown("---")
     st.markdown("""
     <div style='text-align: center; margin: 2rem 0;'>
@@ -370,14 +370,14 @@ def render_related_products(similar_products, vertical=False):
     """, unsafe_allow_html=True)
     if similar_products:
         if vertical:
-            for related in similar_products:
+            for related, img_html in zip(similar_products, thumbnails):
                 col = st.container()
-                render_single_related_product(related, col)
+                render_single_related_product(related, col, img_html)
                 st.markdown("---")
         else:
             cols = st.columns(len(similar_products))
             for idx, related in enumerate(similar_products):
-                render_single_related_product(related, cols[idx])
+                render_single_related_product(related, cols[idx], thumbnails[idx])
     else:
         st.info("No related products available.")
 
@@ -447,7 +447,7 @@ def render_checkout_info(product: Product):
     1 year manufacturer warranty.
     """)
     
-def render_seller_info(product: Product):
+def render_seller_info(product: Product, seller):
     st.markdown("---")
     st.markdown("""
     <div style='margin: 1.5rem 0;'>
@@ -464,7 +464,6 @@ def render_seller_info(product: Product):
     </div>
     """, unsafe_allow_html=True)
     
-    seller = get_seller_detail(product.seller_id)
     if seller:
         st.markdown(f"""
         <div style='background: #f8f9fa; 
@@ -521,7 +520,63 @@ def render_seller_info(product: Product):
     else:
         st.error("Seller information could not be retrieved.")
 
-def render_reviews(product: Product):
+def render_rating_histogram(product: Product):
+    """Summarize the rating distribution from the product's precomputed rating_info"""
+    rating_info = product.rating_info
+    if not rating_info or not rating_info.reviews_count:
+        return
+    total = rating_info.reviews_count
+    rows = []
+    for stars in range(5, 0, -1):
+        count = rating_info.ratings_count.get(stars, 0)
+        rows.append(f"""
+        <div style='display: flex; align-items: center; gap: 0.5rem; margin: 0.25rem 0;'>
+            <span style='width: 2.5rem; color: #666; font-size: 0.9rem;'>{stars} ★</span>
+            <div style='flex: 1; background: #eeeeee; height: 6px; border-radius: 3px;'>
+                <div style='background: #3483fa; height: 6px; border-radius: 3px; width: {count / total * 100:.1f}%;'></div>
+            </div>
+            <span style='width: 2.5rem; text-align: right; color: #666; font-size: 0.9rem;'>{count}</span>
+        </div>""")
+    st.markdown(f"""
+    <div style='margin: 1rem 0 1.5rem 0;'>
+        <div style='font-size: 0.9rem; color: #666; margin-bottom: 0.5rem;'>
+            <strong style='font-size: 1.4rem; color: #1976d2;'>{rating_info.average_rating:.1f}</strong>
+            average from {total} reviews
+        </div>
+        {"".join(rows)}
+    </div>
+    """, unsafe_allow_html=True)
+
+def get_review_html(review):
+    return f"""
+            <div style='background: #f8f9fa; 
+                        border-radius: 8px; 
+                        padding: 1rem; 
+                        margin: 1rem 0;
+                        border-left: 4px solid #3483fa;'>
+                <div style='font-weight: 600; color: #2c3e50; margin-bottom: 0.5rem;'>
+                    {review.buyer} - <span style='color: #ffc107;'>{review.rating} ★</span>
+                </div>
+                <div style='color: #495057; line-height: 1.5;'>
+                    {review.review or "No review text provided."}
+                </div>
+            </div>
+            """
+
+def _reviews_pages_key(product_id):
+    return f"reviews_pages_{product_id}"
+
+def _load_more_reviews(product_id):
+    key = _reviews_pages_key(product_id)
+    st.session_state[key] = st.session_state.get(key, 1) + 1
+
+def render_reviews(product: Product, first_page, total):
+    """
+    Render the reviews loaded so far, one markdown block per page, followed by
+    a "load more" button while there are more on the backend. The number of
+    loaded pages lives in session_state; pages after the first are fetched
+    on demand (and served from the response cache on later reruns).
+    """
     st.markdown("---")
     st.markdown("""
     <div style='margin: 2rem 0 1.5rem 0;'>
@@ -537,25 +592,31 @@ def render_reviews(product: Product):
         </h3>
     </div>
     """, unsafe_allow_html=True)
-    reviews = get_product_reviews(product.id)
-    if reviews:
-        for review in reviews:
-            st.markdown(f"""
-            <div style='background: #f8f9fa; 
-                        border-radius: 8px; 
-                        padding: 1rem; 
-                        margin: 1rem 0;
-                        border-left: 4px solid #3483fa;'>
-                <div style='font-weight: 600; color: #2c3e50; margin-bottom: 0.5rem;'>
-                    {review.buyer} - <span style='color: #ffc107;'>{review.rating} ★</span>
-                </div>
-                <div style='color: #495057; line-height: 1.5;'>
-                    {review.review or "No review text provided."}
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-    else:
+    render_rating_histogram(product)
+    if not first_page:
         st.info("No reviews available for this product.")
+        return
+
+    pages_loaded = st.session_state.get(_reviews_pages_key(product.id), 1)
+    shown = 0
+    for page in range(1, pages_loaded + 1):
+        if page == 1:
+            reviews = first_page
+        else:
+            reviews, total = get_product_reviews_page(product.id, page, REVIEWS_PAGE_SIZE)
+        if not reviews:
+            break
+        st.markdown("".join(get_review_html(review) for review in reviews), unsafe_allow_html=True)
+        shown += len(reviews)
+
+    remaining = total - shown
+    if remaining > 0:
+        st.button(
+            f"Load more reviews ({remaining} remaining)",
+            key=f"load_more_reviews_{product.id}",
+            on_click=_load_more_reviews,
+            args=(product.id,),
+        )
 
 def render_product_description(product):
     st.markdown("---")
@@ -572,26 +633,88 @@ def render_product_description(product):
     """, unsafe_allow_html=True)
     st.write(product.description or "No description available.")
                 
+def _submit(executor, ctx, fn, *args):
+    """Run ``fn`` in the pool with the script run context attached, so services can call st.error"""
+    def run():
+        if ctx is not None:
+            add_script_run_ctx(ctx=ctx)
+        return fn(*args)
+    return executor.submit(run)
+
+
+def load_product_page_data(product_id):
+    """
+    Fetch everything the product page needs from the backend.
+
+    The product is requested with its seller, first page of reviews and
+    similar products embedded, so a page render normally costs one backend
+    call. Any part the backend did not embed is fetched concurrently
+    afterwards, so the page waits for the slowest missing call instead of
+    the sum of all of them.
+    Returns None when the product does not exist.
+    """
+    data = get_product_page(product_id, REVIEWS_PAGE_SIZE)
+    if not data:
+        return None
+    product = data["product"]
+    missing = [key for key in ("similar_products", "reviews", "seller") if key not in data]
+    if not missing:
+        return data
+    ctx = get_script_run_ctx() if get_script_run_ctx is not None else None
+    with ThreadPoolExecutor(max_workers=PAGE_DATA_WORKERS) as executor:
+        futures = {}
+        if "similar_products" in missing:
+            futures["similar_products"] = _submit(executor, ctx, get_similar_products, product_id)
+        if "reviews" in missing:
+            futures["reviews"] = _submit(executor, ctx, get_product_reviews_page, product_id, 1, REVIEWS_PAGE_SIZE)
+        if "seller" in missing:
+            futures["seller"] = _submit(executor, ctx, get_seller_detail, product.seller_id)
+        for key, future in futures.items():
+            if key == "reviews":
+                data["reviews"], data["reviews_total"] = future.result()
+            else:
+                data[key] = future.result()
+    return data
+
+
+def load_page_images(product, similar_products):
+    """
+    Fetch the carousel images and related product thumbnails, resized by the
+    backend, concurrently, bounded by the shared image pool and a per-page deadline.
+    Images still pending when the deadline expires are rendered with the
+    no-image placeholder.
+    """
+    image_urls = product.images or []
+    tasks = [partial(load_carousel_image, product.id, index, url) for index, url in enumerate(image_urls)]
+    tasks += [partial(get_related_product_image_html, related) for related in similar_products]
+    placeholder_html = get_no_image_html()
+    placeholders = [get_asset_registry().no_image_path()] * len(image_urls) + [placeholder_html] * len(similar_products)
+    results = run_with_deadline(tasks, placeholders)
+    return results[:len(image_urls)], results[len(image_urls):]
+
+
 def show_product_detail(product_id: int):
     if not product_id:
         st.warning("No product specified.")
         return
 
-    product = get_product_detail(product_id)
-    if not product:
+    data = load_product_page_data(product_id)
+    if not data:
         st.error("Product not found.")
         return
 
-    similar_products = get_similar_products(product.id)
+    product = data["product"]
+    similar_products = data["similar_products"] or []
+    image_paths, thumbnails = load_page_images(product, similar_products)
 
     col1, col2 = st.columns([6, 2])
     with col1:
-        inner_col2 = render_product_images(product)
+        inner_col2 = render_product_images(product, image_paths)
         render_product_info(product, inner_col2)
-        render_related_products(similar_products)
+        render_related_products(similar_products, thumbnails)
         render_product_description(product)
-        render_reviews(product)
+        render_reviews(product, data["reviews"], data["reviews_total"])
     with col2:
         render_checkout_info(product)
-        render_seller_info(product)
-        render_related_products(similar_products, vertical=True)
\ No newline at end of file
+        render_seller_info(product, data["seller"])
+        render_related_products(similar_products, thumbnails, vertical=True)
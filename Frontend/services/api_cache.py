@@ -0,0 +1,101 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from services import http_client
+
+# TTL en segundos por prefijo de ruta; gana el primer prefijo que coincide
+ENDPOINT_TTLS = (
+    ("/reviews/", 30),
+    ("/sellers/", 300),
+    ("/products/", 60),
+)
+DEFAULT_TTL = 30
+# Cantidad máxima de respuestas guardadas (se descartan las menos usadas)
+MAX_ENTRIES = int(os.getenv("MELI_API_CACHE_SIZE", "512"))
+
+
+def ttl_for(path: str) -> float:
+    for prefix, ttl in ENDPOINT_TTLS:
+        if path.startswith(prefix):
+            return ttl
+    return DEFAULT_TTL
+
+
+class _Entry:
+    __slots__ = ("response", "etag", "expires")
+
+    def __init__(self, response, etag, expires):
+        self.response = response
+        self.etag = etag
+        self.expires = expires
+
+
+class ResponseCache:
+    """
+    Process-wide LRU cache of successful GET responses from the backend.
+
+    Streamlit runs every browser session as a thread of the same process, so
+    one instance serves all of them: a rerun triggered by a widget reuses the
+    cached responses without touching the network. Once an entry's TTL runs
+    out it is revalidated with ``If-None-Match``; a ``304`` renews it without
+    transferring the body again. Only 200 responses are stored.
+    """
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, clock=time.monotonic):
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path: str, headers: dict = None):
+        headers = dict(headers or {})
+        key = (path, tuple(sorted(headers.items())))
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                if now < entry.expires:
+                    return entry.response
+
+        # La petición se hace fuera del lock para no serializar sesiones
+        request_headers = dict(headers)
+        if entry is not None and entry.etag:
+            request_headers["If-None-Match"] = entry.etag
+        resp = http_client.get(path, headers=request_headers)
+        expires = self._clock() + ttl_for(path)
+
+        if resp.status_code == 304 and entry is not None:
+            with self._lock:
+                entry.expires = expires
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+            return entry.response
+        if resp.status_code == 200:
+            with self._lock:
+                self._entries[key] = _Entry(resp, resp.headers.get("ETag"), expires)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return resp
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+response_cache = ResponseCache()
+
+
+def get(path: str, headers: dict = None):
+    """GET ``path`` on the backend through the shared response cache."""
+    return response_cache.get(path, headers)
+
+
+def clear() -> None:
+    response_cache.clear()
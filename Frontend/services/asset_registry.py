@@ -0,0 +1,132 @@
+import os
+import re
+import threading
+from typing import Callable, Optional
+
+from services.data_uri import to_data_uri
+
+# Fuera de producción los assets se recargan cuando cambia su mtime
+APP_ENV = os.getenv("APP_ENV", "development").lower()
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets")
+
+NO_IMAGE = "no_image.png"
+NO_IMAGE_SIZE = (100, 100)
+NO_IMAGE_COLOR = (200, 200, 200)
+
+IMAGE_MIME_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".webp": "image/webp",
+    ".svg": "image/svg+xml",
+}
+
+# Comentarios y cadenas se reconocen en una sola pasada para que las comillas dentro de un comentario no abran una cadena
+_CSS_COMMENT_OR_STRING_RE = re.compile(r"/\*.*?\*/|\"(?:[^\"\\]|\\.)*\"|'(?:[^'\\]|\\.)*'", re.DOTALL)
+_CSS_WHITESPACE_RE = re.compile(r"\s+")
+_CSS_PUNCTUATION_RE = re.compile(r"\s*([{};,>])\s*")
+_CSS_STRING_PLACEHOLDER_RE = re.compile(r"\x00(\d+)\x00")
+
+
+def is_development() -> bool:
+    return APP_ENV != "production"
+
+
+def minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from a stylesheet, leaving quoted strings untouched."""
+    strings = []
+
+    def stash(match):
+        token = match.group(0)
+        if token.startswith("/*"):
+            return ""
+        strings.append(token)
+        return f"\x00{len(strings) - 1}\x00"
+
+    css = _CSS_COMMENT_OR_STRING_RE.sub(stash, css)
+    css = _CSS_WHITESPACE_RE.sub(" ", css)
+    css = _CSS_PUNCTUATION_RE.sub(r"\1", css)
+    # Sólo el espacio después de ":" es redundante; antes puede separar un selector de una pseudoclase
+    css = css.replace(": ", ":").replace(";}", "}")
+    css = _CSS_STRING_PLACEHOLDER_RE.sub(lambda match: strings[int(match.group(1))], css)
+    return css.strip()
+
+
+class AssetRegistry:
+    """
+    Process-level cache of the frontend's static assets: stylesheets are
+    read and minified, images are read and encoded as data URIs, each once
+    per process. In development every access checks the file's mtime and
+    reloads it when it changed; in production files are never stat'ed again
+    after the first load.
+    """
+
+    def __init__(self, assets_dir: str = ASSETS_DIR, development: Optional[bool] = None):
+        self.assets_dir = assets_dir
+        self.development = is_development() if development is None else development
+        self._entries: dict = {}
+        self._no_image_ready = False
+        self._lock = threading.Lock()
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.assets_dir, name)
+
+    def css(self, name: str) -> Optional[str]:
+        """Return the minified contents of stylesheet ``name``, or None if it cannot be read."""
+        return self._get(("css", name), name, lambda data: minify_css(data.decode("utf-8")))
+
+    def data_uri(self, name: str) -> Optional[str]:
+        """Return image ``name`` as a data URI, or None if it cannot be read."""
+        mime_type = IMAGE_MIME_TYPES.get(os.path.splitext(name)[1].lower(), "application/octet-stream")
+        return self._get(("data_uri", name), name, lambda data: to_data_uri(data, mime_type))
+
+    def no_image_path(self) -> str:
+        """Return the placeholder image path, creating the file on first use."""
+        path = self.path(NO_IMAGE)
+        if not self._no_image_ready:
+            with self._lock:
+                if not os.path.exists(path):
+                    from PIL import Image
+                    os.makedirs(self.assets_dir, exist_ok=True)
+                    Image.new("RGB", NO_IMAGE_SIZE, color=NO_IMAGE_COLOR).save(path)
+                self._no_image_ready = True
+        return path
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._no_image_ready = False
+
+    def _get(self, key, name: str, build: Callable[[bytes], str]) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is not None and not self.development:
+            return entry[1]
+        path = self.path(name)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        if entry is not None and entry[0] == mtime:
+            return entry[1]
+        try:
+            with open(path, "rb") as f:
+                value = build(f.read())
+        except OSError:
+            return None
+        with self._lock:
+            self._entries[key] = (mtime, value)
+        return value
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_asset_registry() -> AssetRegistry:
+    """Return the registry shared by every session of the process."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = AssetRegistry()
+    return _registry
@@ -0,0 +1,47 @@
+import base64
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional
+
+# Cantidad máxima de miniaturas codificadas que se conservan en memoria
+MAX_CACHED_DATA_URIS = 256
+
+
+def to_data_uri(data: bytes, mime_type: str) -> str:
+    return f"data:{mime_type};base64,{base64.b64encode(data).decode('ascii')}"
+
+
+class DataUriCache:
+    """
+    Bounded, thread-safe LRU of data URIs built on demand, shared by every
+    session of the process. Only successful results are kept, so an image
+    that failed to load is retried on the next render.
+    """
+
+    def __init__(self, max_entries: int = MAX_CACHED_DATA_URIS):
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, build: Callable[[], Optional[str]]) -> Optional[str]:
+        with self._lock:
+            uri = self._entries.get(key)
+            if uri is not None:
+                self._entries.move_to_end(key)
+                return uri
+        # Se construye fuera del lock: puede implicar una descarga
+        uri = build()
+        if uri is not None:
+            with self._lock:
+                self._entries[key] = uri
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return uri
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,71 @@
+import os
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Configuración del backend
+API_BASE_URL = os.getenv("MELI_API_URL", "http://localhost:8000").rstrip("/")
+# Timeouts en segundos: (conexión, lectura)
+CONNECT_TIMEOUT = float(os.getenv("MELI_API_CONNECT_TIMEOUT", "3.05"))
+READ_TIMEOUT = float(os.getenv("MELI_API_READ_TIMEOUT", "10"))
+DEFAULT_TIMEOUT = (CONNECT_TIMEOUT, READ_TIMEOUT)
+# Reintentos acotados con backoff exponencial (0.3s, 0.6s, 1.2s...)
+MAX_RETRIES = int(os.getenv("MELI_API_MAX_RETRIES", "3"))
+BACKOFF_FACTOR = float(os.getenv("MELI_API_BACKOFF_FACTOR", "0.3"))
+RETRY_STATUSES = (502, 503, 504)
+# Sólo se reintentan métodos idempotentes; un POST /token no se repite
+RETRY_METHODS = frozenset({"GET", "HEAD"})
+# Conexiones keep-alive mantenidas por host
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = int(os.getenv("MELI_API_POOL_SIZE", "10"))
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def api_url(path: str) -> str:
+    """Join ``path`` to the configured backend base URL."""
+    return f"{API_BASE_URL}/{path.lstrip('/')}"
+
+
+def create_session() -> requests.Session:
+    """Build a session with a pooled, retrying adapter mounted for http and https."""
+    retry = Retry(
+        total=MAX_RETRIES,
+        connect=MAX_RETRIES,
+        read=MAX_RETRIES,
+        status=MAX_RETRIES,
+        backoff_factor=BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=RETRY_METHODS,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide session shared by every service and Streamlit session."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = create_session()
+    return _session
+
+
+def get(path: str, **kwargs) -> requests.Response:
+    """GET ``path`` on the backend through the shared session."""
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    return get_session().get(api_url(path), **kwargs)
+
+
+def post(path: str, **kwargs) -> requests.Response:
+    """POST to ``path`` on the backend through the shared session."""
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    return get_session().post(api_url(path), **kwargs)
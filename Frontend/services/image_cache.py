@@ -0,0 +1,152 @@
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from typing import Callable, Optional, Tuple
+
+# Configuración del caché de imágenes procesadas
+IMAGE_CACHE_DIR = os.getenv("MELI_IMAGE_CACHE_DIR", os.path.join(tempfile.gettempdir(), "meli_image_cache"))
+IMAGE_CACHE_MAX_BYTES = int(float(os.getenv("MELI_IMAGE_CACHE_MAX_MB", "200")) * 1024 * 1024)
+IMAGE_EXTENSION = ".jpg"
+TEMP_SUFFIX = ".tmp"
+# Los temporales más nuevos pueden pertenecer a otro proceso que está escribiendo
+TEMP_FILE_GRACE_SECONDS = 600
+# Cada cuántas escrituras se recalcula el tamaño real del directorio
+RESCAN_EVERY_PUTS = 64
+
+
+class ImageCache:
+    """
+    Content-addressed on-disk cache of processed images.
+
+    Each file is named after the sha256 of ``(url, width, height)``, so the
+    same source image at the same target size maps to the same file across
+    renders, sessions and restarts. Files are written to a temporary name
+    and moved into place with ``os.replace``, so readers never see a partial
+    image. A hit refreshes the file's mtime; when the directory grows past
+    ``max_bytes`` the least recently used files are removed.
+
+    The directory may be shared by several processes. The in-memory byte
+    count only decides when to look at the disk; it is recomputed from the
+    directory on every eviction and every ``RESCAN_EVERY_PUTS`` writes, so
+    other processes' files are accounted for.
+    """
+
+    def __init__(self, directory: str = IMAGE_CACHE_DIR, max_bytes: int = IMAGE_CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._puts_since_scan = 0
+        os.makedirs(directory, exist_ok=True)
+        self._remove_stale_temp_files()
+        self._total_bytes = sum(size for _, _, size in self._files())
+
+    def path_for(self, url: str, size: Tuple[int, int]) -> str:
+        key = f"{url}|{size[0]}x{size[1]}".encode("utf-8")
+        return os.path.join(self.directory, hashlib.sha256(key).hexdigest() + IMAGE_EXTENSION)
+
+    def get(self, url: str, size: Tuple[int, int]) -> Optional[str]:
+        """Return the cached file for ``(url, size)``, or None on a miss."""
+        path = self.path_for(url, size)
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def put(self, url: str, size: Tuple[int, int], image) -> str:
+        """Store a PIL ``image`` for ``(url, size)`` and return its path."""
+        return self._store(url, size, lambda f: image.save(f, format="JPEG"))
+
+    def put_bytes(self, url: str, size: Tuple[int, int], data: bytes) -> str:
+        """Store an already encoded JPEG for ``(url, size)`` and return its path."""
+        return self._store(url, size, lambda f: f.write(data))
+
+    def _store(self, url: str, size: Tuple[int, int], write: Callable) -> str:
+        path = self.path_for(url, size)
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=TEMP_SUFFIX)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            written = os.path.getsize(temp_path)
+            with self._lock:
+                try:
+                    previous = os.path.getsize(path)
+                except OSError:
+                    previous = 0
+                os.replace(temp_path, path)
+                self._total_bytes += written - previous
+                self._puts_since_scan += 1
+                if self._total_bytes > self.max_bytes or self._puts_since_scan >= RESCAN_EVERY_PUTS:
+                    self._evict(keep=path)
+        except BaseException:
+            self._remove(temp_path)
+            raise
+        return path
+
+    def clear(self) -> None:
+        with self._lock:
+            for path, _, _ in self._files():
+                self._remove(path)
+            self._total_bytes = 0
+
+    def _files(self):
+        """Yield ``(path, mtime, size)`` for every cached image."""
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(IMAGE_EXTENSION):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    yield entry.path, stat.st_mtime, stat.st_size
+
+    def _remove_stale_temp_files(self) -> None:
+        """Remove temp files of interrupted writes, leaving recent ones that may still be in use."""
+        cutoff = time.time() - TEMP_FILE_GRACE_SECONDS
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if not entry.name.endswith(TEMP_SUFFIX):
+                    continue
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        self._remove(entry.path)
+                except OSError:
+                    continue
+
+    def _evict(self, keep: str) -> None:
+        """Recompute the directory size from disk and remove the least recently used files over the cap."""
+        self._puts_since_scan = 0
+        files = sorted(self._files(), key=lambda item: item[1])
+        total = sum(size for _, _, size in files)
+        for path, _, size in files:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            if self._remove(path):
+                total -= size
+        self._total_bytes = total
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
+
+
+_image_cache = None
+_image_cache_lock = threading.Lock()
+
+
+def get_image_cache() -> ImageCache:
+    """Return the process-wide image cache, creating its directory on first use."""
+    global _image_cache
+    if _image_cache is None:
+        with _image_cache_lock:
+            if _image_cache is None:
+                _image_cache = ImageCache()
+    return _image_cache
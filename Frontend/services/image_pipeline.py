@@ -0,0 +1,46 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable, List, Sequence
+
+# Descargas y procesamiento de imágenes simultáneos, compartidos por todas las sesiones
+IMAGE_WORKERS = int(os.getenv("MELI_IMAGE_WORKERS", "8"))
+# Tiempo máximo que una página espera por todas sus imágenes, en segundos
+PAGE_IMAGE_DEADLINE = float(os.getenv("MELI_IMAGE_DEADLINE", "5"))
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Return the process-wide pool that bounds concurrent image work across sessions."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=IMAGE_WORKERS, thread_name_prefix="meli-images")
+    return _executor
+
+
+def run_with_deadline(tasks: Sequence[Callable[[], Any]], placeholders: Sequence[Any],
+                      deadline: float = PAGE_IMAGE_DEADLINE, executor: ThreadPoolExecutor = None) -> List[Any]:
+    """
+    Run ``tasks`` concurrently and return their results in order.
+
+    Waits at most ``deadline`` seconds for the whole batch; any task that has
+    not finished by then, or that raised, yields its entry in
+    ``placeholders`` instead. Tasks still queued are cancelled; tasks already
+    running finish in the background, so their side effects (such as filling
+    the image cache) still benefit the next render.
+    """
+    executor = executor or get_executor()
+    futures = [executor.submit(task) for task in tasks]
+    wait(futures, timeout=deadline)
+    results = []
+    for future, placeholder in zip(futures, placeholders):
+        if future.done() and not future.cancelled() and future.exception() is None:
+            results.append(future.result())
+        else:
+            future.cancel()
+            results.append(placeholder)
+    return results
@@ -1,12 +1,11 @@
-import requests
+from services import http_client
 
 # Configuration
-auth_url = "http://localhost:8000/token"
-products_url = "http://localhost:8000/sellers"
+auth_path = "/token"
 
 # Obtener token
 def get_token(username: str, password: str) -> str:
-    auth_response = requests.post(auth_url, data={
+    auth_response = http_client.post(auth_path, data={
         "grant_type": "password",
         "username": username,
         "password": password
@@ -1,36 +1,82 @@
-import requests
 import streamlit as st
+from services import api_cache, http_client
 from models.product import Product
+from models.review import Review
+from models.seller import Seller
+from services.review_service import REVIEWS_PAGE_SIZE
 from typing import Optional, List
 
 
 HEADERS = {}
+# Recursos que el backend incrusta en el detalle para resolver la página con una sola llamada
+PAGE_INCLUDES = "seller,reviews,similar"
 
 def get_product_detail(product_id: str) -> Optional[Product]:
-    url = f"http://localhost:8000/products/{product_id}"
-    resp = requests.get(url, headers=HEADERS)
+    resp = api_cache.get(f"/products/{product_id}", headers=HEADERS)
     if resp.status_code == 200:
         try:
-            data = resp.json()
-            # Asegurarse de que los campos opcionales estén presentes
-            if 'categories' not in data:
-                data['categories'] = None
-            if 'payment_methods' not in data:
-                data['payment_methods'] = None
-            if 'features' not in data:
-                data['features'] = None
-            if 'rating_info' not in data:
-                data['rating_info'] = None
-            return Product(**data)
+            return _parse_product(resp.json())
         except Exception as e:
             st.error(f"Error al parsear el producto: {e}")
             return None
     return None
 
+def get_product_image(product_id: str, index: int, variant: str) -> Optional[bytes]:
+    """
+    Fetch the backend's precomputed ``variant`` (``carousel`` or ``thumb``)
+    of the product's ``index``-th image as JPEG bytes, or None if the backend
+    cannot serve it.
+    """
+    resp = http_client.get(f"/products/{product_id}/images/{index}/{variant}", headers=HEADERS)
+    if resp.status_code == 200:
+        return resp.content
+    return None
+
+def _parse_product(data: dict) -> Product:
+    # Asegurarse de que los campos opcionales estén presentes
+    if 'categories' not in data:
+        data['categories'] = None
+    if 'payment_methods' not in data:
+        data['payment_methods'] = None
+    if 'features' not in data:
+        data['features'] = None
+    if 'rating_info' not in data:
+        data['rating_info'] = None
+    return Product(**data)
+
+def get_product_page(product_id: str, reviews_page_size: int = REVIEWS_PAGE_SIZE) -> Optional[dict]:
+    """
+    Fetch a product with its seller, first page of reviews and similar
+    products embedded, in one request. Returns a dict with ``product`` plus
+    ``seller``, ``reviews``/``reviews_total`` and ``similar_products`` for each
+    part the backend embedded; parts it did not embed are left out so the
+    caller can fetch them separately. Returns None if the product is not found.
+    """
+    url = f"/products/{product_id}?include={PAGE_INCLUDES}&reviews_page_size={reviews_page_size}"
+    resp = api_cache.get(url, headers=HEADERS)
+    if resp.status_code != 200:
+        return None
+    try:
+        data = resp.json()
+        seller = data.pop("seller", None)
+        review_page = data.pop("review_page", None)
+        similar = data.pop("similar", None)
+        page = {"product": _parse_product(data)}
+        if seller is not None:
+            page["seller"] = Seller(**seller)
+        if review_page is not None:
+            page["reviews"] = [Review(**r) for r in review_page.get("items", [])]
+            page["reviews_total"] = review_page.get("total", len(page["reviews"]))
+        if similar is not None:
+            page["similar_products"] = [Product(**item) for item in similar]
+        return page
+    except Exception as e:
+        st.error(f"Error al parsear el producto: {e}")
+        return None
+
 # Service to get similar products
 def get_similar_products(product_id: str) -> List[Product]:
-    url = f"http://localhost:8000/products/{product_id}/similar"
-    resp = requests.get(url, headers=HEADERS)
+    resp = api_cache.get(f"/products/{product_id}/similar", headers=HEADERS)
     if resp.status_code == 200:
         try:
             return [Product(**item) for item in resp.json()]
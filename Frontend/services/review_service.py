@@ -1,16 +1,38 @@
-import requests
 import streamlit as st
+from services import api_cache
 from models.review import Review
-from typing import List
+from typing import List, Tuple
+
+# Reviews por página al mostrarlas de forma incremental
+REVIEWS_PAGE_SIZE = 5
+
+def _parse_reviews(data) -> List[Review]:
+    # El backend devuelve una página {items, total, ...}; se aceptan también listas simples
+    items = data.get("items", []) if isinstance(data, dict) else data
+    return [Review(**r) for r in items]
 
 def get_product_reviews(product_id) -> List[Review]:
     headers = {}
-    url = f"http://localhost:8000/reviews/product/{product_id}"
-    resp = requests.get(url, headers=headers)
+    resp = api_cache.get(f"/reviews/product/{product_id}", headers=headers)
     if resp.status_code == 200:
         try:
-            return [Review(**r) for r in resp.json()]
+            return _parse_reviews(resp.json())
         except Exception as e:
             st.error(f"Error al parsear las reviews: {e}")
             return []
     return []
+
+def get_product_reviews_page(product_id, page: int = 1, page_size: int = REVIEWS_PAGE_SIZE) -> Tuple[List[Review], int]:
+    """Return one page of a product's reviews (newest first) and the product's total review count."""
+    headers = {}
+    resp = api_cache.get(f"/reviews/product/{product_id}?page={page}&page_size={page_size}", headers=headers)
+    if resp.status_code == 200:
+        try:
+            data = resp.json()
+            reviews = _parse_reviews(data)
+            total = data.get("total", len(reviews)) if isinstance(data, dict) else len(reviews)
+            return reviews, total
+        except Exception as e:
+            st.error(f"Error al parsear las reviews: {e}")
+            return [], 0
+    return [], 0
@@ -1,11 +1,10 @@
-import requests
 import streamlit as st
+from services import api_cache
 from models.seller import Seller
 
 def get_seller_detail(seller_id):
     headers = {}
-    url = f"http://localhost:8000/sellers/{seller_id}"
-    resp = requests.get(url, headers=headers)
+    resp = api_cache.get(f"/sellers/{seller_id}", headers=headers)
     if resp.status_code == 200:
         try:
             return Seller(**resp.json())
@@ -17,6 +17,13 @@ from test_product_service import TestProductService
 from test_review_service import TestReviewService
 from test_seller_service import TestSellerService
 from test_app import TestApp
+from test_http_client import TestHttpClient
+from test_api_cache import TestResponseCache
+from test_image_cache import TestImageCache
+from test_image_pipeline import TestImagePipeline
+from test_data_uri import TestDataUri
+from test_asset_registry import TestAssetRegistry
+from test_product_detail_page import TestProductPageData, TestLoadPageImages, TestVariantImages, TestNoImagePlaceholder
 
 
 def create_complete_test_suite():
@@ -26,10 +33,20 @@ def create_complete_test_suite():
     
     # Add all test cases - all working now!
     suite.addTest(loader.loadTestsFromTestCase(TestLoginService))     # 4 tests
-    suite.addTest(loader.loadTestsFromTestCase(TestProductService))   # 8 tests
-    suite.addTest(loader.loadTestsFromTestCase(TestReviewService))    # 6 tests
+    suite.addTest(loader.loadTestsFromTestCase(TestProductService))   # 13 tests
+    suite.addTest(loader.loadTestsFromTestCase(TestReviewService))    # 9 tests
     suite.addTest(loader.loadTestsFromTestCase(TestSellerService))    # 7 tests
     suite.addTest(loader.loadTestsFromTestCase(TestApp))             # 4 tests (simplified)
+    suite.addTest(loader.loadTestsFromTestCase(TestHttpClient))      # 5 tests
+    suite.addTest(loader.loadTestsFromTestCase(TestResponseCache))   # 6 tests
+    suite.addTest(loader.loadTestsFromTestCase(TestImageCache))      # 7 tests
+    suite.addTest(loader.loadTestsFromTestCase(TestImagePipeline))   # 4 tests
+    suite.addTest(loader.loadTestsFromTestCase(TestDataUri))         # 4 tests
+    suite.addTest(loader.loadTestsFromTestCase(TestAssetRegistry))   # 7 tests
+    suite.addTest(loader.loadTestsFromTestCase(TestProductPageData))  # 4 tests
+    suite.addTest(loader.loadTestsFromTestCase(TestLoadPageImages))  # 2 tests
+    suite.addTest(loader.loadTestsFromTestCase(TestVariantImages))   # 2 tests
+    suite.addTest(loader.loadTestsFromTestCase(TestNoImagePlaceholder))  # 1 test
     
     return suite
 
@@ -70,10 +87,20 @@ def run_complete_tests():
     if len(result.failures) == 0 and len(result.errors) == 0:
         print("\n🎉 ALL TESTS PASSED! 🎉")
         print("✅ Login Service: 4/4 tests")
-        print("✅ Product Service: 8/8 tests")
-        print("✅ Review Service: 6/6 tests")
+        print("✅ Product Service: 13/13 tests")
+        print("✅ Review Service: 9/9 tests")
         print("✅ Seller Service: 7/7 tests")
         print("✅ App Module: 4/4 tests")
+        print("✅ HTTP Client: 5/5 tests")
+        print("✅ Response Cache: 6/6 tests")
+        print("✅ Image Cache: 7/7 tests")
+        print("✅ Image Pipeline: 4/4 tests")
+        print("✅ Data URIs: 4/4 tests")
+        print("✅ Asset Registry: 7/7 tests")
+        print("✅ Product Page Data: 4/4 tests")
+        print("✅ Page Images: 2/2 tests")
+        print("✅ Variant Images: 2/2 tests")
+        print("✅ No-Image Placeholder: 1/1 tests")
         print(f"✅ Total: {result.testsRun}/{result.testsRun} tests working!")
     
     # Return success status
@@ -0,0 +1,113 @@
+import unittest
+from unittest.mock import patch, MagicMock
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services import api_cache
+from services.api_cache import ResponseCache, ttl_for
+
+
+def _response(status_code=200, etag='W/"v1"'):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = {"ETag": etag} if etag else {}
+    return response
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestResponseCache(unittest.TestCase):
+    """Test cases for the shared backend response cache"""
+
+    def setUp(self):
+        """Set up a cache driven by a controllable clock"""
+        self.clock = FakeClock()
+        self.cache = ResponseCache(max_entries=2, clock=self.clock)
+
+    def test_ttl_per_endpoint(self):
+        """Test that TTLs are chosen by path prefix"""
+        self.assertEqual(ttl_for("/reviews/product/1"), 30)
+        self.assertEqual(ttl_for("/sellers/1"), 300)
+        self.assertEqual(ttl_for("/products/1/similar"), 60)
+        self.assertEqual(ttl_for("/unknown"), api_cache.DEFAULT_TTL)
+
+    @patch('services.http_client.get')
+    def test_fresh_entry_skips_backend(self, mock_get):
+        """Test that repeated calls within the TTL hit the backend once"""
+        response = _response()
+        mock_get.return_value = response
+
+        first = self.cache.get("/products/1", headers={})
+        second = self.cache.get("/products/1", headers={})
+
+        self.assertIs(first, response)
+        self.assertIs(second, response)
+        mock_get.assert_called_once_with("/products/1", headers={})
+
+    @patch('services.http_client.get')
+    def test_expired_entry_revalidates_with_etag(self, mock_get):
+        """Test that a stale entry is revalidated and renewed on 304"""
+        response = _response()
+        mock_get.return_value = response
+        self.cache.get("/products/1")
+
+        self.clock.now += 61
+        mock_get.return_value = _response(status_code=304)
+        result = self.cache.get("/products/1")
+
+        self.assertIs(result, response)
+        mock_get.assert_called_with("/products/1", headers={"If-None-Match": 'W/"v1"'})
+        # Renovada: no vuelve a consultar dentro del nuevo TTL
+        self.cache.get("/products/1")
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch('services.http_client.get')
+    def test_expired_entry_replaced_on_200(self, mock_get):
+        """Test that a changed resource replaces the cached response"""
+        mock_get.return_value = _response()
+        self.cache.get("/sellers/1")
+
+        self.clock.now += 301
+        updated = _response(etag='W/"v2"')
+        mock_get.return_value = updated
+
+        self.assertIs(self.cache.get("/sellers/1"), updated)
+
+    @patch('services.http_client.get')
+    def test_errors_are_not_cached(self, mock_get):
+        """Test that non-200 responses always reach the backend"""
+        mock_get.return_value = _response(status_code=500, etag=None)
+
+        self.cache.get("/products/1")
+        self.cache.get("/products/1")
+
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(len(self.cache), 0)
+
+    @patch('services.http_client.get')
+    def test_least_recently_used_is_evicted(self, mock_get):
+        """Test that the cache stays within its size bound"""
+        mock_get.side_effect = lambda path, headers: _response()
+
+        self.cache.get("/products/1")
+        self.cache.get("/products/2")
+        self.cache.get("/products/1")
+        self.cache.get("/products/3")
+
+        self.assertEqual(len(self.cache), 2)
+        self.cache.get("/products/1")
+        self.assertEqual(mock_get.call_count, 3)
+        self.cache.get("/products/2")
+        self.assertEqual(mock_get.call_count, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
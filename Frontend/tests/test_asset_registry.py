@@ -0,0 +1,88 @@
+import unittest
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.asset_registry import AssetRegistry, minify_css
+
+CSS = """
+/* Header */
+.header > a:hover ,
+.footer {
+    color: #333;
+    margin: 0 auto;
+}
+div :first-child { padding: 1rem; }
+"""
+
+
+class TestAssetRegistry(unittest.TestCase):
+    """Test cases for the static asset registry"""
+
+    def setUp(self):
+        """Set up a temporary assets directory"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self._write("styles.css", CSS.encode("utf-8"))
+        self._write("logo.webp", b"RIFF")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write(self, name, data, mtime=None):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "wb") as f:
+            f.write(data)
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+
+    def test_minify_css(self):
+        """Test that comments and redundant whitespace are removed"""
+        self.assertEqual(minify_css(CSS),
+                         ".header>a:hover,.footer{color:#333;margin:0 auto}div :first-child{padding:1rem}")
+
+    def test_minify_css_keeps_quoted_strings(self):
+        """Test that quoted content values and attribute selectors are left untouched"""
+        css = """a[title="x: y"]::before { content: "a , b ; c"; }
+/* it's a comment */ p::after { content: '/* kept */ \\' ; x'; }"""
+        self.assertEqual(minify_css(css),
+                         "a[title=\"x: y\"]::before{content:\"a , b ; c\"}p::after{content:'/* kept */ \\' ; x'}")
+
+    def test_css_loaded_and_minified(self):
+        """Test that stylesheets are returned minified"""
+        registry = AssetRegistry(self.tmp.name, development=False)
+        self.assertEqual(registry.css("styles.css"), minify_css(CSS))
+        self.assertIsNone(registry.css("missing.css"))
+
+    def test_data_uri_uses_extension_mime_type(self):
+        """Test that images are encoded with their MIME type"""
+        registry = AssetRegistry(self.tmp.name, development=False)
+        self.assertTrue(registry.data_uri("logo.webp").startswith("data:image/webp;base64,"))
+
+    def test_production_never_reloads(self):
+        """Test that production keeps the first loaded version"""
+        registry = AssetRegistry(self.tmp.name, development=False)
+        first = registry.css("styles.css")
+        self._write("styles.css", b".changed { color: red; }", mtime=2_000_000_000)
+        self.assertEqual(registry.css("styles.css"), first)
+
+    def test_development_reloads_on_mtime_change(self):
+        """Test that development picks up edited files"""
+        registry = AssetRegistry(self.tmp.name, development=True)
+        registry.css("styles.css")
+        self._write("styles.css", b".changed { color: red; }", mtime=2_000_000_000)
+        self.assertEqual(registry.css("styles.css"), ".changed{color:red}")
+
+    def test_existing_no_image_is_reused(self):
+        """Test that an existing placeholder is not regenerated"""
+        self._write("no_image.png", b"\x89PNG")
+        registry = AssetRegistry(self.tmp.name)
+        path = registry.no_image_path()
+        self.assertEqual(path, os.path.join(self.tmp.name, "no_image.png"))
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), b"\x89PNG")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+from unittest.mock import MagicMock
+import base64
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.data_uri import DataUriCache, to_data_uri
+
+
+class TestDataUri(unittest.TestCase):
+    """Test cases for memoized data URIs"""
+
+    def test_to_data_uri(self):
+        """Test the data URI format"""
+        self.assertEqual(to_data_uri(b"abc", "image/png"), "data:image/png;base64," + base64.b64encode(b"abc").decode())
+
+    def test_cache_builds_once(self):
+        """Test that a cached data URI is not rebuilt"""
+        cache = DataUriCache()
+        build = MagicMock(return_value="data:image/jpeg;base64,AA==")
+        self.assertEqual(cache.get("http://img/1.jpg", build), "data:image/jpeg;base64,AA==")
+        self.assertEqual(cache.get("http://img/1.jpg", build), "data:image/jpeg;base64,AA==")
+        build.assert_called_once()
+
+    def test_cache_does_not_keep_failures(self):
+        """Test that a failed build is retried next time"""
+        cache = DataUriCache()
+        build = MagicMock(return_value=None)
+        cache.get("http://img/1.jpg", build)
+        cache.get("http://img/1.jpg", build)
+        self.assertEqual(build.call_count, 2)
+        self.assertEqual(len(cache), 0)
+
+    def test_cache_is_bounded(self):
+        """Test that the least recently used entry is evicted"""
+        cache = DataUriCache(max_entries=2)
+        for key in ("a", "b", "a", "c"):
+            cache.get(key, lambda key=key: f"uri-{key}")
+        self.assertEqual(len(cache), 2)
+        build = MagicMock(return_value="uri-b")
+        cache.get("b", build)
+        build.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
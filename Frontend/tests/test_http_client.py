@@ -0,0 +1,65 @@
+import unittest
+from unittest.mock import patch, MagicMock
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services import http_client
+
+
+class TestHttpClient(unittest.TestCase):
+    """Test cases for the shared backend HTTP client"""
+
+    def test_api_url_joins_base_and_path(self):
+        """Test that paths are joined to the configured base URL"""
+        with patch.object(http_client, "API_BASE_URL", "http://api:9000"):
+            self.assertEqual(http_client.api_url("/products/1"), "http://api:9000/products/1")
+            self.assertEqual(http_client.api_url("token"), "http://api:9000/token")
+
+    def test_session_is_shared(self):
+        """Test that every call reuses the same pooled session"""
+        self.assertIs(http_client.get_session(), http_client.get_session())
+
+    def test_session_mounts_retrying_adapter(self):
+        """Test that the session retries idempotent requests with backoff"""
+        session = http_client.create_session()
+        adapter = session.get_adapter("http://localhost:8000/products/1")
+        retry = adapter.max_retries
+        self.assertEqual(retry.total, http_client.MAX_RETRIES)
+        self.assertEqual(retry.backoff_factor, http_client.BACKOFF_FACTOR)
+        self.assertIn(503, retry.status_forcelist)
+        self.assertNotIn("POST", retry.allowed_methods)
+        self.assertIs(session.get_adapter("https://example.com"), adapter)
+
+    @patch('services.http_client.get_session')
+    def test_get_applies_default_timeout(self, mock_get_session):
+        """Test that GET requests get the default timeout and full URL"""
+        mock_session = MagicMock()
+        mock_get_session.return_value = mock_session
+
+        http_client.get("/sellers/1", headers={})
+
+        mock_session.get.assert_called_once_with(
+            http_client.api_url("/sellers/1"),
+            headers={},
+            timeout=http_client.DEFAULT_TIMEOUT
+        )
+
+    @patch('services.http_client.get_session')
+    def test_post_keeps_explicit_timeout(self, mock_get_session):
+        """Test that an explicit timeout overrides the default"""
+        mock_session = MagicMock()
+        mock_get_session.return_value = mock_session
+
+        http_client.post("/token", data={"username": "u"}, timeout=1)
+
+        mock_session.post.assert_called_once_with(
+            http_client.api_url("/token"),
+            data={"username": "u"},
+            timeout=1
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
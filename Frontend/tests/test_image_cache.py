@@ -0,0 +1,107 @@
+import unittest
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.image_cache import ImageCache, TEMP_SUFFIX, TEMP_FILE_GRACE_SECONDS, RESCAN_EVERY_PUTS
+
+
+class FakeImage:
+    """Stand-in for a PIL image that writes a fixed number of bytes"""
+
+    def __init__(self, size=100, fail=False):
+        self.size = size
+        self.fail = fail
+
+    def save(self, fp, format=None):
+        fp.write(b"x" * self.size)
+        if self.fail:
+            raise OSError("disk full")
+
+
+class TestImageCache(unittest.TestCase):
+    """Test cases for the processed image cache"""
+
+    def setUp(self):
+        """Set up a cache in a fresh temporary directory"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = ImageCache(self.tmp.name, max_bytes=250)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_miss_then_hit(self):
+        """Test that a stored image is returned for the same url and size"""
+        self.assertIsNone(self.cache.get("http://img/1.jpg", (250, 400)))
+        path = self.cache.put("http://img/1.jpg", (250, 400), FakeImage())
+        self.assertEqual(self.cache.get("http://img/1.jpg", (250, 400)), path)
+        self.assertTrue(os.path.exists(path))
+
+    def test_put_bytes(self):
+        """Test that already encoded images are stored as given"""
+        path = self.cache.put_bytes("http://img/1.jpg", (70, 70), b"jpeg")
+        self.assertEqual(self.cache.get("http://img/1.jpg", (70, 70)), path)
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), b"jpeg")
+
+    def test_key_includes_size(self):
+        """Test that the same url at different sizes is cached separately"""
+        self.assertNotEqual(self.cache.path_for("http://img/1.jpg", (250, 400)),
+                            self.cache.path_for("http://img/1.jpg", (70, 70)))
+        self.assertEqual(self.cache.path_for("http://img/1.jpg", (70, 70)),
+                         ImageCache(self.tmp.name).path_for("http://img/1.jpg", (70, 70)))
+
+    def test_least_recently_used_evicted_over_cap(self):
+        """Test that the oldest files are removed once the byte cap is exceeded"""
+        first = self.cache.put("http://img/1.jpg", (70, 70), FakeImage())
+        second = self.cache.put("http://img/2.jpg", (70, 70), FakeImage())
+        os.utime(first, (time.time() - 60, time.time() - 60))
+        os.utime(second, (time.time() - 30, time.time() - 30))
+        # Un hit renueva el archivo más viejo
+        self.cache.get("http://img/1.jpg", (70, 70))
+        third = self.cache.put("http://img/3.jpg", (70, 70), FakeImage())
+
+        self.assertTrue(os.path.exists(first))
+        self.assertFalse(os.path.exists(second))
+        self.assertTrue(os.path.exists(third))
+
+    def test_failed_write_leaves_no_files(self):
+        """Test that an interrupted write does not leave partial files"""
+        with self.assertRaises(OSError):
+            self.cache.put("http://img/1.jpg", (70, 70), FakeImage(fail=True))
+        self.assertEqual(os.listdir(self.tmp.name), [])
+        self.assertIsNone(self.cache.get("http://img/1.jpg", (70, 70)))
+
+    def test_leftover_temp_files_removed_on_start(self):
+        """Test that old temp files from crashed writers are cleaned up and recent ones kept"""
+        leftover = os.path.join(self.tmp.name, "abc" + TEMP_SUFFIX)
+        in_progress = os.path.join(self.tmp.name, "def" + TEMP_SUFFIX)
+        for path in (leftover, in_progress):
+            with open(path, "wb") as f:
+                f.write(b"partial")
+        old = time.time() - TEMP_FILE_GRACE_SECONDS - 60
+        os.utime(leftover, (old, old))
+        ImageCache(self.tmp.name)
+        self.assertFalse(os.path.exists(leftover))
+        self.assertTrue(os.path.exists(in_progress))
+
+    def test_eviction_counts_files_of_other_processes(self):
+        """Test that files written by another cache on the same directory are accounted for"""
+        other = ImageCache(self.tmp.name, max_bytes=250)
+        first = other.put("http://img/1.jpg", (70, 70), FakeImage())
+        second = other.put("http://img/2.jpg", (70, 70), FakeImage())
+        os.utime(first, (time.time() - 60, time.time() - 60))
+        os.utime(second, (time.time() - 30, time.time() - 30))
+        # Este caché no vio esas escrituras: su contador sigue en cero
+        for i in range(RESCAN_EVERY_PUTS):
+            self.cache.put(f"http://img/own-{i}.jpg", (70, 70), FakeImage(size=1))
+        self.assertFalse(os.path.exists(first))
+        self.assertLessEqual(sum(os.path.getsize(os.path.join(self.tmp.name, name))
+                                 for name in os.listdir(self.tmp.name)), 250)
+
+
+if __name__ == '__main__':
+    unittest.main()
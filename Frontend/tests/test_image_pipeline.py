@@ -0,0 +1,56 @@
+import unittest
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.image_pipeline import run_with_deadline
+
+
+class TestImagePipeline(unittest.TestCase):
+    """Test cases for the concurrent image pipeline"""
+
+    def setUp(self):
+        """Set up a private pool so tests do not share workers"""
+        self.executor = ThreadPoolExecutor(max_workers=4)
+        self.release = threading.Event()
+
+    def tearDown(self):
+        self.release.set()
+        self.executor.shutdown(wait=True)
+
+    def test_results_keep_task_order(self):
+        """Test that results are returned in task order"""
+        tasks = [lambda i=i: (time.sleep(0.01 * (3 - i)), i)[1] for i in range(3)]
+        results = run_with_deadline(tasks, [None] * 3, deadline=1, executor=self.executor)
+        self.assertEqual(results, [0, 1, 2])
+
+    def test_tasks_run_concurrently(self):
+        """Test that the page waits for the slowest task, not the sum"""
+        tasks = [lambda: (time.sleep(0.2), "ok")[1] for _ in range(4)]
+        started = time.monotonic()
+        results = run_with_deadline(tasks, [None] * 4, deadline=2, executor=self.executor)
+        self.assertEqual(results, ["ok"] * 4)
+        self.assertLess(time.monotonic() - started, 0.6)
+
+    def test_stragglers_get_placeholders(self):
+        """Test that tasks still running at the deadline yield their placeholder"""
+        tasks = [lambda: "fast", lambda: self.release.wait(5) and "slow"]
+        started = time.monotonic()
+        results = run_with_deadline(tasks, ["p1", "p2"], deadline=0.2, executor=self.executor)
+        self.assertEqual(results, ["fast", "p2"])
+        self.assertLess(time.monotonic() - started, 1)
+
+    def test_failures_get_placeholders(self):
+        """Test that a task raising an exception yields its placeholder"""
+        def broken():
+            raise IOError("download failed")
+        results = run_with_deadline([broken, lambda: "ok"], ["p1", "p2"], deadline=1, executor=self.executor)
+        self.assertEqual(results, ["p1", "ok"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,7 +12,7 @@ from services.login_service import get_token
 class TestLoginService(unittest.TestCase):
     """Test cases for login service functionality"""
 
-    @patch('services.login_service.requests.post')
+    @patch('services.login_service.http_client.post')
     def test_get_token_success(self, mock_post):
         """Test successful token retrieval"""
         # Arrange
@@ -27,7 +27,7 @@ class TestLoginService(unittest.TestCase):
         # Assert
         self.assertEqual(result, "test_token_123")
         mock_post.assert_called_once_with(
-            "http://localhost:8000/token",
+            "/token",
             data={
                 "grant_type": "password",
                 "username": "testuser",
@@ -35,7 +35,7 @@ class TestLoginService(unittest.TestCase):
             }
         )
 
-    @patch('services.login_service.requests.post')
+    @patch('services.login_service.http_client.post')
     def test_get_token_http_error(self, mock_post):
         """Test token retrieval with HTTP error"""
         # Arrange
@@ -47,7 +47,7 @@ class TestLoginService(unittest.TestCase):
         with self.assertRaises(requests.HTTPError):
             get_token("invalid_user", "invalid_pass")
 
-    @patch('services.login_service.requests.post')
+    @patch('services.login_service.http_client.post')
     def test_get_token_network_error(self, mock_post):
         """Test token retrieval with network error"""
         # Arrange
@@ -57,7 +57,7 @@ class TestLoginService(unittest.TestCase):
         with self.assertRaises(requests.ConnectionError):
             get_token("testuser", "testpass")
 
-    @patch('services.login_service.requests.post')
+    @patch('services.login_service.http_client.post')
     def test_get_token_invalid_response_format(self, mock_post):
         """Test token retrieval with invalid JSON response"""
         # Arrange
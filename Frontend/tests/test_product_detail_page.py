@@ -0,0 +1,204 @@
+import unittest
+from unittest.mock import patch, MagicMock
+import sys
+import os
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mock_models import MockProduct, MockReview, MockSeller
+
+# Mock streamlit and the page's rendering dependencies only while importing the page,
+# so other test modules still see the page as unavailable
+with patch.dict(sys.modules, {'streamlit': MagicMock(), 'streamlit_carousel': MagicMock()}):
+    import pages.product_detail as product_detail
+
+
+class TestProductPageData(unittest.TestCase):
+    """Test cases for the product page data loading"""
+
+    def setUp(self):
+        """Patch every backend call made by the page loader"""
+        self.product = MockProduct(id=1, seller_id=7)
+        self.seller = MockSeller(id=7)
+        self.reviews = [MockReview(id=3), MockReview(id=2)]
+        self.similar = [MockProduct(id=2), MockProduct(id=3)]
+        self.mocks = {}
+        for name, value in (("get_product_page", None),
+                            ("get_similar_products", self.similar),
+                            ("get_product_reviews_page", (self.reviews, 12)),
+                            ("get_seller_detail", self.seller)):
+            patcher = patch.object(product_detail, name, return_value=value)
+            self.mocks[name] = patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _embedded_page(self):
+        return {
+            "product": self.product,
+            "seller": self.seller,
+            "reviews": self.reviews,
+            "reviews_total": 12,
+            "similar_products": self.similar,
+        }
+
+    def test_product_not_found(self):
+        """Test that a missing product returns None without further calls"""
+        # Act
+        result = product_detail.load_product_page_data(99)
+
+        # Assert
+        self.assertIsNone(result)
+        self.mocks["get_product_page"].assert_called_once_with(99, product_detail.REVIEWS_PAGE_SIZE)
+        self.mocks["get_similar_products"].assert_not_called()
+        self.mocks["get_product_reviews_page"].assert_not_called()
+        self.mocks["get_seller_detail"].assert_not_called()
+
+    def test_fully_embedded_page_makes_one_call(self):
+        """Test that an embedded response needs no extra backend calls"""
+        # Arrange
+        self.mocks["get_product_page"].return_value = self._embedded_page()
+
+        # Act
+        result = product_detail.load_product_page_data(1)
+
+        # Assert
+        self.assertEqual(result, self._embedded_page())
+        self.mocks["get_similar_products"].assert_not_called()
+        self.mocks["get_product_reviews_page"].assert_not_called()
+        self.mocks["get_seller_detail"].assert_not_called()
+
+    def test_missing_parts_are_fetched_once(self):
+        """Test that each part the backend did not embed is fetched exactly once"""
+        fetchers = {
+            "similar_products": ("get_similar_products", (1,)),
+            "reviews": ("get_product_reviews_page", (1, 1, product_detail.REVIEWS_PAGE_SIZE)),
+            "seller": ("get_seller_detail", (7,)),
+        }
+        for missing, (fetcher, args) in fetchers.items():
+            with self.subTest(missing=missing):
+                # Arrange
+                for mock in self.mocks.values():
+                    mock.reset_mock()
+                page = self._embedded_page()
+                del page[missing]
+                if missing == "reviews":
+                    del page["reviews_total"]
+                self.mocks["get_product_page"].return_value = page
+
+                # Act
+                result = product_detail.load_product_page_data(1)
+
+                # Assert
+                self.assertEqual(result, self._embedded_page())
+                self.mocks[fetcher].assert_called_once_with(*args)
+                for other, _ in fetchers.values():
+                    if other != fetcher:
+                        self.mocks[other].assert_not_called()
+
+    def test_nothing_embedded_fetches_every_part(self):
+        """Test the fallback for a backend that embeds nothing"""
+        # Arrange
+        self.mocks["get_product_page"].return_value = {"product": self.product}
+
+        # Act
+        result = product_detail.load_product_page_data(1)
+
+        # Assert
+        self.assertEqual(result, self._embedded_page())
+        self.mocks["get_similar_products"].assert_called_once_with(1)
+        self.mocks["get_product_reviews_page"].assert_called_once()
+        self.mocks["get_seller_detail"].assert_called_once_with(7)
+
+
+class TestLoadPageImages(unittest.TestCase):
+    """Test cases for the page image loading"""
+
+    @patch.object(product_detail, "get_asset_registry")
+    @patch.object(product_detail, "get_no_image_html", return_value="<no-image>")
+    @patch.object(product_detail, "get_related_product_image_html", side_effect=lambda related: f"<img {related.id}>")
+    @patch.object(product_detail, "load_carousel_image", side_effect=lambda product_id, index, url: f"/cache/{index}/{url}")
+    def test_images_and_thumbnails_are_split(self, mock_process, mock_thumbnail, mock_no_image, mock_registry):
+        """Test that carousel images and thumbnails come back in order"""
+        # Arrange
+        product = MockProduct(images=["a.jpg", "b.jpg"])
+        similar = [MockProduct(id=2), MockProduct(id=3)]
+
+        # Act
+        image_paths, thumbnails = product_detail.load_page_images(product, similar)
+
+        # Assert
+        self.assertEqual(image_paths, ["/cache/0/a.jpg", "/cache/1/b.jpg"])
+        self.assertEqual(thumbnails, ["<img 2>", "<img 3>"])
+
+    @patch.object(product_detail, "run_with_deadline")
+    @patch.object(product_detail, "get_asset_registry")
+    @patch.object(product_detail, "get_no_image_html", return_value="<no-image>")
+    def test_placeholders_match_each_task(self, mock_no_image, mock_registry, mock_run):
+        """Test that images fall back to the no-image file and thumbnails to the no-image HTML"""
+        # Arrange
+        mock_registry.return_value.no_image_path.return_value = "/assets/no_image.png"
+        mock_run.side_effect = lambda tasks, placeholders: placeholders
+        product = MockProduct(images=["a.jpg"])
+
+        # Act
+        image_paths, thumbnails = product_detail.load_page_images(product, [MockProduct(id=2)])
+
+        # Assert
+        self.assertEqual(image_paths, ["/assets/no_image.png"])
+        self.assertEqual(thumbnails, ["<no-image>"])
+        self.assertEqual(len(mock_run.call_args[0][0]), 2)
+
+
+class TestNoImagePlaceholder(unittest.TestCase):
+    """Test cases for the related product placeholder"""
+
+    def test_placeholder_does_not_inline_the_asset(self):
+        """Test that the placeholder is plain HTML instead of the encoded no_image.png"""
+        html = product_detail.get_no_image_html()
+
+        self.assertNotIn("data:", html)
+        self.assertLess(len(html), 1024)
+
+
+class TestVariantImages(unittest.TestCase):
+    """Test cases for images resized by the backend"""
+
+    def setUp(self):
+        """Point the page at an image cache in a temporary directory"""
+        from services.image_cache import ImageCache
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        patcher = patch.object(product_detail, "get_image_cache", return_value=ImageCache(self.tmp.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch.object(product_detail, "get_product_image", return_value=b"jpeg")
+    def test_variant_fetched_once(self, mock_get_image):
+        """Test that a variant is downloaded from the backend once and then served from the cache"""
+        # Act
+        first = product_detail.load_variant_path(1, 2, "http://img/a.jpg", "carousel", product_detail.CAROUSEL_SIZE)
+        second = product_detail.load_variant_path(1, 2, "http://img/a.jpg", "carousel", product_detail.CAROUSEL_SIZE)
+
+        # Assert
+        self.assertEqual(first, second)
+        with open(first, "rb") as f:
+            self.assertEqual(f.read(), b"jpeg")
+        mock_get_image.assert_called_once_with(1, 2, "carousel")
+
+    @patch.object(product_detail, "get_asset_registry")
+    @patch.object(product_detail, "get_product_image", return_value=None)
+    def test_unavailable_variant_uses_placeholder(self, mock_get_image, mock_registry):
+        """Test that the carousel falls back to the no-image file when the backend has no variant"""
+        # Arrange
+        mock_registry.return_value.no_image_path.return_value = "/assets/no_image.png"
+
+        # Act
+        result = product_detail.load_carousel_image(1, 0, "http://img/a.jpg")
+
+        # Assert
+        self.assertEqual(result, "/assets/no_image.png")
+        self.assertIsNone(product_detail.load_thumbnail_data_uri(1, "http://img/a.jpg"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,14 +10,18 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 sys.modules['streamlit'] = MagicMock()
 
 # Import mock models instead of real ones
-from mock_models import MockProduct, create_mock_product
+from mock_models import MockProduct, MockReview, MockSeller, create_mock_product
 
 # Mock the models module
 sys.modules['models'] = MagicMock()
 sys.modules['models.product'] = MagicMock()
 sys.modules['models.product'].Product = MockProduct
+sys.modules['models.review'] = MagicMock()
+sys.modules['models.review'].Review = MockReview
+sys.modules['models.seller'] = MagicMock()
+sys.modules['models.seller'].Seller = MockSeller
 
-from services.product_service import get_product_detail, get_similar_products
+from services.product_service import get_product_detail, get_product_image, get_product_page, get_similar_products
 
 
 class TestProductService(unittest.TestCase):
@@ -31,11 +35,17 @@ class TestProductService(unittest.TestCase):
         self.mock_st.error = MagicMock()
         
         # Replace the streamlit import in the service module
+        # Each test starts with an empty response cache
+        from services import api_cache
+        api_cache.clear()
+
         import services.product_service
         services.product_service.st = self.mock_st
         
         # Replace Product import in the service module
         services.product_service.Product = MockProduct
+        services.product_service.Review = MockReview
+        services.product_service.Seller = MockSeller
 
     def _create_sample_product_data(self):
         """Helper method to create sample product data"""
@@ -55,7 +65,7 @@ class TestProductService(unittest.TestCase):
             "rating_info": None
         }
 
-    @patch('services.product_service.requests.get')
+    @patch('services.http_client.get')
     def test_get_product_detail_success(self, mock_get):
         """Test successful product detail retrieval"""
         # Arrange
@@ -74,11 +84,11 @@ class TestProductService(unittest.TestCase):
         self.assertEqual(result.title, "Test Product")
         self.assertEqual(result.price, 99.99)
         mock_get.assert_called_once_with(
-            "http://localhost:8000/products/1",
+            "/products/1",
             headers={}
         )
 
-    @patch('services.product_service.requests.get')
+    @patch('services.http_client.get')
     def test_get_product_detail_not_found(self, mock_get):
         """Test product detail retrieval when product not found"""
         # Arrange
@@ -92,7 +102,7 @@ class TestProductService(unittest.TestCase):
         # Assert
         self.assertIsNone(result)
 
-    @patch('services.product_service.requests.get')
+    @patch('services.http_client.get')
     def test_get_product_detail_no_token(self, mock_get):
         """Test product detail retrieval without token"""
         # Arrange
@@ -109,11 +119,11 @@ class TestProductService(unittest.TestCase):
         # Assert
         self.assertIsInstance(result, MockProduct)
         mock_get.assert_called_once_with(
-            "http://localhost:8000/products/1",
+            "/products/1",
             headers={}
         )
 
-    @patch('services.product_service.requests.get')
+    @patch('services.http_client.get')
     def test_get_product_detail_parse_error(self, mock_get):
         """Test product detail retrieval with JSON parse error"""
         # Arrange
@@ -129,7 +139,7 @@ class TestProductService(unittest.TestCase):
         self.assertIsNone(result)
         self.mock_st.error.assert_called_once()
 
-    @patch('services.product_service.requests.get')
+    @patch('services.http_client.get')
     def test_get_similar_products_success(self, mock_get):
         """Test successful similar products retrieval"""
         # Arrange
@@ -152,11 +162,11 @@ class TestProductService(unittest.TestCase):
         self.assertEqual(result[0].id, 1)
         self.assertEqual(result[1].id, 2)
         mock_get.assert_called_once_with(
-            "http://localhost:8000/products/1/similar",
+            "/products/1/similar",
             headers={}
         )
 
-    @patch('services.product_service.requests.get')
+    @patch('services.http_client.get')
     def test_get_similar_products_empty_list(self, mock_get):
         """Test similar products retrieval with empty response"""
         # Arrange
@@ -172,7 +182,7 @@ class TestProductService(unittest.TestCase):
         self.assertEqual(len(result), 0)
         self.assertIsInstance(result, list)
 
-    @patch('services.product_service.requests.get')
+    @patch('services.http_client.get')
     def test_get_similar_products_error(self, mock_get):
         """Test similar products retrieval with error response"""
         # Arrange
@@ -187,7 +197,7 @@ class TestProductService(unittest.TestCase):
         self.assertEqual(len(result), 0)
         self.assertIsInstance(result, list)
 
-    @patch('services.product_service.requests.get')
+    @patch('services.http_client.get')
     def test_get_similar_products_parse_error(self, mock_get):
         """Test similar products retrieval with parse error"""
         # Arrange
@@ -203,6 +213,95 @@ class TestProductService(unittest.TestCase):
         self.assertEqual(len(result), 0)
         self.mock_st.error.assert_called()
 
+    @patch('services.http_client.get')
+    def test_get_product_page_embedded(self, mock_get):
+        """Test that the whole page is resolved with a single request"""
+        # Arrange
+        page_data = self._create_sample_product_data()
+        page_data["seller"] = {"id": 1, "name": "Apple Store", "location": "CDMX",
+                               "email": "a@a.com", "phone": "1"}
+        page_data["review_page"] = {"items": [{"id": 7, "product_id": 1, "seller_id": 1, "buyer": "b",
+                                               "review": "ok", "rating": 5, "date": "2024-01-07"}],
+                                    "total": 12, "page": 1, "page_size": 5}
+        page_data["similar"] = [dict(self._create_sample_product_data(), id=2)]
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = page_data
+        mock_get.return_value = mock_response
+
+        # Act
+        result = get_product_page("1")
+
+        # Assert
+        self.assertEqual(result["product"].id, 1)
+        self.assertEqual(result["seller"].name, "Apple Store")
+        self.assertEqual([r.id for r in result["reviews"]], [7])
+        self.assertEqual(result["reviews_total"], 12)
+        self.assertEqual([p.id for p in result["similar_products"]], [2])
+        mock_get.assert_called_once_with(
+            "/products/1?include=seller,reviews,similar&reviews_page_size=5",
+            headers={}
+        )
+
+    @patch('services.http_client.get')
+    def test_get_product_page_without_embedding(self, mock_get):
+        """Test that parts the backend did not embed are left out"""
+        # Arrange
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = self._create_sample_product_data()
+        mock_get.return_value = mock_response
+
+        # Act
+        result = get_product_page("1")
+
+        # Assert
+        self.assertEqual(list(result), ["product"])
+
+    @patch('services.http_client.get')
+    def test_get_product_page_not_found(self, mock_get):
+        """Test product page retrieval when product not found"""
+        # Arrange
+        mock_response = MagicMock()
+        mock_response.status_code = 404
+        mock_get.return_value = mock_response
+
+        # Act
+        result = get_product_page("999")
+
+        # Assert
+        self.assertIsNone(result)
+
+    @patch('services.http_client.get')
+    def test_get_product_image_success(self, mock_get):
+        """Test that an image variant is returned as raw bytes"""
+        # Arrange
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b"\xff\xd8jpeg"
+        mock_get.return_value = mock_response
+
+        # Act
+        result = get_product_image("1", 0, "thumb")
+
+        # Assert
+        self.assertEqual(result, b"\xff\xd8jpeg")
+        mock_get.assert_called_once_with("/products/1/images/0/thumb", headers={})
+
+    @patch('services.http_client.get')
+    def test_get_product_image_unavailable(self, mock_get):
+        """Test that a variant the backend cannot serve returns None"""
+        # Arrange
+        mock_response = MagicMock()
+        mock_response.status_code = 503
+        mock_get.return_value = mock_response
+
+        # Act
+        result = get_product_image("1", 0, "carousel")
+
+        # Assert
+        self.assertIsNone(result)
+
 
 if __name__ == '__main__':
     unittest.main()
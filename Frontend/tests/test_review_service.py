@@ -17,7 +17,7 @@ sys.modules['models'] = MagicMock()
 sys.modules['models.review'] = MagicMock()
 sys.modules['models.review'].Review = MockReview
 
-from services.review_service import get_product_reviews
+from services.review_service import get_product_reviews, get_product_reviews_page
 
 
 class TestReviewService(unittest.TestCase):
@@ -31,6 +31,10 @@ class TestReviewService(unittest.TestCase):
         self.mock_st.error = MagicMock()
         
         # Replace the streamlit import in the service module
+        # Each test starts with an empty response cache
+        from services import api_cache
+        api_cache.clear()
+
         import services.review_service
         services.review_service.st = self.mock_st
         
@@ -48,7 +52,7 @@ class TestReviewService(unittest.TestCase):
             "date": "2024-01-01"
         }
 
-    @patch('services.review_service.requests.get')
+    @patch('services.http_client.get')
     def test_get_product_reviews_success(self, mock_get):
         """Test successful product reviews retrieval"""
         # Arrange
@@ -72,11 +76,68 @@ class TestReviewService(unittest.TestCase):
         self.assertEqual(result[1].id, 2)
         self.assertEqual(result[0].buyer, "Test Buyer")
         mock_get.assert_called_once_with(
-            "http://localhost:8000/reviews/product/1",
+            "/reviews/product/1",
             headers={}
         )
 
-    @patch('services.review_service.requests.get')
+    @patch('services.http_client.get')
+    def test_get_product_reviews_page_envelope(self, mock_get):
+        """Test product reviews retrieval from a paginated response"""
+        # Arrange
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "items": [self._create_sample_review_data(1), self._create_sample_review_data(2)],
+            "total": 2, "page": 1, "page_size": 20, "pages": 1
+        }
+        mock_get.return_value = mock_response
+
+        # Act
+        result = get_product_reviews(1)
+
+        # Assert
+        self.assertEqual([r.id for r in result], [1, 2])
+        self.assertIsInstance(result[0], MockReview)
+
+    @patch('services.http_client.get')
+    def test_get_product_reviews_page(self, mock_get):
+        """Test retrieval of a single page of reviews with the total count"""
+        # Arrange
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "items": [self._create_sample_review_data(6)],
+            "total": 6, "page": 2, "page_size": 5, "pages": 2
+        }
+        mock_get.return_value = mock_response
+
+        # Act
+        reviews, total = get_product_reviews_page(1, page=2, page_size=5)
+
+        # Assert
+        self.assertEqual([r.id for r in reviews], [6])
+        self.assertEqual(total, 6)
+        mock_get.assert_called_once_with(
+            "/reviews/product/1?page=2&page_size=5",
+            headers={}
+        )
+
+    @patch('services.http_client.get')
+    def test_get_product_reviews_page_error_response(self, mock_get):
+        """Test that a failed page request yields no reviews"""
+        # Arrange
+        mock_response = MagicMock()
+        mock_response.status_code = 404
+        mock_get.return_value = mock_response
+
+        # Act
+        reviews, total = get_product_reviews_page(99)
+
+        # Assert
+        self.assertEqual(reviews, [])
+        self.assertEqual(total, 0)
+
+    @patch('services.http_client.get')
     def test_get_product_reviews_empty_list(self, mock_get):
         """Test product reviews retrieval with empty response"""
         # Arrange
@@ -92,7 +153,7 @@ class TestReviewService(unittest.TestCase):
         self.assertEqual(len(result), 0)
         self.assertIsInstance(result, list)
 
-    @patch('services.review_service.requests.get')
+    @patch('services.http_client.get')
     def test_get_product_reviews_no_token(self, mock_get):
         """Test product reviews retrieval without token"""
         # Arrange
@@ -109,11 +170,11 @@ class TestReviewService(unittest.TestCase):
         # Assert
         self.assertEqual(len(result), 1)
         mock_get.assert_called_once_with(
-            "http://localhost:8000/reviews/product/1",
+            "/reviews/product/1",
             headers={}
         )
 
-    @patch('services.review_service.requests.get')
+    @patch('services.http_client.get')
     def test_get_product_reviews_error_response(self, mock_get):
         """Test product reviews retrieval with error response"""
         # Arrange
@@ -128,7 +189,7 @@ class TestReviewService(unittest.TestCase):
         self.assertEqual(len(result), 0)
         self.assertIsInstance(result, list)
 
-    @patch('services.review_service.requests.get')
+    @patch('services.http_client.get')
     def test_get_product_reviews_parse_error(self, mock_get):
         """Test product reviews retrieval with JSON parse error"""
         # Arrange
@@ -144,7 +205,7 @@ class TestReviewService(unittest.TestCase):
         self.assertEqual(len(result), 0)
         self.mock_st.error.assert_called_once()
 
-    @patch('services.review_service.requests.get')
+    @patch('services.http_client.get')
     def test_get_product_reviews_network_error(self, mock_get):
         """Test product reviews retrieval with network error"""
         # Arrange
@@ -31,6 +31,10 @@ class TestSellerService(unittest.TestCase):
         self.mock_st.error = MagicMock()
         
         # Replace the streamlit import in the service module
+        # Each test starts with an empty response cache
+        from services import api_cache
+        api_cache.clear()
+
         import services.seller_service
         services.seller_service.st = self.mock_st
         
@@ -49,7 +53,7 @@ class TestSellerService(unittest.TestCase):
             }
         }
 
-    @patch('services.seller_service.requests.get')
+    @patch('services.http_client.get')
     def test_get_seller_detail_success(self, mock_get):
         """Test successful seller detail retrieval"""
         # Arrange
@@ -68,11 +72,11 @@ class TestSellerService(unittest.TestCase):
         self.assertEqual(result.name, "Test Seller")
         self.assertEqual(result.location, "Test City")
         mock_get.assert_called_once_with(
-            "http://localhost:8000/sellers/1",
+            "/sellers/1",
             headers={}
         )
 
-    @patch('services.seller_service.requests.get')
+    @patch('services.http_client.get')
     def test_get_seller_detail_not_found(self, mock_get):
         """Test seller detail retrieval when seller not found"""
         # Arrange
@@ -86,7 +90,7 @@ class TestSellerService(unittest.TestCase):
         # Assert
         self.assertIsNone(result)
 
-    @patch('services.seller_service.requests.get')
+    @patch('services.http_client.get')
     def test_get_seller_detail_no_token(self, mock_get):
         """Test seller detail retrieval without token"""
         # Arrange
@@ -103,11 +107,11 @@ class TestSellerService(unittest.TestCase):
         # Assert
         self.assertIsInstance(result, MockSeller)
         mock_get.assert_called_once_with(
-            "http://localhost:8000/sellers/1",
+            "/sellers/1",
             headers={}
         )
 
-    @patch('services.seller_service.requests.get')
+    @patch('services.http_client.get')
     def test_get_seller_detail_parse_error(self, mock_get):
         """Test seller detail retrieval with JSON parse error"""
         # Arrange
@@ -123,7 +127,7 @@ class TestSellerService(unittest.TestCase):
         self.assertIsNone(result)
         self.mock_st.error.assert_called_once()
 
-    @patch('services.seller_service.requests.get')
+    @patch('services.http_client.get')
     def test_get_seller_detail_server_error(self, mock_get):
         """Test seller detail retrieval with server error"""
         # Arrange
@@ -137,7 +141,7 @@ class TestSellerService(unittest.TestCase):
         # Assert
         self.assertIsNone(result)
 
-    @patch('services.seller_service.requests.get')
+    @patch('services.http_client.get')
     def test_get_seller_detail_network_error(self, mock_get):
         """Test seller detail retrieval with network error"""
         # Arrange
@@ -147,7 +151,7 @@ class TestSellerService(unittest.TestCase):
         with self.assertRaises(requests.ConnectionError):
             get_seller_detail(1)
 
-    @patch('services.seller_service.requests.get')
+    @patch('services.http_client.get')
     def test_get_seller_detail_timeout_error(self, mock_get):
         """Test seller detail retrieval with timeout error"""
         # Arrange